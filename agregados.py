@@ -0,0 +1,204 @@
+import os
+import threading
+
+import joblib
+import numpy as np
+import pandas as pd
+from matplotlib.colors import LogNorm
+
+from dados import CAMINHO_DADOS, carregar_periodo, mes, versao_dados
+from features import BINS_IDADE, ROTULOS_IDADE, faixas
+
+# Diretório onde os agregados ficam gravados, um arquivo por versão dos dados
+DIRETORIO_AGREGADOS = os.path.join('cache', 'agregados')
+# Entra no nome do arquivo: muda quando o conteúdo dos agregados muda
+VERSAO_FORMATO = 2
+
+# Colunas usadas para agrupar a renda nos boxplots
+GRUPOS_BOXPLOT = ('posse_de_veiculo', 'estado_civil', 'sexo')
+
+# Máximo de pontos fora dos bigodes guardados por grupo (amostrados uniformemente)
+MAX_OUTLIERS = 100
+
+# Variáveis cruzadas com a renda nos gráficos de dispersão
+COLUNAS_DISPERSAO = ('idade', 'tempo_emprego')
+# Acima deste número de linhas os gráficos de dispersão deixam de desenhar cada ponto
+# e usam o histograma 2D ou uma amostra estratificada deste tamanho
+LIMITE_PONTOS_DISPERSAO = 20_000
+# Resolução (em cada eixo) da grade do histograma 2D e dos estratos da amostra
+BINS_DISPERSAO = 60
+MODOS_DISPERSAO = ('densidade', 'amostra')
+
+_cache = {}
+_trava = threading.Lock()
+
+
+def estatisticas_boxplot(grupos, valores, max_outliers=MAX_OUTLIERS):
+    """
+    Estatísticas de boxplot (mesma regra do matplotlib/seaborn: bigodes até 1.5 IQR)
+    da variável `valores` para cada grupo, no formato aceito por `Axes.bxp`.
+    """
+    df = pd.DataFrame({'grupo': grupos, 'valor': valores}).dropna()
+    agrupado = df.groupby('grupo', observed=True)['valor']
+    quartis = agrupado.quantile([0.25, 0.5, 0.75]).unstack()
+    quartis.columns = ['q1', 'med', 'q3']
+    iqr = quartis['q3'] - quartis['q1']
+    limites = pd.DataFrame({'inferior': quartis['q1'] - 1.5 * iqr, 'superior': quartis['q3'] + 1.5 * iqr})
+
+    inferior = df['grupo'].map(limites['inferior']).to_numpy(dtype=np.float64)
+    superior = df['grupo'].map(limites['superior']).to_numpy(dtype=np.float64)
+    valor = df['valor'].to_numpy(dtype=np.float64)
+    dentro = (valor >= inferior) & (valor <= superior)
+    bigodes = df[dentro].groupby('grupo', observed=True)['valor'].agg(['min', 'max'])
+    medias = agrupado.mean()
+    tamanhos = agrupado.size()
+    # Outliers ordenados por (grupo, valor) uma única vez; cada grupo é uma fatia contígua
+    fora = df[~dentro].sort_values(['grupo', 'valor'])
+    valores_fora = fora['valor'].to_numpy()
+    posicoes_fora = fora.groupby('grupo', observed=True, sort=False).indices
+
+    estatisticas = []
+    for grupo in quartis.index:
+        outliers = valores_fora[posicoes_fora.get(grupo, [])]
+        if len(outliers) > max_outliers:
+            outliers = outliers[np.linspace(0, len(outliers) - 1, max_outliers).astype(int)]
+        estatisticas.append({
+            'label': str(grupo),
+            'q1': quartis.at[grupo, 'q1'],
+            'med': quartis.at[grupo, 'med'],
+            'q3': quartis.at[grupo, 'q3'],
+            'whislo': bigodes.at[grupo, 'min'],
+            'whishi': bigodes.at[grupo, 'max'],
+            'fliers': outliers,
+            'mean': medias[grupo],
+            'n': int(tamanhos[grupo]),
+        })
+    return estatisticas
+
+
+def _indice_bin(valores, minimo, maximo, bins):
+    largura = (maximo - minimo) / bins if maximo > minimo else 1.0
+    return np.clip(((valores - minimo) / largura).astype(np.int64), 0, bins - 1)
+
+
+def resumo_dispersao(x, y, limite_pontos=LIMITE_PONTOS_DISPERSAO, bins=BINS_DISPERSAO, semente=0):
+    """
+    Resumo de tamanho fixo do par (x, y) para os gráficos de dispersão: as contagens
+    de uma grade `bins` x `bins` (histograma 2D) e uma amostra de até `limite_pontos`
+    pontos estratificada pelas células da grade, com alocação proporcional e ao
+    menos um ponto por célula ocupada (as regiões raras continuam visíveis).
+    Tudo em O(n) com NumPy vetorizado; o desenho depois não depende de n.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    validos = np.isfinite(x) & np.isfinite(y)
+    x, y = x[validos], y[validos]
+    linhas = len(x)
+    limites_x = (float(x.min()), float(x.max())) if linhas else (0.0, 1.0)
+    limites_y = (float(y.min()), float(y.max())) if linhas else (0.0, 1.0)
+
+    celula = _indice_bin(x, *limites_x, bins) * bins + _indice_bin(y, *limites_y, bins)
+    contagens = np.bincount(celula, minlength=bins * bins)
+
+    if linhas <= limite_pontos:
+        escolhidos = np.arange(linhas)
+    else:
+        # Cota por célula; dentro de cada célula ficam os pontos de menor prioridade aleatória.
+        # Um sorteio com folga (cota + 4 desvios) reduz os candidatos antes da ordenação,
+        # que assim só ordena da ordem de `limite_pontos` linhas em vez de n
+        cotas = np.maximum(np.rint(contagens * (limite_pontos / linhas)), contagens > 0).astype(np.int64)
+        taxa = np.minimum(1.0, (cotas + 4 * np.sqrt(cotas) + 4) / np.maximum(contagens, 1))
+        prioridade = np.random.default_rng(semente).random(linhas)
+        candidatos = np.flatnonzero(prioridade < taxa[celula])
+        celula_candidato = celula[candidatos]
+        ordem = np.lexsort((prioridade[candidatos], celula_candidato))
+        por_celula = np.bincount(celula_candidato, minlength=bins * bins)
+        inicio_celula = np.concatenate(([0], np.cumsum(por_celula)[:-1]))
+        posicao = np.arange(len(ordem)) - inicio_celula[celula_candidato[ordem]]
+        escolhidos = np.sort(candidatos[ordem[posicao < cotas[celula_candidato[ordem]]]])
+
+    return {
+        'linhas': linhas,
+        'contagens': contagens.reshape(bins, bins),
+        'bordas_x': np.linspace(*limites_x, bins + 1),
+        'bordas_y': np.linspace(*limites_y, bins + 1),
+        'amostra_x': x[escolhidos],
+        'amostra_y': y[escolhidos],
+    }
+
+
+def calcular_agregados(df):
+    """Calcula de uma vez todas as tabelas resumidas usadas pelas seções de gráficos."""
+    faixa_etaria = faixas(df['idade'].to_numpy(dtype=np.float64), BINS_IDADE, ROTULOS_IDADE)
+    return {
+        'linhas': len(df),
+        'correlacao': df.select_dtypes(include='number').corr(),
+        'media_renda_estado_civil': df.groupby('estado_civil', observed=True)['renda'].mean(),
+        'contagem_faixa_etaria': pd.Series(faixa_etaria).value_counts().sort_index(),
+        'valores_unicos': {coluna: df[coluna].unique().tolist() for coluna in GRUPOS_BOXPLOT},
+        'boxplot_renda': {coluna: estatisticas_boxplot(df[coluna], df['renda']) for coluna in GRUPOS_BOXPLOT},
+        'dispersao_renda': {coluna: resumo_dispersao(df[coluna], df['renda']) for coluna in COLUNAS_DISPERSAO},
+    }
+
+
+def chave_periodo(inicio=None, fim=None):
+    """Identificador do intervalo de meses ('' para o arquivo inteiro), usado nas chaves de cache."""
+    if inicio is None and fim is None:
+        return ''
+    return f"{'' if inicio is None else mes(inicio)}_{'' if fim is None else mes(fim)}"
+
+
+def carregar_agregados(caminho_dados=CAMINHO_DADOS, diretorio=DIRETORIO_AGREGADOS, inicio=None, fim=None):
+    """
+    Retorna os agregados da versão atual dos dados: da memória, do disco
+    (`diretorio/<hash>[-<período>]-v<formato>.joblib`) ou calculados a partir do
+    frame carregado. Com `inicio`/`fim`, só os meses de `data_ref` do intervalo
+    entram no cálculo (selecionados pelo índice temporal do arquivo).
+    """
+    periodo = chave_periodo(inicio, fim)
+    versao = f"{versao_dados(caminho_dados)}-{periodo}" if periodo else versao_dados(caminho_dados)
+    with _trava:
+        if versao in _cache:
+            return _cache[versao]
+        arquivo = os.path.join(diretorio, f"{versao}-v{VERSAO_FORMATO}.joblib")
+        if os.path.exists(arquivo):
+            agregados = joblib.load(arquivo)
+        else:
+            agregados = calcular_agregados(carregar_periodo(caminho_dados, inicio, fim))
+            os.makedirs(diretorio, exist_ok=True)
+            temporario = f"{arquivo}.tmp"
+            joblib.dump(agregados, temporario)
+            os.replace(temporario, arquivo)
+        _cache[versao] = agregados
+        return agregados
+
+
+def desenhar_boxplot(ax, estatisticas):
+    """Desenha um boxplot a partir das estatísticas pré-calculadas (custo proporcional ao número de grupos)."""
+    ax.bxp(estatisticas, showfliers=True, patch_artist=True,
+           boxprops={'facecolor': '#4c72b0', 'alpha': 0.8}, medianprops={'color': 'black'})
+
+
+def modo_dispersao(resumo, modo_grande='densidade', limite_pontos=LIMITE_PONTOS_DISPERSAO):
+    """'pontos' enquanto os dados cabem no limite; acima dele, o `modo_grande` escolhido."""
+    if resumo['linhas'] <= limite_pontos:
+        return 'pontos'
+    if modo_grande not in MODOS_DISPERSAO:
+        raise ValueError(f"modo_grande deve ser um de {MODOS_DISPERSAO}, recebido {modo_grande!r}")
+    return modo_grande
+
+
+def desenhar_dispersao(ax, resumo, modo='pontos'):
+    """
+    Desenha o resumo de `resumo_dispersao`: todos os pontos, a amostra estratificada
+    (com transparência) ou o histograma 2D com escala logarítmica de cores.
+    """
+    if modo == 'densidade':
+        contagens = np.ma.masked_equal(resumo['contagens'].T, 0)
+        malha = ax.pcolormesh(resumo['bordas_x'], resumo['bordas_y'], contagens,
+                              norm=LogNorm(vmin=1, vmax=max(int(contagens.max() or 1), 1)), cmap='viridis')
+        ax.figure.colorbar(malha, ax=ax, label='Clientes')
+    elif modo == 'amostra':
+        ax.scatter(resumo['amostra_x'], resumo['amostra_y'], s=8, alpha=0.3, color='#4c72b0', edgecolors='none')
+    else:
+        ax.scatter(resumo['amostra_x'], resumo['amostra_y'], s=20, color='#4c72b0', edgecolors='white', linewidths=0.5)
@@ -0,0 +1,99 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.metrics import mean_squared_error, r2_score
+
+from dados import CAMINHO_DADOS, carregar_dados, indice_temporal, mes
+from modelo import ALVO, COLUNAS_TREINO, novo_transformador, preparar_features
+from orquestrador import matrizes_compartilhadas
+
+
+def _frame(brutos):
+    return pd.DataFrame(np.asarray(brutos), columns=COLUNAS_TREINO)
+
+
+def _avaliar_origem(estimador, brutos, limites, origem, janela):
+    # Meses em ordem: o treino é um bloco contíguo de linhas e o teste, o bloco seguinte
+    inicio_treino = limites[0 if janela is None else max(origem + 1 - janela, 0)]
+    treino = _frame(brutos[inicio_treino:limites[origem + 1]])
+    teste = _frame(brutos[limites[origem + 1]:limites[origem + 2]])
+
+    inicio = time.perf_counter()
+    transformador = novo_transformador().fit(treino)
+    modelo = clone(estimador).fit(preparar_features(treino, transformador), treino[ALVO])
+    previsto = modelo.predict(preparar_features(teste, transformador))
+    return {
+        'origem': origem,
+        'linhas_treino': len(treino),
+        'linhas_teste': len(teste),
+        'mse': float(mean_squared_error(teste[ALVO], previsto)),
+        'r2': float(r2_score(teste[ALVO], previsto)),
+        'tempo_s': time.perf_counter() - inicio,
+    }
+
+
+def backtest(caminho_dados=CAMINHO_DADOS, estimador=None, inicio=None, fim=None, meses_minimos=1, janela=None,
+             n_processos=-1):
+    """
+    Backtest com origem móvel sobre os meses de `data_ref` entre `inicio` e `fim`:
+    para cada mês t (a partir do `meses_minimos`-ésimo), treina com os meses <= t
+    (ou só os últimos `janela` meses) e testa no mês t + 1.
+
+    O arquivo é ordenado uma única vez pelo índice temporal, então cada mês é um
+    bloco contíguo de linhas e cada passo só fatia o bloco, sem refiltrar o frame.
+    As origens rodam em paralelo em processos que leem os mesmos dados da memória
+    compartilhada. Devolve uma linha por origem.
+    """
+    estimador = LinearRegression() if estimador is None else estimador
+    indice = indice_temporal(caminho_dados)
+    meses = indice.meses
+    primeiro = 0 if inicio is None else int(np.searchsorted(meses, mes(inicio), side='left'))
+    ultimo = len(meses) if fim is None else int(np.searchsorted(meses, mes(fim), side='right'))
+    if ultimo - primeiro < meses_minimos + 1:
+        raise ValueError(f"o intervalo tem {max(ultimo - primeiro, 0)} meses; são necessários ao menos "
+                         f"{meses_minimos + 1} (meses_minimos={meses_minimos} + 1 de teste)")
+
+    de, ate = indice.limites[primeiro], indice.limites[ultimo]
+    ordenado = indice.ordenar(carregar_dados(caminho_dados, colunas=COLUNAS_TREINO))
+    brutos = ordenado.iloc[de:ate].to_numpy(dtype=np.float64)
+    limites = indice.limites[primeiro:ultimo + 1] - de
+
+    with matrizes_compartilhadas(brutos=brutos) as compartilhadas:
+        linhas = Parallel(n_jobs=n_processos, backend='loky', batch_size=1)(
+            delayed(_avaliar_origem)(estimador, compartilhadas['brutos'], limites, origem, janela)
+            for origem in range(meses_minimos - 1, len(limites) - 2)
+        )
+    resultado = pd.DataFrame(linhas)
+    meses_intervalo = meses[primeiro:ultimo]
+    resultado.insert(0, 'ultimo_mes_treino', meses_intervalo[resultado['origem']].astype(str))
+    resultado.insert(1, 'mes_teste', meses_intervalo[resultado['origem'] + 1].astype(str))
+    return resultado.drop(columns='origem')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backtest com origem móvel por mês de data_ref.")
+    parser.add_argument('--dados', default=CAMINHO_DADOS, help="CSV de entrada")
+    parser.add_argument('--inicio', help="primeiro mês (AAAA-MM)")
+    parser.add_argument('--fim', help="último mês (AAAA-MM)")
+    parser.add_argument('--meses-minimos', type=int, default=1, help="meses de treino da primeira origem")
+    parser.add_argument('--janela', type=int, help="treina só nos últimos N meses (padrão: todos até a origem)")
+    parser.add_argument('--alpha', type=float, default=0.0, help="0 para OLS; > 0 para Ridge")
+    parser.add_argument('--processos', type=int, default=-1, help="processos do pool (-1: todos os núcleos)")
+    args = parser.parse_args(argv)
+
+    estimador = LinearRegression() if args.alpha == 0 else Ridge(alpha=args.alpha)
+    inicio = time.perf_counter()
+    resultado = backtest(args.dados, estimador, args.inicio, args.fim, args.meses_minimos, args.janela,
+                         args.processos)
+    print(resultado.to_string(index=False))
+    print(f"{len(resultado)} origens em {time.perf_counter() - inicio:.2f}s; "
+          f"MSE médio {resultado['mse'].mean():.2f}, R² médio {resultado['r2'].mean():.4f}")
+
+
+if __name__ == '__main__':
+    main()
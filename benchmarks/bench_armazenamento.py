@@ -0,0 +1,77 @@
+"""
+Compara tempo de leitura e memória do pd.read_csv original com o CSV tipado e
+com o Parquet (completo e com projeção de colunas), em cópias do dataset
+ampliadas 1x, 10x e 100x.
+
+    python benchmarks/bench_armazenamento.py --dados previsao_de_renda.csv --fatores 1 10 100
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from dados import CAMINHO_DADOS, converter_para_parquet, ler_csv, ler_parquet  # noqa: E402
+
+# Colunas de uma seção típica (boxplot de renda por posse de veículo)
+COLUNAS_PROJECAO = ['renda', 'posse_de_veiculo']
+
+
+def ampliar_csv(origem, destino, fator):
+    """Grava `fator` cópias das linhas do CSV em `destino`, sem carregar tudo em memória."""
+    with open(origem, 'rb') as entrada:
+        cabecalho = entrada.readline()
+        corpo = entrada.read()
+    if not corpo.endswith(b'\n'):
+        corpo += b'\n'
+    with open(destino, 'wb') as saida:
+        saida.write(cabecalho)
+        for _ in range(fator):
+            saida.write(corpo)
+
+
+def medir(nome, funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        df = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    memoria = df.memory_usage(deep=True).sum() / 1024 ** 2
+    print(f"    {nome:<28} {min(tempos):8.3f}s {memoria:10.1f} MB")
+    del df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--dados', default=CAMINHO_DADOS)
+    parser.add_argument('--fatores', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    diretorio = tempfile.mkdtemp(prefix='bench_armazenamento_')
+    try:
+        for fator in args.fatores:
+            csv = os.path.join(diretorio, f'renda_{fator}x.csv')
+            ampliar_csv(args.dados, csv, fator)
+            parquet = converter_para_parquet(csv)
+            print(f"{fator}x: CSV {os.path.getsize(csv) / 1024 ** 2:.1f} MB, "
+                  f"Parquet {os.path.getsize(parquet) / 1024 ** 2:.1f} MB")
+            print(f"    {'leitura':<28} {'tempo':>9} {'memória':>13}")
+            medir('pd.read_csv', lambda: pd.read_csv(csv), args.repeticoes)
+            medir('CSV tipado (ler_csv)', lambda: ler_csv(csv), args.repeticoes)
+            medir('Parquet completo', lambda: ler_parquet(parquet), args.repeticoes)
+            medir(f'Parquet ({len(COLUNAS_PROJECAO)} colunas)', lambda: ler_parquet(parquet, COLUNAS_PROJECAO),
+                  args.repeticoes)
+            os.remove(csv)
+            os.remove(parquet)
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
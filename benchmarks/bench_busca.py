@@ -0,0 +1,75 @@
+"""
+Compara o tempo da busca de alpha original (GridSearchCV sequencial) com a
+busca por caminho de regularização em paralelo, sem cache e com cache, e o
+`grid_ridge.fit` na grade densa de alphas com a SVD por fold e o LOO/GCV analítico.
+
+    python benchmarks/bench_busca.py --dados previsao_de_renda.csv --repeticoes 3
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from sklearn.linear_model import Lasso, Ridge  # noqa: E402
+from sklearn.model_selection import GridSearchCV  # noqa: E402
+
+from busca import GRADE_ALPHA_DENSA, buscar_alpha  # noqa: E402
+from dados import CAMINHO_DADOS, carregar_dados  # noqa: E402
+from modelo import GRADE_ALPHA, novo_transformador, preparar_features  # noqa: E402
+
+
+def cronometrar(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--dados', default=CAMINHO_DADOS)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--alphas-densos', type=int, default=len(GRADE_ALPHA_DENSA),
+                        help="tamanho da grade densa do Ridge (logspace de 1e-3 a 1e4)")
+    args = parser.parse_args(argv)
+
+    df = carregar_dados(args.dados)
+    X = preparar_features(df, novo_transformador().fit(df))
+    y = df['renda']
+
+    with tempfile.TemporaryDirectory() as diretorio_cache:
+        for tipo, estimador in (('ridge', Ridge), ('lasso', Lasso)):
+            grade = cronometrar(
+                lambda: GridSearchCV(estimador(), {'alpha': GRADE_ALPHA}, cv=5,
+                                     scoring='neg_mean_squared_error').fit(X, y),
+                args.repeticoes,
+            )
+            caminho = cronometrar(lambda: buscar_alpha(X, y, tipo, GRADE_ALPHA, diretorio_cache=None),
+                                  args.repeticoes)
+            buscar_alpha(X, y, tipo, GRADE_ALPHA, diretorio_cache=diretorio_cache)
+            com_cache = cronometrar(lambda: buscar_alpha(X, y, tipo, GRADE_ALPHA, diretorio_cache=diretorio_cache),
+                                    args.repeticoes)
+            print(f"{tipo:>5} ({len(X)} linhas): GridSearchCV {grade:.3f}s | caminho {caminho:.3f}s "
+                  f"({grade / caminho:.1f}x) | com cache {com_cache:.3f}s ({grade / com_cache:.1f}x)")
+
+    densa = list(np.logspace(-3, 4, args.alphas_densos))
+    grid_ridge = GridSearchCV(Ridge(), {'alpha': densa}, cv=5, scoring='neg_mean_squared_error')
+    grade = cronometrar(lambda: grid_ridge.fit(X, y), 1)
+    print(f"ridge, {len(densa)} alphas: grid_ridge.fit {grade:.3f}s, "
+          f"melhor alpha {grid_ridge.best_params_['alpha']:.4g}")
+    for criterio in ('cv', 'loo', 'gcv'):
+        resultado = buscar_alpha(X, y, 'ridge', densa, diretorio_cache=None, criterio=criterio)
+        tempo = cronometrar(lambda: buscar_alpha(X, y, 'ridge', densa, diretorio_cache=None, criterio=criterio),
+                            args.repeticoes)
+        print(f"  {criterio:>3}: {tempo:.3f}s ({grade / tempo:.0f}x), "
+              f"melhor alpha {resultado.best_params_['alpha']:.4g}, MSE {-resultado.best_score_:,.0f}")
+
+
+if __name__ == '__main__':
+    main()
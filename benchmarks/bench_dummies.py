@@ -0,0 +1,67 @@
+"""
+Compara o `pd.get_dummies` da seção de dummies com o `CodificadorDummies`
+(vocabulário fixo, saída CSR ou uint8 densa): tempo, pico de memória, tamanho da
+saída e o ajuste de um Ridge direto sobre cada saída, em dados sintéticos.
+
+    python benchmarks/bench_dummies.py --linhas 1000000 5000000
+"""
+import argparse
+import gc
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from sklearn.linear_model import Ridge  # noqa: E402
+
+from features import COLUNAS_DUMMIES, CodificadorDummies  # noqa: E402
+from sintetico import bloco_sintetico  # noqa: E402
+from suite import medir  # noqa: E402
+
+
+def tamanho_mb(saida):
+    if isinstance(saida, pd.DataFrame):
+        return saida.memory_usage(deep=True).sum() / 2 ** 20
+    if isinstance(saida, np.ndarray):
+        return saida.nbytes / 2 ** 20
+    return (saida.data.nbytes + saida.indices.nbytes + saida.indptr.nbytes) / 2 ** 20
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--linhas', type=int, nargs='+', default=[1_000_000])
+    args = parser.parse_args(argv)
+
+    colunas = list(COLUNAS_DUMMIES)
+    for linhas in args.linhas:
+        df = bloco_sintetico(linhas, np.random.default_rng(0))[colunas + ['renda']]
+        y = df['renda']
+        print(f"{linhas} linhas")
+        resultados = []
+        gd = medir(resultados, linhas, 'get_dummies',
+                   lambda: pd.get_dummies(df[colunas], columns=colunas, drop_first=True))
+        # O vocabulário é aprendido uma vez (no treino); cada lote pontuado só paga o transform
+        esparso = medir(resultados, linhas, 'codificador_fit', lambda: CodificadorDummies().fit(df))
+        denso = CodificadorDummies(esparso=False).fit(df)
+        saidas = {
+            'get_dummies': gd,
+            'codificador_esparso': medir(resultados, linhas, 'transform_esparso', lambda: esparso.transform(df)),
+            'codificador_denso': medir(resultados, linhas, 'transform_denso', lambda: denso.transform(df)),
+        }
+        referencia = saidas['get_dummies'].to_numpy(dtype=np.uint8)
+        iguais = [np.array_equal(saidas['codificador_esparso'].toarray(), referencia),
+                  np.array_equal(saidas['codificador_denso'], referencia),
+                  list(gd.columns) == list(esparso.get_feature_names_out())]
+        print(f"  mesmas colunas e valores do get_dummies: {all(iguais)}")
+        for nome, saida in saidas.items():
+            print(f"  {nome:<20} saída {tamanho_mb(saida):8.1f} MB")
+        for nome, saida in saidas.items():
+            medir(resultados, linhas, f'ridge_{nome}', lambda: Ridge(alpha=1.0).fit(saida, y))
+        del gd, saidas, referencia
+        gc.collect()
+
+
+if __name__ == '__main__':
+    main()
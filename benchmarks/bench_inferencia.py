@@ -0,0 +1,112 @@
+"""
+Compara a vazão de predição do `modelo.predict` do sklearn (com DataFrame) com o
+caminho NumPy do ModeloLinearCompacto, com o motor de micro-lotes e com o cache
+de previsões em entradas repetidas.
+
+    python benchmarks/bench_inferencia.py --modelo modelos/modelo_renda.joblib --linhas 100000
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from inferencia import CachePrevisoes, ModeloLinearCompacto, MotorMicroLote  # noqa: E402
+from modelo import CAMINHO_MODELO, carregar_modelo  # noqa: E402
+
+
+def registros_aleatorios(n, semente=0):
+    rng = np.random.default_rng(semente)
+    return [
+        {
+            'tempo_emprego': float(rng.uniform(0, 30)),
+            'qt_pessoas_residencia': float(rng.integers(1, 6)),
+            'renda_por_ano_emprego': float(rng.uniform(500, 20000)),
+            'pessoas_por_imovel': float(rng.uniform(0.5, 5)),
+        }
+        for _ in range(n)
+    ]
+
+
+def vazao(nome, n, funcao):
+    inicio = time.perf_counter()
+    funcao()
+    duracao = time.perf_counter() - inicio
+    print(f"  {nome:<45} {n / duracao:>14,.0f} previsões/s  ({duracao * 1e6 / n:8.2f} µs/previsão)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modelo', default=CAMINHO_MODELO)
+    parser.add_argument('--individuais', type=int, default=2000, help="predições de uma linha")
+    parser.add_argument('--linhas', type=int, default=100_000, help="linhas do teste em lote")
+    parser.add_argument('--threads', type=int, default=8, help="threads submetendo ao motor de micro-lotes")
+    parser.add_argument('--distintos', type=int, default=50,
+                        help="combinações distintas nas chamadas repetidas do teste de cache")
+    args = parser.parse_args(argv)
+
+    artefato = carregar_modelo(args.modelo)
+    modelo = artefato['modelo']
+    features = artefato['features']
+    compacto = ModeloLinearCompacto.do_artefato(artefato)
+
+    print(f"Uma linha por chamada ({args.individuais} chamadas):")
+    individuais = registros_aleatorios(args.individuais)
+    vazao('modelo.predict(pd.DataFrame([registro]))', args.individuais,
+          lambda: [modelo.predict(pd.DataFrame([registro], columns=features)) for registro in individuais])
+    vazao('ModeloLinearCompacto.prever_registros([registro])', args.individuais,
+          lambda: [compacto.prever_registros([registro]) for registro in individuais])
+
+    print(f"Lote de {args.linhas} linhas:")
+    lote = registros_aleatorios(args.linhas, semente=1)
+    df = pd.DataFrame(lote, columns=features)
+    X = df.to_numpy()
+    vazao('modelo.predict(DataFrame)', args.linhas, lambda: modelo.predict(df))
+    vazao('modelo.predict(pd.DataFrame(registros))', args.linhas,
+          lambda: modelo.predict(pd.DataFrame(lote, columns=features)))
+    vazao('ModeloLinearCompacto.prever_matriz(X)', args.linhas, lambda: compacto.prever_matriz(X))
+    vazao('ModeloLinearCompacto.prever_registros(registros)', args.linhas, lambda: compacto.prever_registros(lote))
+    assert np.allclose(modelo.predict(df), compacto.prever_matriz(X))
+
+    print(f"Motor de micro-lotes ({args.threads} threads, {args.individuais} requisições cada):")
+    motor = MotorMicroLote(compacto)
+
+    def submeter_todas():
+        def trabalho():
+            for registro in individuais:
+                motor.prever(registro)
+        threads = [threading.Thread(target=trabalho) for _ in range(args.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    vazao('MotorMicroLote.prever(registro)', args.threads * args.individuais, submeter_todas)
+    print(f"  tamanho médio do micro-lote: {motor.previsoes / motor.lotes:.1f}")
+    motor.encerrar()
+
+    # Formulário: poucas combinações distintas pedidas muitas vezes, uma linha por chamada
+    print(f"Cache de previsões ({args.individuais} chamadas sobre {args.distintos} combinações distintas):")
+    distintos = pd.DataFrame(registros_aleatorios(args.distintos, semente=2), columns=features).to_numpy()
+    repetidas = distintos[np.random.default_rng(3).integers(0, args.distintos, args.individuais)][:, None, :]
+    vazao('modelo.predict(X) sem cache', args.individuais,
+          lambda: [modelo.predict(pd.DataFrame(x, columns=features)) for x in repetidas])
+    cache = CachePrevisoes()
+    vazao('CachePrevisoes + modelo.predict', args.individuais,
+          lambda: [cache.prever(artefato['versao'], x, lambda m: modelo.predict(pd.DataFrame(m, columns=features)))
+                   for x in repetidas])
+    vazao('ModeloLinearCompacto.prever_matriz(x) sem cache', args.individuais,
+          lambda: [compacto.prever_matriz(x) for x in repetidas])
+    cache_compacto = CachePrevisoes()
+    vazao('CachePrevisoes + ModeloLinearCompacto', args.individuais,
+          lambda: [cache_compacto.prever(artefato['versao'], x, compacto.prever_matriz) for x in repetidas])
+    print(f"  taxa de acerto: {cache.estatisticas()['taxa_acerto']:.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Compara a validação cruzada feita como no projeto original (fatias do DataFrame
+por fold, `predict` e uma chamada de `mean_squared_error`/`r2_score`/
+`mean_absolute_error` por modelo e fold) com o motor de `validacao.py`, que
+materializa os folds uma vez, empilha as previsões e calcula as métricas juntas.
+
+    python benchmarks/bench_validacao.py --linhas 1500000 --repeticoes 3
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from sklearn.base import clone  # noqa: E402
+from sklearn.linear_model import Lasso, LinearRegression, Ridge  # noqa: E402
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score  # noqa: E402
+from sklearn.model_selection import KFold  # noqa: E402
+
+from modelo import ALVO, novo_transformador, preparar_features  # noqa: E402
+from sintetico import bloco_sintetico  # noqa: E402
+from validacao import folds_kfold, metricas_por_fold, prever_fora_do_fold, validar  # noqa: E402
+
+MODELOS = {
+    'linear': LinearRegression(),
+    'ridge_100': Ridge(alpha=100),
+    'ridge_10': Ridge(alpha=10),
+    'lasso_1': Lasso(alpha=1.0),
+    'lasso_10': Lasso(alpha=10),
+}
+
+
+def cronometrar(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def validar_sklearn(modelos, X, y, cv=5):
+    """Como o projeto avaliava: `iloc` no DataFrame por fold e uma chamada de métrica por modelo."""
+    linhas = []
+    for fold, (treino, teste) in enumerate(KFold(n_splits=cv).split(X)):
+        X_treino, X_teste = X.iloc[treino], X.iloc[teste]
+        y_treino, y_teste = y.iloc[treino], y.iloc[teste]
+        for nome, estimador in modelos.items():
+            previsto = clone(estimador).fit(X_treino, y_treino).predict(X_teste)
+            linhas.append({
+                'modelo': nome, 'fold': fold,
+                'mse': mean_squared_error(y_teste, previsto),
+                'mae': mean_absolute_error(y_teste, previsto),
+                'r2': r2_score(y_teste, previsto),
+            })
+    return pd.DataFrame(linhas)
+
+
+def pontuar_sklearn(y, previsoes, folds):
+    # Só a etapa de métricas, com as mesmas previsões fora do fold do motor
+    linhas = []
+    for fold in np.unique(folds):
+        teste = folds == fold
+        for j in range(previsoes.shape[1]):
+            linhas.append((mean_squared_error(y[teste], previsoes[teste, j]),
+                           mean_absolute_error(y[teste], previsoes[teste, j]),
+                           r2_score(y[teste], previsoes[teste, j])))
+    return linhas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--linhas', type=int, default=1_500_000)
+    parser.add_argument('--cv', type=int, default=5)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    df = bloco_sintetico(args.linhas, np.random.default_rng(0))
+    X = preparar_features(df, novo_transformador().fit(df))
+    y = df[ALVO]
+    print(f"{len(X)} linhas, {len(MODELOS)} modelos x {args.cv} folds")
+
+    original = validar_sklearn(MODELOS, X, y, args.cv).set_index(['modelo', 'fold'])
+    motor = validar(MODELOS, X, y, args.cv).set_index(['modelo', 'fold'])
+    diferenca = (original[['mse', 'mae', 'r2']] / motor[['mse', 'mae', 'r2']] - 1).abs().to_numpy().max()
+    print(f"  maior diferença relativa entre as métricas: {diferenca:.2e}")
+
+    tempo_original = cronometrar(lambda: validar_sklearn(MODELOS, X, y, args.cv), args.repeticoes)
+    tempo_motor = cronometrar(lambda: validar(MODELOS, X, y, args.cv), args.repeticoes)
+    print(f"  validação completa: sklearn {tempo_original:.3f}s | motor {tempo_motor:.3f}s "
+          f"({tempo_original / tempo_motor:.1f}x)")
+
+    folds = folds_kfold(len(y), args.cv)
+    y_array = y.to_numpy(dtype=np.float64)
+    previsoes = prever_fora_do_fold(MODELOS, X, y_array, folds)
+    tempo_original = cronometrar(lambda: pontuar_sklearn(y_array, previsoes, folds), args.repeticoes)
+    tempo_motor = cronometrar(lambda: metricas_por_fold(y_array, previsoes, folds, nomes=MODELOS), args.repeticoes)
+    print(f"  só as métricas: sklearn {tempo_original:.3f}s | metricas_por_fold {tempo_motor:.3f}s "
+          f"({tempo_original / tempo_motor:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Teste de carga do serviço de predição (servico.py) rodando em localhost.
+
+    python servico.py --porta 8000 &
+    python benchmarks/carga_servico.py --url http://127.0.0.1:8000 --clientes 8 --requisicoes 500 --lote 1
+"""
+import argparse
+import json
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+
+def exemplo_cliente(rng):
+    return {
+        'tempo_emprego': float(rng.uniform(0, 30)),
+        'qt_pessoas_residencia': int(rng.integers(1, 6)),
+        'renda_por_ano_emprego': float(rng.uniform(500, 20000)),
+        'pessoas_por_imovel': float(rng.uniform(0.5, 5)),
+    }
+
+
+def enviar(url, corpo):
+    requisicao = urllib.request.Request(
+        f"{url}/prever", data=json.dumps(corpo).encode(), headers={'Content-Type': 'application/json'}
+    )
+    with urllib.request.urlopen(requisicao) as resposta:
+        return json.loads(resposta.read())
+
+
+def cliente(url, requisicoes, lote, semente, latencias):
+    rng = np.random.default_rng(semente)
+    for _ in range(requisicoes):
+        corpo = exemplo_cliente(rng) if lote == 1 else {'instancias': [exemplo_cliente(rng) for _ in range(lote)]}
+        inicio = time.perf_counter()
+        enviar(url, corpo)
+        latencias.append(time.perf_counter() - inicio)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--clientes', type=int, default=8, help="threads enviando requisições em paralelo")
+    parser.add_argument('--requisicoes', type=int, default=500, help="requisições por cliente")
+    parser.add_argument('--lote', type=int, default=1, help="previsões por requisição")
+    args = parser.parse_args(argv)
+
+    latencias = []
+    threads = [
+        threading.Thread(target=cliente, args=(args.url, args.requisicoes, args.lote, semente, latencias))
+        for semente in range(args.clientes)
+    ]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duracao = time.perf_counter() - inicio
+
+    total = len(latencias)
+    p50, p99 = np.percentile(latencias, [50, 99]) * 1000
+    print(f"{total} requisições ({total * args.lote} previsões) em {duracao:.2f}s: "
+          f"{total / duracao:,.0f} req/s, {total * args.lote / duracao:,.0f} previsões/s")
+    print(f"latência no cliente: p50 {p50:.2f} ms, p99 {p99:.2f} ms")
+    with urllib.request.urlopen(f"{args.url}/metricas") as resposta:
+        print("métricas do serviço:", json.loads(resposta.read()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Mede o tempo até a primeira renderização do app e a latência de uma interação
+no formulário de predição, executando o script com o AppTest do Streamlit.
+
+    python benchmarks/latencia_app.py --repeticoes 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+APP = os.path.join(RAIZ, 'EBAC16A.py')
+# Página da predição quando o app está dividido em páginas (ausente na versão em script único)
+PAGINA_PREDICAO = os.path.join('paginas', 'implantacao.py')
+ROTULO_ENTRADA = "Tempo de Emprego (anos)"
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def executar(app):
+    teste = AppTest.from_file(app, default_timeout=600)
+    tempo = cronometrar(teste.run)
+    if teste.exception:
+        raise RuntimeError(teste.exception[0].value)
+    return teste, tempo
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--app', default=APP)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # A primeira execução paga as cargas a frio (dados, agregados, artefato) do processo
+    teste, primeira = executar(args.app)
+    renderizacoes = [executar(args.app)[1] for _ in range(args.repeticoes)]
+    print(f"primeira renderização (caches frios): {primeira:.3f}s")
+    print(f"renderização com caches quentes: mediana {statistics.median(renderizacoes):.3f}s")
+
+    com_paginas = os.path.exists(os.path.join(os.path.dirname(args.app), PAGINA_PREDICAO))
+    if com_paginas:
+        navegacao = cronometrar(lambda: teste.switch_page(PAGINA_PREDICAO).run())
+        print(f"abrir a página de predição: {navegacao:.3f}s")
+    entrada = next(campo for campo in teste.number_input if campo.label == ROTULO_ENTRADA)
+    interacoes = []
+    for valor in range(args.repeticoes):
+        interacoes.append(cronometrar(lambda: entrada.set_value(valor + 1).run()))
+        entrada = next(campo for campo in teste.number_input if campo.label == ROTULO_ENTRADA)
+    print(f"interação no formulário de predição: mediana {statistics.median(interacoes):.3f}s "
+          f"(máx. {max(interacoes):.3f}s)")
+
+
+if __name__ == '__main__':
+    main()
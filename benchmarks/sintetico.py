@@ -0,0 +1,81 @@
+"""
+Gera CSVs sintéticos com o esquema do previsao_de_renda.csv (mesmas colunas,
+níveis das categorias, 15 meses de data_ref e ~17% de 'tempo_emprego' ausente),
+em blocos, para qualquer número de linhas.
+
+    python benchmarks/sintetico.py 1500000 renda_1500k.csv
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+MESES = pd.date_range('2015-01-01', periods=15, freq='MS').strftime('%Y-%m-%d')
+# Níveis e frequências aproximadas do arquivo original
+CATEGORIAS = {
+    'sexo': {'F': 0.67, 'M': 0.33},
+    'tipo_renda': {'Assalariado': 0.51, 'Empresário': 0.23, 'Pensionista': 0.17, 'Servidor público': 0.089,
+                   'Bolsista': 0.001},
+    'educacao': {'Secundário': 0.57, 'Superior completo': 0.34, 'Superior incompleto': 0.06, 'Primário': 0.029,
+                 'Pós graduação': 0.001},
+    'estado_civil': {'Casado': 0.70, 'Solteiro': 0.12, 'União': 0.08, 'Separado': 0.06, 'Viúvo': 0.04},
+    'tipo_residencia': {'Casa': 0.90, 'Com os pais': 0.045, 'Governamental': 0.03, 'Aluguel': 0.015,
+                        'Estúdio': 0.006, 'Comunitário': 0.004},
+}
+TAXA_AUSENTE_TEMPO_EMPREGO = 0.17
+LINHAS_POR_BLOCO = 1_000_000
+
+
+def _escolher(rng, niveis, n):
+    valores = list(niveis)
+    pesos = np.array(list(niveis.values()))
+    return rng.choice(valores, n, p=pesos / pesos.sum())
+
+
+def bloco_sintetico(n, rng, inicio=0):
+    """DataFrame com `n` linhas no esquema do dataset; 'Unnamed: 0' começa em `inicio`."""
+    idade = rng.integers(22, 69, n)
+    tempo_emprego = np.round(np.minimum(rng.gamma(1.6, 4.5, n), idade - 18), 6)
+    qtd_filhos = np.minimum(rng.poisson(0.45, n), 14)
+    casado = rng.random(n) < 0.78
+    df = pd.DataFrame({
+        'Unnamed: 0': np.arange(inicio, inicio + n),
+        'data_ref': rng.choice(MESES, n),
+        'id_cliente': rng.integers(1, 17_000, n),
+        'sexo': _escolher(rng, CATEGORIAS['sexo'], n),
+        'posse_de_veiculo': rng.random(n) < 0.39,
+        'posse_de_imovel': rng.random(n) < 0.67,
+        'qtd_filhos': qtd_filhos,
+        'tipo_renda': _escolher(rng, CATEGORIAS['tipo_renda'], n),
+        'educacao': _escolher(rng, CATEGORIAS['educacao'], n),
+        'estado_civil': _escolher(rng, CATEGORIAS['estado_civil'], n),
+        'tipo_residencia': _escolher(rng, CATEGORIAS['tipo_residencia'], n),
+        'idade': idade,
+        'tempo_emprego': tempo_emprego,
+        'qt_pessoas_residencia': (1 + casado + qtd_filhos).astype(float),
+        'renda': np.round(np.exp(rng.normal(7.9, 0.7, n)) + 350 * tempo_emprego, 2),
+    })
+    df.loc[rng.random(n) < TAXA_AUSENTE_TEMPO_EMPREGO, 'tempo_emprego'] = np.nan
+    return df
+
+
+def gerar_csv(linhas, caminho, semente=0, linhas_por_bloco=LINHAS_POR_BLOCO):
+    """Grava `linhas` linhas sintéticas em `caminho`, um bloco por vez (memória limitada)."""
+    rng = np.random.default_rng(semente)
+    for inicio in range(0, linhas, linhas_por_bloco):
+        bloco = bloco_sintetico(min(linhas_por_bloco, linhas - inicio), rng, inicio)
+        bloco.to_csv(caminho, mode='w' if inicio == 0 else 'a', header=inicio == 0, index=False)
+    return caminho
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('linhas', type=int)
+    parser.add_argument('saida')
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args(argv)
+    gerar_csv(args.linhas, args.saida, args.semente)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+"""
+Mede cada etapa do app (carga, preparo, codificação, ajuste e predição) em dados
+sintéticos de 15k, 150k, 1,5M e 15M linhas, com tempo e pico de memória, e grava
+os resultados em JSON para comparar versões.
+
+    python benchmarks/suite.py --linhas 15000 150000 --saida benchmarks/resultados/atual.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import sklearn  # noqa: E402
+from sklearn.linear_model import Lasso, LinearRegression, Ridge  # noqa: E402
+from sklearn.model_selection import GridSearchCV  # noqa: E402
+
+from busca import buscar_alpha  # noqa: E402
+from dados import carregar_dados, limpar_cache  # noqa: E402
+from diagnostico import memoria_atual_mb  # noqa: E402
+from features import COLUNAS_DUMMIES, CodificadorDummies, TransformadorRenda  # noqa: E402
+from inferencia import ModeloLinearCompacto  # noqa: E402
+from modelo import ALVO, GRADE_ALPHA, novo_transformador, preparar_features  # noqa: E402
+from sintetico import gerar_csv  # noqa: E402
+
+TAMANHOS = [15_000, 150_000, 1_500_000, 15_000_000]
+DIRETORIO_RESULTADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resultados')
+
+
+class MonitorMemoria:
+    """Amostra o RSS em uma thread enquanto a etapa roda e guarda o maior valor visto."""
+
+    def __init__(self, intervalo_s=0.005):
+        self.intervalo_s = intervalo_s
+        self.pico_mb = 0.0
+        self._parar = threading.Event()
+
+    def _amostrar(self):
+        while not self._parar.is_set():
+            self.pico_mb = max(self.pico_mb, memoria_atual_mb())
+            self._parar.wait(self.intervalo_s)
+
+    def __enter__(self):
+        self.pico_mb = memoria_atual_mb()
+        self._thread = threading.Thread(target=self._amostrar, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *excecao):
+        self._parar.set()
+        self._thread.join()
+        self.pico_mb = max(self.pico_mb, memoria_atual_mb())
+
+
+def medir(resultados, linhas, etapa, funcao):
+    gc.collect()
+    memoria_inicial = memoria_atual_mb()
+    with MonitorMemoria() as monitor:
+        inicio = time.perf_counter()
+        retorno = funcao()
+        duracao = time.perf_counter() - inicio
+    resultado = {
+        'linhas': linhas,
+        'etapa': etapa,
+        'tempo_s': round(duracao, 6),
+        'memoria_inicial_mb': round(memoria_inicial, 1),
+        'pico_memoria_mb': round(monitor.pico_mb, 1),
+        'acrescimo_memoria_mb': round(monitor.pico_mb - memoria_inicial, 1),
+    }
+    resultados.append(resultado)
+    print(f"  {etapa:<28} {duracao:10.3f}s {monitor.pico_mb:10.1f} MB (+{resultado['acrescimo_memoria_mb']:.1f})",
+          flush=True)
+    return retorno
+
+
+def preparar_como_app(df):
+    """Seção de limpeza do app: mediana nas colunas numéricas e remoção de duplicadas."""
+    df = df.copy()
+    colunas_numericas = df.select_dtypes(include='number').columns
+    df[colunas_numericas] = df[colunas_numericas].fillna(df[colunas_numericas].median())
+    return df.drop_duplicates()
+
+
+def medir_tamanho(csv, linhas, resultados, com_gridsearch=True):
+    limpar_cache()
+    parquet = f"{os.path.splitext(csv)[0]}.parquet"
+    medir(resultados, linhas, 'carga_read_csv', lambda: pd.read_csv(csv))
+    medir(resultados, linhas, 'carga_csv_tipado', lambda: carregar_dados(csv))
+    limpar_cache()
+    df = medir(resultados, linhas, 'carga_parquet', lambda: carregar_dados(csv))
+    medir(resultados, linhas, 'carga_cache_memoria', lambda: carregar_dados(csv))
+
+    limpo = medir(resultados, linhas, 'preparo_fillna_duplicadas', lambda: preparar_como_app(df))
+    medir(resultados, linhas, 'codificacao_get_dummies',
+          lambda: pd.get_dummies(limpo, columns=list(COLUNAS_DUMMIES), drop_first=True))
+    medir(resultados, linhas, 'codificacao_transformador', lambda: TransformadorRenda().fit(limpo).transform(limpo))
+    medir(resultados, linhas, 'codificacao_esparsa', lambda: CodificadorDummies().fit(limpo).transform(limpo))
+
+    X = preparar_features(df, novo_transformador().fit(df))
+    y = df[ALVO]
+    modelo = medir(resultados, linhas, 'ajuste_linear', lambda: LinearRegression().fit(X, y))
+    if com_gridsearch:
+        for tipo, estimador in (('ridge', Ridge), ('lasso', Lasso)):
+            medir(resultados, linhas, f'ajuste_gridsearch_{tipo}',
+                  lambda: GridSearchCV(estimador(), {'alpha': GRADE_ALPHA}, cv=5,
+                                       scoring='neg_mean_squared_error').fit(X, y))
+    for tipo in ('ridge', 'lasso'):
+        medir(resultados, linhas, f'ajuste_busca_caminho_{tipo}',
+              lambda: buscar_alpha(X, y, tipo, GRADE_ALPHA, diretorio_cache=None))
+
+    compacto = ModeloLinearCompacto(modelo.coef_, modelo.intercept_, X.columns, 0.0)
+    matriz = X.to_numpy(dtype=np.float64)
+    medir(resultados, linhas, 'previsao_sklearn', lambda: modelo.predict(X))
+    medir(resultados, linhas, 'previsao_compacta', lambda: compacto.prever_matriz(matriz))
+
+    limpar_cache()
+    if os.path.exists(parquet):
+        os.remove(parquet)
+
+
+def metadados():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'executado_em': datetime.now(timezone.utc).isoformat(),
+        'commit': commit,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'sklearn': sklearn.__version__,
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--linhas', type=int, nargs='+', default=TAMANHOS)
+    parser.add_argument('--saida',
+                        help="arquivo JSON de resultados (padrão: benchmarks/resultados/<data>-<commit>.json)")
+    parser.add_argument('--diretorio', help="onde guardar os CSVs gerados (padrão: temporário, apagado no fim)")
+    parser.add_argument('--sem-gridsearch', type=int, default=15_000_000,
+                        help="a partir deste número de linhas, pula o GridSearchCV original")
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    informacoes = metadados()
+    resultados = []
+    diretorio = args.diretorio or tempfile.mkdtemp(prefix='bench_suite_')
+    os.makedirs(diretorio, exist_ok=True)
+    try:
+        for linhas in args.linhas:
+            csv = os.path.join(diretorio, f'renda_{linhas}.csv')
+            if not os.path.exists(csv):
+                medir(resultados, linhas, 'geracao_sintetica', lambda: gerar_csv(linhas, csv, args.semente))
+            print(f"{linhas:,} linhas ({os.path.getsize(csv) / 1024 ** 2:.1f} MB de CSV)")
+            medir_tamanho(csv, linhas, resultados, com_gridsearch=linhas < args.sem_gridsearch)
+    finally:
+        if args.diretorio is None:
+            shutil.rmtree(diretorio, ignore_errors=True)
+
+    saida = args.saida or os.path.join(
+        DIRETORIO_RESULTADOS, f"{datetime.now():%Y%m%dT%H%M%S}-{informacoes['commit'] or 'sem-commit'}.json")
+    os.makedirs(os.path.dirname(saida) or '.', exist_ok=True)
+    with open(saida, 'w') as arquivo:
+        json.dump({'metadados': informacoes, 'resultados': resultados}, arquivo, indent=2, ensure_ascii=False)
+    print(f"Resultados gravados em {saida}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.linear_model import Lasso, Ridge, lasso_path
+from sklearn.model_selection import KFold
+
+# Diretório onde os resultados por fold ficam guardados entre execuções
+DIRETORIO_CACHE = os.path.join('cache', 'busca')
+
+ESTIMADORES = {'ridge': Ridge, 'lasso': Lasso}
+# 'cv': KFold; 'loo' e 'gcv': erro de validação analítico do Ridge, sem folds
+CRITERIOS = ('cv', 'loo', 'gcv')
+# Grade densa para o Ridge: com uma SVD por fold, centenas de alphas custam quase o mesmo que seis
+GRADE_ALPHA_DENSA = np.logspace(-3, 4, 300)
+LINHAS_POR_BLOCO = 20_000
+
+
+def _centralizar(X, y):
+    x_media = X.mean(axis=0)
+    y_media = y.mean()
+    return X - x_media, y - y_media, x_media, y_media
+
+
+def caminho_ridge(X, y, alphas):
+    """
+    Coeficientes do Ridge (com intercepto) para todos os `alphas` a partir de uma
+    única SVD de X centralizado: w(alpha) = V diag(s / (s² + alpha)) Uᵀ y.
+    Retorna (coeficientes [n_alphas, n_features], interceptos [n_alphas]).
+    """
+    Xc, yc, x_media, y_media = _centralizar(X, y)
+    U, s, Vt = np.linalg.svd(Xc, full_matrices=False)
+    Uty = U.T @ yc
+    alphas = np.asarray(alphas, dtype=np.float64)
+    fatores = s / (s ** 2 + alphas[:, None])
+    coeficientes = (fatores * Uty) @ Vt
+    return coeficientes, y_media - coeficientes @ x_media
+
+
+def caminho_lasso(X, y, alphas):
+    """
+    Coeficientes do Lasso (com intercepto) para todos os `alphas` em uma única
+    chamada a `lasso_path`, que percorre a grade com warm start.
+    """
+    Xc, yc, x_media, y_media = _centralizar(X, y)
+    alphas = np.asarray(alphas, dtype=np.float64)
+    ordem = np.argsort(alphas)[::-1]  # lasso_path espera alphas decrescentes
+    _, coefs, _ = lasso_path(Xc, yc, alphas=alphas[ordem])
+    coeficientes = np.empty((len(alphas), X.shape[1]))
+    coeficientes[ordem] = coefs.T
+    return coeficientes, y_media - coeficientes @ x_media
+
+
+CAMINHOS = {'ridge': caminho_ridge, 'lasso': caminho_lasso}
+
+
+def erros_analiticos_ridge(X, y, alphas):
+    """
+    MSE leave-one-out e critério GCV do Ridge (com intercepto) para todos os
+    `alphas` a partir de uma única SVD de X centralizado, sem reajustes:
+    a matriz chapéu é H = 11ᵀ/n + U diag(s² / (s² + alpha)) Uᵀ, o resíduo LOO
+    é rᵢ / (1 - hᵢᵢ) e o GCV é média(r²) / (1 - tr(H)/n)².
+    Retorna (mse_loo [n_alphas], gcv [n_alphas]).
+    """
+    Xc, yc, _, _ = _centralizar(X, y)
+    n = len(yc)
+    U, s, _ = np.linalg.svd(Xc, full_matrices=False)
+    Uty = U.T @ yc
+    alphas = np.asarray(alphas, dtype=np.float64)
+    contracao = s ** 2 / (s ** 2 + alphas[:, None])  # [n_alphas, n_componentes]
+    pesos = (contracao * Uty).T
+    soma_loo = np.zeros(len(alphas))
+    soma_residuos = np.zeros(len(alphas))
+    # Linhas em blocos: a matriz de resíduos [linhas, n_alphas] nunca é montada inteira
+    for inicio in range(0, n, LINHAS_POR_BLOCO):
+        bloco = U[inicio:inicio + LINHAS_POR_BLOCO]
+        residuos = yc[inicio:inicio + LINHAS_POR_BLOCO, None] - bloco @ pesos
+        diagonal = 1 / n + (bloco ** 2) @ contracao.T
+        soma_loo += ((residuos / (1 - diagonal)) ** 2).sum(axis=0)
+        soma_residuos += (residuos ** 2).sum(axis=0)
+    traco = 1 + contracao.sum(axis=1)
+    return soma_loo / n, soma_residuos / n / (1 - traco / n) ** 2
+
+
+def _mse_fold(tipo, X, y, treino, teste, alphas):
+    coeficientes, interceptos = CAMINHOS[tipo](X[treino], y[treino], alphas)
+    previsoes = X[teste] @ coeficientes.T + interceptos
+    return ((previsoes - y[teste][:, None]) ** 2).mean(axis=0)
+
+
+def chave_cache(tipo, X, y, alphas, cv):
+    h = hashlib.sha256()
+    h.update(np.ascontiguousarray(X).tobytes())
+    h.update(np.ascontiguousarray(y).tobytes())
+    h.update(json.dumps({'tipo': tipo, 'alphas': [float(a) for a in alphas], 'cv': cv, 'shape': X.shape}).encode())
+    return h.hexdigest()
+
+
+class ResultadoBusca:
+    """Resultado da busca com a mesma interface usada do GridSearchCV (best_params_, best_score_, ...)."""
+
+    def __init__(self, tipo, alphas, mse_folds, best_estimator_, do_cache):
+        self.tipo = tipo
+        self.alphas = list(alphas)
+        self.mse_folds = mse_folds
+        mse_medio = mse_folds.mean(axis=0)
+        melhor = int(np.argmin(mse_medio))
+        self.best_index_ = melhor
+        self.best_params_ = {'alpha': self.alphas[melhor]}
+        self.best_score_ = float(-mse_medio[melhor])
+        self.best_estimator_ = best_estimator_
+        self.do_cache = do_cache
+        self.cv_results_ = {
+            'param_alpha': np.array(self.alphas),
+            'mean_test_score': -mse_medio,
+            'std_test_score': mse_folds.std(axis=0),
+            **{f'split{i}_test_score': -mse for i, mse in enumerate(mse_folds)},
+        }
+
+
+def buscar_alpha(X, y, tipo='ridge', alphas=(0.001, 0.01, 0.1, 1, 10, 100), cv=5, n_jobs=-1,
+                 diretorio_cache=DIRETORIO_CACHE, criterio='cv', progresso=None):
+    """
+    Busca o melhor `alpha` de Ridge ou Lasso por validação cruzada (KFold, como o
+    GridSearchCV para regressores). Cada fold resolve a grade inteira de uma vez
+    pelo caminho de regularização, os folds rodam em paralelo e o MSE por fold é
+    gravado em disco, chaveado pelo hash dos dados + grade. Use
+    `diretorio_cache=None` para desligar o cache.
+    Para o Ridge, `criterio='loo'` ou `'gcv'` troca os folds pelo erro
+    analítico de `erros_analiticos_ridge` (uma única SVD no conjunto inteiro).
+    `progresso(concluidos, total)`, se informado, é chamado a cada fold concluído.
+    """
+    if criterio not in CRITERIOS:
+        raise ValueError(f"criterio deve ser um de {CRITERIOS}, recebido {criterio!r}")
+    if criterio != 'cv' and tipo != 'ridge':
+        raise ValueError(f"o critério {criterio!r} só existe em forma fechada para o Ridge")
+    X_original, y_original = X, y
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    alphas = [float(alpha) for alpha in alphas]
+
+    arquivo_cache = None
+    mse_folds = None
+    if criterio != 'cv':
+        # Uma SVD no conjunto inteiro: barato demais para valer o cache em disco
+        mse_loo, gcv = erros_analiticos_ridge(X, y, alphas)
+        mse_folds = (mse_loo if criterio == 'loo' else gcv)[None, :]
+    elif diretorio_cache is not None:
+        arquivo_cache = os.path.join(diretorio_cache, f"{chave_cache(tipo, X, y, alphas, cv)}.json")
+        if os.path.exists(arquivo_cache):
+            with open(arquivo_cache) as arquivo:
+                mse_folds = np.array(json.load(arquivo)['mse_folds'])
+    do_cache = mse_folds is not None and criterio == 'cv'
+
+    if mse_folds is None:
+        folds = KFold(n_splits=cv).split(X)
+        # Threads bastam: SVD e coordinate descent liberam o GIL
+        resultados = Parallel(n_jobs=n_jobs, prefer='threads', return_as='generator')(
+            delayed(_mse_fold)(tipo, X, y, treino, teste, alphas) for treino, teste in folds
+        )
+        mse_folds = []
+        for mse in resultados:
+            mse_folds.append(mse)
+            if progresso is not None:
+                progresso(len(mse_folds), cv)
+        mse_folds = np.array(mse_folds)
+        if arquivo_cache is not None:
+            os.makedirs(diretorio_cache, exist_ok=True)
+            temporario = f"{arquivo_cache}.tmp"
+            with open(temporario, 'w') as arquivo:
+                json.dump({'tipo': tipo, 'alphas': alphas, 'cv': cv, 'mse_folds': mse_folds.tolist()}, arquivo)
+            os.replace(temporario, arquivo_cache)
+
+    resultado = ResultadoBusca(tipo, alphas, mse_folds, None, do_cache)
+    # Reajuste com o melhor alpha em todo o conjunto, como o refit=True do GridSearchCV
+    resultado.best_estimator_ = ESTIMADORES[tipo](alpha=resultado.best_params_['alpha']).fit(X_original, y_original)
+    return resultado
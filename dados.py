@@ -0,0 +1,369 @@
+import hashlib
+import io
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+# Caminho padrão do arquivo de dados
+CAMINHO_DADOS = 'previsao_de_renda.csv'
+
+# Tipos explícitos de cada coluna, evitando a inferência do pandas a cada leitura
+COLUNAS_CATEGORICAS = ['sexo', 'tipo_renda', 'educacao', 'estado_civil', 'tipo_residencia']
+COLUNAS_BOOLEANAS = ['posse_de_veiculo', 'posse_de_imovel']
+COLUNAS_DATA = ['data_ref']
+DTYPES = {
+    **{coluna: 'category' for coluna in COLUNAS_CATEGORICAS},
+    **{coluna: 'bool' for coluna in COLUNAS_BOOLEANAS},
+}
+
+# Esquema compacto: inteiros no menor tipo que comporta os valores e float32 onde o
+# erro de arredondamento fica abaixo da tolerância (renda em centavos, tempo_emprego
+# em frações de hora)
+COLUNAS_INTEIRAS = ['Unnamed: 0', 'id_cliente', 'qtd_filhos', 'idade', 'qt_pessoas_residencia']
+TOLERANCIAS_FLOAT32 = {'renda': 0.005, 'tempo_emprego': 1e-4}
+COMPACTAR = True
+# Versão do esquema gravado no Parquet: incrementar quando os tipos ou os metadados mudarem
+VERSAO_ESQUEMA = 3
+
+# Se verdadeiro, a primeira leitura do CSV grava uma cópia em Parquet ao lado dele
+ARMAZENAMENTO_COLUNAR = True
+# Chave dos metadados do Parquet com o hash do CSV de origem
+CHAVE_VERSAO = b'versao_csv'
+# Chave dos metadados com o `relatorio_memoria` da compactação (JSON), para exibi-lo sem reler o CSV
+CHAVE_MEMORIA = b'memoria_por_coluna'
+
+# Coluna que particiona o dataset (um snapshot mensal por valor)
+COLUNA_PARTICAO = 'data_ref'
+
+# Cache em memória do processo: {(caminho, colunas): (assinatura do arquivo, hash do conteúdo, DataFrame)}
+_cache = {}
+# Índices temporais já construídos: {(caminho, hash do conteúdo): IndiceTemporal}
+_indices = {}
+_trava = threading.Lock()
+_estatisticas = {'acertos': 0, 'falhas': 0, 'tempo_carga_s': 0.0, 'ultimo_hash': None,
+                 'memoria_original_mb': None, 'memoria_mb': None, 'memoria_por_coluna': None}
+
+
+def hash_arquivo(caminho=CAMINHO_DADOS, tamanho_bloco=1 << 20):
+    """Calcula o hash SHA-256 do conteúdo do arquivo, lendo em blocos."""
+    h = hashlib.sha256()
+    with open(caminho, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(tamanho_bloco), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def _assinatura(caminho):
+    # Tamanho e data de modificação: evita reler o arquivo para recalcular o hash a cada rerun
+    info = os.stat(caminho)
+    return info.st_size, info.st_mtime_ns
+
+
+def ler_csv(caminho=CAMINHO_DADOS, **kwargs):
+    """Lê o CSV com os tipos explícitos do dataset previsao_de_renda (`kwargs` pode sobrescrevê-los)."""
+    return pd.read_csv(caminho, **{'dtype': DTYPES, 'parse_dates': COLUNAS_DATA, **kwargs})
+
+
+def _inteiro_compacto(serie):
+    # Colunas float com valores inteiros e sem nulos (ex.: qt_pessoas_residencia) também viram inteiros
+    if serie.isna().any():
+        return serie
+    if serie.dtype.kind == 'f':
+        if not np.array_equal(serie.to_numpy(), np.round(serie.to_numpy())):
+            return serie
+        serie = serie.astype(np.int64)
+    return pd.to_numeric(serie, downcast='integer')
+
+
+def _float32_compacto(serie, tolerancia):
+    convertida = serie.astype(np.float32)
+    erro = np.nanmax(np.abs(convertida.to_numpy(dtype=np.float64) - serie.to_numpy(dtype=np.float64)), initial=0.0)
+    return convertida if erro <= tolerancia else serie
+
+
+def compactar(df):
+    """
+    Aplica o esquema compacto: inteiros no menor tipo seguro, categorias como
+    códigos de dicionário e float32 para 'renda'/'tempo_emprego' quando a
+    precisão permite. Colunas ausentes são ignoradas.
+    """
+    df = df.copy(deep=False)
+    for coluna in COLUNAS_INTEIRAS:
+        if coluna in df.columns:
+            df[coluna] = _inteiro_compacto(df[coluna])
+    for coluna, tolerancia in TOLERANCIAS_FLOAT32.items():
+        if coluna in df.columns and df[coluna].dtype == np.float64:
+            df[coluna] = _float32_compacto(df[coluna], tolerancia)
+    for coluna in COLUNAS_CATEGORICAS:
+        if coluna in df.columns and df[coluna].dtype == object:
+            df[coluna] = df[coluna].astype('category')
+    return df
+
+
+def relatorio_memoria(antes, depois):
+    """Memória por coluna (`memory_usage(deep=True)`, em KB) antes e depois da compactação."""
+    relatorio = pd.DataFrame({
+        'tipo_antes': antes.dtypes.astype(str),
+        'kb_antes': antes.memory_usage(deep=True, index=False) / 1024,
+        'tipo_depois': depois.dtypes.astype(str),
+        'kb_depois': depois.memory_usage(deep=True, index=False) / 1024,
+    })
+    relatorio.loc['total'] = ['', relatorio['kb_antes'].sum(), '', relatorio['kb_depois'].sum()]
+    return relatorio
+
+
+def caminho_parquet(caminho_csv):
+    """
+    Arquivo Parquet gerado ao lado do CSV (previsao_de_renda.csv -> previsao_de_renda.parquet).
+    É um artefato derivado do CSV: o da raiz do projeto está no .gitignore.
+    """
+    return os.path.splitext(caminho_csv)[0] + '.parquet'
+
+
+def salvar_parquet(df, caminho, versao_origem=None, relatorio=None):
+    """
+    Grava o frame tipado em Parquet (categorias como dicionário, booleanos e datas
+    nativos). `versao_origem` identifica o CSV de origem (hash do conteúdo e
+    versão do esquema) e fica nos metadados para saber se o Parquet ainda
+    corresponde ao CSV; `relatorio` (o `relatorio_memoria` da compactação) também.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tabela = pa.Table.from_pandas(df, preserve_index=False)
+    metadados = dict(tabela.schema.metadata)
+    if versao_origem is not None:
+        metadados[CHAVE_VERSAO] = versao_origem.encode()
+    if relatorio is not None:
+        metadados[CHAVE_MEMORIA] = relatorio.to_json(orient='split').encode()
+    tabela = tabela.replace_schema_metadata(metadados)
+    temporario = f"{caminho}.tmp"
+    pq.write_table(tabela, temporario)
+    os.replace(temporario, caminho)
+
+
+def versao_parquet(caminho):
+    """Versão de origem gravada no Parquet (hash do CSV e esquema), ou None se não houver."""
+    import pyarrow.parquet as pq
+
+    metadados = pq.read_schema(caminho).metadata or {}
+    versao = metadados.get(CHAVE_VERSAO)
+    return versao.decode() if versao is not None else None
+
+
+def relatorio_parquet(caminho):
+    """`relatorio_memoria` gravado no Parquet quando ele foi gerado a partir do CSV, ou None."""
+    import pyarrow.parquet as pq
+
+    relatorio = (pq.read_schema(caminho).metadata or {}).get(CHAVE_MEMORIA)
+    return pd.read_json(io.StringIO(relatorio.decode()), orient='split') if relatorio is not None else None
+
+
+def ler_parquet(caminho, colunas=None):
+    """Lê só as `colunas` pedidas do Parquet (projeção feita pelo leitor, sem ler o resto do arquivo)."""
+    return pd.read_parquet(caminho, columns=None if colunas is None else list(colunas), memory_map=True)
+
+
+def _versao_origem(digest):
+    # O Parquet só é reaproveitado se veio do mesmo CSV e com o mesmo esquema de tipos
+    return f"{digest}:{VERSAO_ESQUEMA if COMPACTAR else 1}"
+
+
+def converter_para_parquet(caminho_csv=CAMINHO_DADOS, caminho_destino=None):
+    """Converte o CSV uma vez para Parquet tipado. Retorna o caminho gerado."""
+    caminho_destino = caminho_destino or caminho_parquet(caminho_csv)
+    df = ler_csv(caminho_csv)
+    relatorio = None
+    if COMPACTAR:
+        original, df = df, compactar(df)
+        relatorio = relatorio_memoria(original, df)
+    salvar_parquet(df, caminho_destino, _versao_origem(hash_arquivo(caminho_csv)), relatorio)
+    return caminho_destino
+
+
+def _registrar_relatorio(relatorio):
+    _estatisticas['memoria_por_coluna'] = relatorio
+    _estatisticas['memoria_original_mb'] = relatorio.loc['total', 'kb_antes'] / 1024 if relatorio is not None else None
+
+
+def _ler(caminho, digest, colunas):
+    if caminho.endswith('.parquet'):
+        _registrar_relatorio(relatorio_parquet(caminho))
+        return ler_parquet(caminho, colunas)
+
+    # CSV: usa o Parquet gerado a partir dele, se ainda corresponder ao conteúdo atual
+    destino = caminho_parquet(caminho)
+    try:
+        if os.path.exists(destino) and versao_parquet(destino) == _versao_origem(digest):
+            # O relatório da compactação feita ao gerar o Parquet vem dos metadados dele
+            _registrar_relatorio(relatorio_parquet(destino))
+            return ler_parquet(destino, colunas)
+    except ImportError:
+        pass
+
+    df = ler_csv(caminho)
+    relatorio = None
+    if COMPACTAR:
+        original = df
+        df = compactar(df)
+        relatorio = relatorio_memoria(original, df)
+    _registrar_relatorio(relatorio)
+    if ARMAZENAMENTO_COLUNAR:
+        try:
+            salvar_parquet(df, destino, _versao_origem(digest), relatorio)
+        except (ImportError, OSError):
+            pass
+    return df if colunas is None else df[list(colunas)]
+
+
+def _projetar(df, colunas):
+    return df.copy(deep=False) if colunas is None else df[list(colunas)]
+
+
+def carregar_dados(caminho=CAMINHO_DADOS, colunas=None):
+    """
+    Retorna o DataFrame do dataset, lendo e interpretando o arquivo apenas uma vez
+    por conteúdo. Todas as seções compartilham o mesmo frame: o retorno é uma
+    cópia rasa, então novas colunas não alteram o cache, mas os valores
+    existentes não devem ser modificados no lugar.
+
+    Com `colunas`, só essas colunas são lidas (do Parquet gerado a partir do CSV
+    na primeira leitura); se o frame completo já estiver em memória, a projeção
+    é feita sobre ele.
+    """
+    caminho = os.path.abspath(caminho)
+    chave = None if colunas is None else tuple(colunas)
+    with _trava:
+        assinatura = _assinatura(caminho)
+        # O frame completo atende qualquer projeção
+        for chave_cache in dict.fromkeys([None, chave]):
+            entrada = _cache.get((caminho, chave_cache))
+            if entrada is not None and entrada[0] == assinatura:
+                _estatisticas['acertos'] += 1
+                return _projetar(entrada[2], colunas)
+
+        # Arquivo novo ou alterado: só interpreta de novo se o conteúdo mudou
+        digest = hash_arquivo(caminho)
+        for chave_cache in dict.fromkeys([None, chave]):
+            entrada = _cache.get((caminho, chave_cache))
+            if entrada is not None and entrada[1] == digest:
+                _cache[(caminho, chave_cache)] = (assinatura, digest, entrada[2])
+                _estatisticas['acertos'] += 1
+                return _projetar(entrada[2], colunas)
+
+        inicio = time.perf_counter()
+        df = _ler(caminho, digest, colunas)
+        _estatisticas['tempo_carga_s'] = time.perf_counter() - inicio
+        _estatisticas['falhas'] += 1
+        _estatisticas['ultimo_hash'] = digest
+        _estatisticas['memoria_mb'] = df.memory_usage(deep=True).sum() / 1024 ** 2
+        _cache[(caminho, chave)] = (assinatura, digest, df)
+        return df.copy(deep=False)
+
+
+def versao_dados(caminho=CAMINHO_DADOS):
+    """Hash do conteúdo do arquivo de dados (reaproveita o hash do cache quando o arquivo não mudou)."""
+    caminho = os.path.abspath(caminho)
+    with _trava:
+        assinatura = _assinatura(caminho)
+        for (caminho_cache, _), entrada in _cache.items():
+            if caminho_cache == caminho and entrada[0] == assinatura:
+                return entrada[1]
+    return hash_arquivo(caminho)
+
+
+def mes(valor):
+    """Normaliza '2015-03', '2015-03-01', Timestamp ou datetime64 para o mês (datetime64[M])."""
+    return pd.Timestamp(valor).to_datetime64().astype('datetime64[M]')
+
+
+class IndiceTemporal:
+    """
+    Índice das linhas do arquivo por mês de `data_ref`: a ordem das linhas por data
+    e o deslocamento onde cada mês começa. Selecionar um intervalo de meses é uma
+    busca binária nos deslocamentos e um `take` só das linhas do intervalo, sem
+    máscara booleana sobre o frame inteiro. Vale para qualquer projeção de colunas
+    do mesmo arquivo, já que todas têm a mesma ordem de linhas.
+    """
+
+    def __init__(self, datas):
+        meses_linhas = np.asarray(datas, dtype='datetime64[ns]').astype('datetime64[M]')
+        # Snapshots já gravados em ordem de data dispensam a permutação: cada mês é um slice
+        if len(meses_linhas) and np.all(meses_linhas[1:] >= meses_linhas[:-1]):
+            self.ordem = None
+            ordenados = meses_linhas
+        else:
+            self.ordem = np.argsort(meses_linhas, kind='stable')
+            ordenados = meses_linhas[self.ordem]
+        self.meses, inicios = np.unique(ordenados, return_index=True)
+        self.limites = np.append(inicios, len(ordenados))
+        self.linhas = len(ordenados)
+
+    @classmethod
+    def do_frame(cls, df, coluna=COLUNA_PARTICAO):
+        return cls(df[coluna].to_numpy())
+
+    def intervalo(self, inicio=None, fim=None):
+        """Posições (início, fim) no arquivo ordenado dos meses entre `inicio` e `fim`, inclusive."""
+        primeiro = 0 if inicio is None else int(np.searchsorted(self.meses, mes(inicio), side='left'))
+        ultimo = len(self.meses) if fim is None else int(np.searchsorted(self.meses, mes(fim), side='right'))
+        return int(self.limites[primeiro]), int(self.limites[max(ultimo, primeiro)])
+
+    def posicoes(self, inicio=None, fim=None):
+        """Linhas do arquivo (na ordem das datas) do intervalo: um slice ou um vetor de posições."""
+        de, ate = self.intervalo(inicio, fim)
+        return slice(de, ate) if self.ordem is None else self.ordem[de:ate]
+
+    def selecionar(self, df, inicio=None, fim=None):
+        """Linhas de `df` (frame completo ou projeção do arquivo indexado) nos meses do intervalo."""
+        if len(df) != self.linhas:
+            raise ValueError(f"o índice cobre {self.linhas} linhas, o frame tem {len(df)}")
+        if inicio is None and fim is None and self.ordem is None:
+            return df
+        posicoes = self.posicoes(inicio, fim)
+        return df.iloc[posicoes] if isinstance(posicoes, slice) else df.take(posicoes)
+
+    def ordenar(self, df):
+        """`df` na ordem das datas: cada mês i ocupa as linhas `limites[i]:limites[i + 1]`."""
+        return self.selecionar(df) if self.ordem is None else df.take(self.ordem)
+
+
+def indice_temporal(caminho=CAMINHO_DADOS):
+    """Índice por mês do arquivo, construído uma vez por conteúdo (lendo só a coluna de data)."""
+    chave = (os.path.abspath(caminho), versao_dados(caminho))
+    indice = _indices.get(chave)
+    if indice is None:
+        indice = IndiceTemporal.do_frame(carregar_dados(caminho, colunas=[COLUNA_PARTICAO]))
+        with _trava:
+            _indices[chave] = indice
+    return indice
+
+
+def carregar_periodo(caminho=CAMINHO_DADOS, inicio=None, fim=None, colunas=None):
+    """`carregar_dados` restrito aos meses de `data_ref` entre `inicio` e `fim` (inclusive)."""
+    df = carregar_dados(caminho, colunas)
+    if inicio is None and fim is None:
+        return df
+    return indice_temporal(caminho).selecionar(df, inicio, fim)
+
+
+def estatisticas_cache():
+    """
+    Tempo da última leitura do disco, contagem de acertos/falhas do cache e memória do
+    frame. 'memoria_por_coluna' traz o `relatorio_memoria` da compactação, calculado
+    ao ler o CSV ou guardado nos metadados do Parquet gerado a partir dele (None se
+    não houver compactação ou o Parquet for de uma versão sem o relatório).
+    """
+    with _trava:
+        return dict(_estatisticas)
+
+
+def limpar_cache():
+    with _trava:
+        _cache.clear()
+        _indices.clear()
+        _estatisticas.update(acertos=0, falhas=0, tempo_carga_s=0.0, ultimo_hash=None,
+                             memoria_original_mb=None, memoria_mb=None, memoria_por_coluna=None)
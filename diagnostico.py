@@ -0,0 +1,126 @@
+import contextlib
+import json
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+# Liga a instrumentação (qualquer valor diferente de '', '0' ou 'false')
+VARIAVEL_ATIVACAO = 'RENDA_DIAGNOSTICO'
+# Arquivo JSON Lines onde cada execução do script é acrescentada (opcional)
+VARIAVEL_ARQUIVO = 'RENDA_DIAGNOSTICO_ARQUIVO'
+
+logger = logging.getLogger('diagnostico')
+
+_NULO = contextlib.nullcontext()
+# Instrumentação da execução corrente: o Streamlit roda cada sessão em sua própria thread
+_local = threading.local()
+
+
+def ativo_no_ambiente():
+    return os.environ.get(VARIAVEL_ATIVACAO, '').strip().lower() not in ('', '0', 'false')
+
+
+def memoria_atual_mb():
+    """RSS atual do processo (Linux); nos outros sistemas, o pico do processo até agora."""
+    try:
+        with open('/proc/self/statm') as arquivo:
+            return int(arquivo.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except OSError:
+        maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maximo / 1024 ** 2 if sys.platform == 'darwin' else maximo / 1024
+
+
+class Diagnostico:
+    """
+    Tempo e variação de memória (RSS do processo) de cada seção de uma execução
+    do app. `marco(nome)` fecha a seção anterior e abre a próxima, sem mudar a
+    indentação do script; `secao(nome)` mede um trecho pontual (ex.: um ajuste).
+    Desligado, cada chamada só testa um booleano.
+    """
+
+    def __init__(self, ativo=None, arquivo=None):
+        self.ativo = ativo_no_ambiente() if ativo is None else ativo
+        self.arquivo = os.environ.get(VARIAVEL_ARQUIVO) if arquivo is None else arquivo
+        self.registros = []
+        self._aberta = None
+        _local.atual = self
+        if self.ativo:
+            self._inicio = time.perf_counter()
+            self._memoria_inicial = memoria_atual_mb()
+
+    @classmethod
+    def atual(cls):
+        """A instrumentação criada por último nesta thread (a do EBAC16A.py, para as páginas)."""
+        return getattr(_local, 'atual', None) or cls()
+
+    def _registrar(self, nome, inicio, memoria_inicial):
+        memoria = memoria_atual_mb()
+        self.registros.append({
+            'secao': nome,
+            'tempo_s': round(time.perf_counter() - inicio, 6),
+            'memoria_mb': round(memoria, 1),
+            'delta_memoria_mb': round(memoria - memoria_inicial, 1),
+        })
+
+    def marco(self, nome):
+        if not self.ativo:
+            return
+        self._fechar_marco()
+        self._aberta = (nome, time.perf_counter(), memoria_atual_mb())
+
+    def _fechar_marco(self):
+        if self._aberta is not None:
+            self._registrar(*self._aberta)
+            self._aberta = None
+
+    def secao(self, nome):
+        if not self.ativo:
+            return _NULO
+        return self._medir(nome)
+
+    @contextlib.contextmanager
+    def _medir(self, nome):
+        inicio, memoria_inicial = time.perf_counter(), memoria_atual_mb()
+        try:
+            yield
+        finally:
+            self._registrar(nome, inicio, memoria_inicial)
+
+    def resumo(self):
+        return {
+            'executado_em': datetime.now(timezone.utc).isoformat(),
+            'pid': os.getpid(),
+            'tempo_total_s': round(time.perf_counter() - self._inicio, 6),
+            'delta_memoria_mb': round(memoria_atual_mb() - self._memoria_inicial, 1),
+            'secoes': self.registros,
+        }
+
+    def finalizar(self, exibir=True):
+        """Fecha a última seção, grava o resumo no log/arquivo e o mostra na barra lateral."""
+        if not self.ativo:
+            return None
+        self._fechar_marco()
+        resumo = self.resumo()
+        logger.info("execução em %.3fs: %s", resumo['tempo_total_s'],
+                    ", ".join(f"{r['secao']}={r['tempo_s']:.3f}s" for r in self.registros))
+        if self.arquivo:
+            with open(self.arquivo, 'a', encoding='utf-8') as arquivo:
+                arquivo.write(json.dumps(resumo, ensure_ascii=False) + '\n')
+        if exibir:
+            self._exibir(resumo)
+        return resumo
+
+    def _exibir(self, resumo):
+        import pandas as pd
+        import streamlit as st
+
+        with st.sidebar.expander("Diagnóstico de desempenho", expanded=False):
+            st.caption(f"Execução: {resumo['tempo_total_s']:.3f}s | "
+                       f"memória: {resumo['delta_memoria_mb']:+.1f} MB")
+            tabela = pd.DataFrame(resumo['secoes'])
+            if len(tabela):
+                st.dataframe(tabela.sort_values('tempo_s', ascending=False), hide_index=True)
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+
+# Faixas usadas nas variáveis categorizadas (mesmos limites dos pd.cut das seções de construção)
+BINS_IDADE = (0, 18, 30, 45, 60, 100)
+ROTULOS_IDADE = ('0-18', '19-30', '31-45', '46-60', '61+')
+BINS_RENDA = (0, 2000, 5000, 10000, 25000, 100000)
+ROTULOS_RENDA = ('Muito Baixa', 'Baixa', 'Média', 'Alta', 'Muito Alta')
+COLUNAS_DUMMIES = ('sexo', 'tipo_renda', 'educacao', 'estado_civil')
+MODOS_DESCONHECIDAS = ('ignorar', 'erro')
+
+
+def faixas(valores, bins, rotulos):
+    # Equivalente vetorizado de pd.cut(..., right=True): intervalos (bins[i-1], bins[i]]
+    bins = np.asarray(bins, dtype=np.float64)
+    posicao = np.searchsorted(bins, valores, side='left')
+    codigos = posicao - 1
+    codigos[(posicao < 1) | (posicao >= len(bins)) | np.isnan(valores)] = -1
+    return pd.Categorical.from_codes(codigos, categories=list(rotulos), ordered=True)
+
+
+def _fatorar(valores):
+    # Códigos inteiros e níveis distintos (sem os ausentes, que ficam com código -1)
+    if isinstance(valores.dtype, pd.CategoricalDtype):
+        return valores.cat.codes.to_numpy(), valores.cat.categories
+    return pd.factorize(valores)
+
+
+def vocabulario(valores):
+    """Níveis observados de uma coluna categórica, ordenados (como as colunas do pd.get_dummies)."""
+    codigos, niveis = _fatorar(valores)
+    if isinstance(valores.dtype, pd.CategoricalDtype):
+        # Só os níveis observados, como o pd.get_dummies faz
+        niveis = niveis[np.unique(codigos[codigos >= 0])]
+    return sorted(niveis.tolist())
+
+
+def nomes_dummies(categorias, drop_first=True):
+    inicio = 1 if drop_first else 0
+    return [f"{coluna}_{categoria}" for coluna, niveis in categorias.items() for categoria in niveis[inicio:]]
+
+
+def codificar_dummies(X, categorias, drop_first=True, esparso=False, desconhecidas='ignorar'):
+    """
+    Dummies de todas as colunas de `categorias` (coluna -> níveis do fit) em um único
+    passo: cada coluna vira códigos inteiros, deslocados para a posição da sua primeira
+    dummy, e a matriz é montada de uma vez a partir desses índices (CSR do SciPy com
+    `esparso=True`, senão uint8 denso). Níveis desconhecidos e ausentes não acendem
+    nenhuma dummy da coluna; com `desconhecidas='erro'`, níveis desconhecidos (não
+    nulos) levantam ValueError.
+    """
+    if desconhecidas not in MODOS_DESCONHECIDAS:
+        raise ValueError(f"desconhecidas deve ser um de {MODOS_DESCONHECIDAS}, recebido {desconhecidas!r}")
+    inicio = 1 if drop_first else 0
+    n = len(X)
+    posicoes = np.empty((n, len(categorias)), dtype=np.int32)
+    deslocamento = 0
+    for j, (coluna, niveis) in enumerate(categorias.items()):
+        # O vocabulário é casado só com os valores distintos; a coluna inteira sai de uma indexação
+        codigos, distintos = _fatorar(X[coluna])
+        no_vocabulario = pd.Index(niveis).get_indexer(distintos)
+        if desconhecidas == 'erro' and (no_vocabulario == -1).any():
+            raise ValueError(f"coluna {coluna!r}: níveis desconhecidos {sorted(distintos[no_vocabulario == -1])}")
+        # Coluna da dummy de cada valor distinto; -1 para o nível de referência e os desconhecidos,
+        # e o -1 extra no fim atende os ausentes (código -1 na fatoração)
+        tabela = np.where(no_vocabulario >= inicio, no_vocabulario - inicio + deslocamento, -1)
+        posicoes[:, j] = np.append(tabela, -1)[codigos]
+        deslocamento += max(len(niveis) - inicio, 0)
+
+    acesas = posicoes >= 0
+    if esparso:
+        # Linha a linha, as colunas já saem em ordem crescente: o CSR sai pronto, sem ordenar
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(acesas.sum(axis=1), out=indptr[1:])
+        indices = posicoes[acesas]
+        return sparse.csr_matrix((np.ones(len(indices), dtype=np.uint8), indices, indptr), shape=(n, deslocamento))
+    matriz = np.zeros((n, deslocamento), dtype=np.uint8)
+    linhas, colunas = np.nonzero(acesas)
+    matriz[linhas, posicoes[linhas, colunas]] = 1
+    return matriz
+
+
+class CodificadorDummies(BaseEstimator, TransformerMixin):
+    """
+    One-hot das colunas categóricas com vocabulário fixo: os níveis são aprendidos no
+    `fit` e o `transform` sempre devolve as mesmas colunas, em qualquer lote (inclusive
+    de uma linha só). A saída é uma matriz CSR do SciPy (ou uint8 densa com
+    `esparso=False`) que pode ir direto para LinearRegression, Ridge e Lasso.
+    Níveis desconhecidos viram uma linha zerada na coluna (`desconhecidas='ignorar'`)
+    ou levantam ValueError (`desconhecidas='erro'`).
+    """
+
+    def __init__(self, colunas=COLUNAS_DUMMIES, drop_first=True, esparso=True, desconhecidas='ignorar'):
+        self.colunas = colunas
+        self.drop_first = drop_first
+        self.esparso = esparso
+        self.desconhecidas = desconhecidas
+
+    def fit(self, X, y=None):
+        self.categorias_ = {coluna: vocabulario(X[coluna]) for coluna in self.colunas}
+        return self
+
+    def get_feature_names_out(self, input_features=None):
+        return np.array(nomes_dummies(self.categorias_, self.drop_first), dtype=object)
+
+    def transform(self, X):
+        return codificar_dummies(X, self.categorias_, self.drop_first, self.esparso, self.desconhecidas)
+
+
+class TransformadorRenda(BaseEstimator, TransformerMixin):
+    """
+    Constrói as variáveis derivadas do projeto em uma única passada sobre arrays NumPy:
+    'tempo_emprego' preenchido com a mediana de treino, 'renda_por_ano_emprego',
+    'pessoas_por_imovel', 'faixa_etaria', 'grupo_renda' e as dummies (drop_first)
+    das colunas categóricas. As categorias aprendidas no `fit` são reaproveitadas
+    no `transform`, então as colunas dummies não dependem das categorias presentes
+    no lote; categorias desconhecidas viram uma linha toda zerada.
+
+    Grupos de variáveis cujas colunas de entrada não existem no DataFrame (ex.:
+    'renda' em arquivos de pontuação) são simplesmente omitidos, e variáveis
+    derivadas que já vierem prontas na entrada são usadas como estão.
+    """
+
+    def __init__(self, colunas_dummies=COLUNAS_DUMMIES, drop_first=True):
+        self.colunas_dummies = colunas_dummies
+        self.drop_first = drop_first
+
+    def fit(self, X, y=None):
+        if 'tempo_emprego' in X.columns:
+            self.mediana_tempo_emprego_ = float(np.nanmedian(X['tempo_emprego'].to_numpy(dtype=np.float64)))
+        else:
+            self.mediana_tempo_emprego_ = np.nan
+        self.categorias_ = {coluna: vocabulario(X[coluna]) for coluna in self.colunas_dummies}
+        return self
+
+    def get_feature_names_out(self, input_features=None):
+        return np.array(
+            ['tempo_emprego', 'qt_pessoas_residencia', 'renda_por_ano_emprego', 'pessoas_por_imovel',
+             'faixa_etaria', 'grupo_renda'] + nomes_dummies(self.categorias_, self.drop_first),
+            dtype=object,
+        )
+
+    def transform(self, X):
+        colunas = {}
+
+        if 'tempo_emprego' in X.columns:
+            tempo_emprego = X['tempo_emprego'].to_numpy(dtype=np.float64, copy=True)
+            tempo_emprego[np.isnan(tempo_emprego)] = self.mediana_tempo_emprego_
+            colunas['tempo_emprego'] = tempo_emprego
+        if 'qt_pessoas_residencia' in X.columns:
+            colunas['qt_pessoas_residencia'] = X['qt_pessoas_residencia'].to_numpy(dtype=np.float64)
+
+        if 'renda_por_ano_emprego' in X.columns:
+            colunas['renda_por_ano_emprego'] = X['renda_por_ano_emprego'].to_numpy(dtype=np.float64)
+        elif 'renda' in X.columns and 'tempo_emprego' in colunas:
+            divisor = np.where(colunas['tempo_emprego'] == 0, 1.0, colunas['tempo_emprego'])
+            colunas['renda_por_ano_emprego'] = X['renda'].to_numpy(dtype=np.float64) / divisor
+
+        if 'pessoas_por_imovel' in X.columns:
+            colunas['pessoas_por_imovel'] = X['pessoas_por_imovel'].to_numpy(dtype=np.float64)
+        elif 'qt_pessoas_residencia' in colunas and 'posse_de_imovel' in X.columns:
+            posse = X['posse_de_imovel'].to_numpy().astype(np.int64)
+            colunas['pessoas_por_imovel'] = colunas['qt_pessoas_residencia'] / (posse + 1)
+
+        if 'idade' in X.columns:
+            colunas['faixa_etaria'] = faixas(X['idade'].to_numpy(dtype=np.float64), BINS_IDADE, ROTULOS_IDADE)
+        if 'renda' in X.columns:
+            colunas['grupo_renda'] = faixas(X['renda'].to_numpy(dtype=np.float64), BINS_RENDA, ROTULOS_RENDA)
+
+        if self.categorias_:
+            matriz = codificar_dummies(X, self.categorias_, self.drop_first)
+            colunas.update(zip(nomes_dummies(self.categorias_, self.drop_first), matriz.T))
+
+        return pd.DataFrame(colunas, index=X.index)
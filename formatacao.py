@@ -0,0 +1,3 @@
+def numero_br(valor, casas=2):
+    """Número no formato brasileiro usado nos textos das páginas: 49762513.19 -> '49.762.513,19'."""
+    return f"{valor:,.{casas}f}".replace(',', '_').replace('.', ',').replace('_', '.')
@@ -0,0 +1,84 @@
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+from matplotlib.figure import Figure
+
+# Limite de memória das imagens guardadas; as usadas há mais tempo saem primeiro
+LIMITE_BYTES = 64 * 1024 ** 2
+FORMATOS = ('png', 'svg')
+# Mesma resolução que o st.pyplot usa por padrão
+DPI = 200
+
+_cache = OrderedDict()
+_trava = threading.Lock()
+_estatisticas = {'acertos': 0, 'falhas': 0, 'descartes': 0}
+
+
+def versao_dataframe(df):
+    """Hash do conteúdo de um DataFrame pequeno (ex.: os dados de exemplo das seções)."""
+    return hashlib.sha256(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()).hexdigest()
+
+
+def _chave(nome, versao, formato, parametros):
+    return nome, versao, formato, json.dumps(parametros, sort_keys=True, default=str)
+
+
+def _tamanho_total():
+    return sum(len(imagem) for imagem in _cache.values())
+
+
+def imagem_grafico(nome, versao, desenhar, formato='png', limite_bytes=LIMITE_BYTES, **parametros):
+    """
+    Bytes da figura `nome` para a versão dos dados `versao` e os `parametros`
+    do gráfico. Na primeira vez `desenhar(fig, **parametros)` é chamado em uma
+    Figure nova (sem o estado global do pyplot); a figura é salva em PNG/SVG e
+    liberada, e as próximas chamadas devolvem os bytes guardados.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"formato deve ser um de {FORMATOS}, recebido {formato!r}")
+    chave = _chave(nome, versao, formato, parametros)
+    with _trava:
+        imagem = _cache.get(chave)
+        if imagem is not None:
+            _cache.move_to_end(chave)
+            _estatisticas['acertos'] += 1
+            return imagem
+
+    # Desenha fora da trava: outras sessões continuam servindo imagens prontas
+    fig = Figure(figsize=parametros.get('figsize'))
+    desenhar(fig, **{k: v for k, v in parametros.items() if k != 'figsize'})
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=formato, dpi=DPI, bbox_inches='tight')
+    fig.clear()
+    imagem = buffer.getvalue()
+
+    with _trava:
+        _estatisticas['falhas'] += 1
+        _cache[chave] = imagem
+        _cache.move_to_end(chave)
+        while len(_cache) > 1 and _tamanho_total() > limite_bytes:
+            _cache.popitem(last=False)
+            _estatisticas['descartes'] += 1
+    return imagem
+
+
+def exibir_grafico(nome, versao, desenhar, formato='png', **parametros):
+    """Mostra no Streamlit a figura de `imagem_grafico` (renderizada só quando muda)."""
+    import streamlit as st
+
+    imagem = imagem_grafico(nome, versao, desenhar, formato, **parametros)
+    st.image(imagem.decode() if formato == 'svg' else imagem, width='stretch')
+
+
+def estatisticas_graficos():
+    with _trava:
+        return {**_estatisticas, 'figuras': len(_cache), 'bytes': _tamanho_total()}
+
+
+def limpar_graficos():
+    with _trava:
+        _cache.clear()
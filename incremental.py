@@ -0,0 +1,226 @@
+import argparse
+import os
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression, Ridge
+
+from dados import CAMINHO_DADOS, COLUNA_PARTICAO, ler_csv, versao_dados
+from modelo import ALVO, COLUNAS_TREINO, FEATURES, novo_transformador, preparar_features
+
+# Estado acumulado (estatísticas por mês de data_ref + transformador) entre execuções
+CAMINHO_ESTATISTICAS = os.path.join('modelos', 'estatisticas_renda.joblib')
+TAMANHO_LOTE = 100_000
+
+
+class EstatisticasSuficientes:
+    """
+    Estatísticas suficientes da regressão linear com intercepto: número de
+    linhas, médias e co-momentos centrados de [X, y]. Guardar os co-momentos
+    centrados (em vez de XᵀX bruto) e combiná-los pela fórmula de Chan evita a
+    perda de precisão com variáveis na escala da renda.
+    """
+
+    def __init__(self, n_features):
+        self.n = 0
+        self.media = np.zeros(n_features + 1)
+        self.comomento = np.zeros((n_features + 1, n_features + 1))
+
+    @classmethod
+    def de_matriz(cls, X, y):
+        Z = np.column_stack([np.asarray(X, dtype=np.float64), np.asarray(y, dtype=np.float64)])
+        estatisticas = cls(Z.shape[1] - 1)
+        estatisticas.n = len(Z)
+        if len(Z):
+            estatisticas.media = Z.mean(axis=0)
+            centrado = Z - estatisticas.media
+            estatisticas.comomento = centrado.T @ centrado
+        return estatisticas
+
+    def combinar(self, outra):
+        """Agrega outra parte dos dados (atualiza e devolve `self`)."""
+        if outra.n == 0:
+            return self
+        n = self.n + outra.n
+        delta = outra.media - self.media
+        self.comomento = self.comomento + outra.comomento + np.outer(delta, delta) * (self.n * outra.n / n)
+        self.media = self.media + delta * (outra.n / n)
+        self.n = n
+        return self
+
+    def resolver(self, alpha=0.0):
+        """
+        Coeficientes e intercepto de mínimos quadrados (alpha=0) ou de Ridge
+        (penalidade alpha·‖β‖², sem penalizar o intercepto, como no sklearn).
+        """
+        if self.n == 0:
+            raise ValueError("nenhuma linha acumulada")
+        sxx = self.comomento[:-1, :-1]
+        sxy = self.comomento[:-1, -1]
+        if alpha > 0:
+            coeficientes = np.linalg.solve(sxx + alpha * np.eye(len(sxx)), sxy)
+        else:
+            coeficientes = np.linalg.lstsq(sxx, sxy, rcond=None)[0]
+        intercepto = self.media[-1] - self.media[:-1] @ coeficientes
+        return coeficientes, float(intercepto)
+
+
+class TreinoIncremental:
+    """
+    Acumula estatísticas suficientes por partição de `data_ref`. Cada arquivo
+    (identificado pelo hash do conteúdo) é lido uma única vez: os próximos treinos
+    somam as partições guardadas e resolvem OLS ou Ridge (qualquer alpha) em forma
+    fechada. Linhas de um mês já acumulado, vindas de outro arquivo, são somadas a
+    ele; por isso cada arquivo novo deve trazer só linhas ainda não lidas. O caminho
+    de cada arquivo lido fica guardado para que `verificar` refaça o ajuste com todos.
+    O transformador (mediana de 'tempo_emprego') é ajustado no primeiro lote e
+    fica fixo, pois as estatísticas guardadas dependem dele.
+    """
+
+    def __init__(self, transformador=None, features=FEATURES):
+        self.transformador = transformador
+        self.features = list(features)
+        self.particoes = {}
+        self.arquivos = {}  # hash do conteúdo -> caminho absoluto
+
+    def adicionar(self, df):
+        """Acumula um lote, somando-o às partições já existentes. Devolve as linhas usadas."""
+        if not len(df):
+            return 0
+        if self.transformador is None:
+            self.transformador = novo_transformador().fit(df)
+        X = preparar_features(df, self.transformador)[self.features].to_numpy(dtype=np.float64)
+        y = df[ALVO].to_numpy(dtype=np.float64)
+        particoes = df[COLUNA_PARTICAO].to_numpy()
+        for particao in np.unique(particoes):
+            linhas = particoes == particao
+            parte = EstatisticasSuficientes.de_matriz(X[linhas], y[linhas])
+            chave = str(np.datetime_as_string(particao, unit='D'))
+            if chave in self.particoes:
+                self.particoes[chave].combinar(parte)
+            else:
+                self.particoes[chave] = parte
+        return len(df)
+
+    def adicionar_arquivo(self, caminho, tamanho_lote=TAMANHO_LOTE):
+        """
+        Lê o CSV em lotes e devolve as linhas novas. Um arquivo já lido (mesmo
+        conteúdo) é pulado; linhas de meses já acumulados são combinadas a eles, com
+        um aviso, em vez de descartadas.
+        """
+        versao = versao_dados(caminho)
+        if versao in self.arquivos:
+            return 0
+        ja_lidos = set(self.particoes)
+        atualizados = set()
+        linhas = 0
+        for lote in ler_csv(caminho, usecols=[COLUNA_PARTICAO, *COLUNAS_TREINO], chunksize=tamanho_lote):
+            meses = np.datetime_as_string(lote[COLUNA_PARTICAO].unique().to_numpy(dtype='datetime64[D]'), unit='D')
+            atualizados.update(ja_lidos.intersection(meses.tolist()))
+            linhas += self.adicionar(lote)
+        self.arquivos[versao] = os.path.abspath(caminho)
+        if atualizados:
+            warnings.warn(f"{caminho}: linhas de meses já acumulados foram combinadas a eles "
+                          f"({', '.join(sorted(atualizados))})", stacklevel=2)
+        return linhas
+
+    def total(self, particoes=None):
+        """Estatísticas agregadas de todas as partições (ou só das indicadas)."""
+        chaves = sorted(self.particoes) if particoes is None else particoes
+        total = EstatisticasSuficientes(len(self.features))
+        for chave in chaves:
+            total.combinar(self.particoes[chave])
+        return total
+
+    def modelo(self, alpha=0.0, particoes=None):
+        """LinearRegression (alpha=0) ou Ridge(alpha) já ajustado, pronto para o `predict` do sklearn."""
+        coeficientes, intercepto = self.total(particoes).resolver(alpha)
+        modelo = LinearRegression() if alpha == 0 else Ridge(alpha=alpha)
+        modelo.coef_ = coeficientes
+        modelo.intercept_ = intercepto
+        modelo.n_features_in_ = len(self.features)
+        modelo.feature_names_in_ = np.array(self.features, dtype=object)
+        return modelo
+
+    def salvar(self, caminho=CAMINHO_ESTATISTICAS):
+        os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+        temporario = f"{caminho}.tmp"
+        joblib.dump(self, temporario)
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def carregar(cls, caminho=CAMINHO_ESTATISTICAS):
+        """Estado gravado em `caminho` ou um treino vazio, se o arquivo não existir."""
+        if not os.path.exists(caminho):
+            return cls()
+        treino = joblib.load(caminho)
+        # Estados gravados antes do registro de arquivos lidos (ou só com os hashes): caminhos desconhecidos
+        arquivos = getattr(treino, 'arquivos', {})
+        treino.arquivos = arquivos if isinstance(arquivos, dict) else dict.fromkeys(arquivos)
+        return treino
+
+
+def verificar(treino, alphas=(0.0, 1.0, 100.0)):
+    """
+    Compara os coeficientes incrementais com o ajuste em memória sobre todos os
+    arquivos já acumulados no estado (não só os da execução corrente). Levanta
+    ValueError se algum deles não puder ser relido exatamente como foi somado.
+    """
+    if not treino.arquivos:
+        raise ValueError("nenhum arquivo registrado no estado")
+    for versao, caminho in treino.arquivos.items():
+        if caminho is None or not os.path.exists(caminho) or versao_dados(caminho) != versao:
+            raise ValueError(f"{caminho or versao[:12]}: arquivo acumulado ausente ou alterado desde a leitura")
+    df = pd.concat([ler_csv(caminho, usecols=[COLUNA_PARTICAO, *COLUNAS_TREINO])
+                    for caminho in treino.arquivos.values()])
+    if len(df) != treino.total().n:
+        raise ValueError(f"os arquivos registrados têm {len(df)} linhas, mas o estado acumulou {treino.total().n}")
+    X = preparar_features(df, treino.transformador)[treino.features]
+    y = df[ALVO]
+    diferencas = {}
+    for alpha in alphas:
+        referencia = LinearRegression() if alpha == 0 else Ridge(alpha=alpha)
+        referencia.fit(X, y)
+        incremental = treino.modelo(alpha)
+        diferencas[alpha] = max(
+            float(np.max(np.abs(referencia.coef_ - incremental.coef_) / np.maximum(np.abs(referencia.coef_), 1e-12))),
+            abs(referencia.intercept_ - incremental.intercept_) / max(abs(referencia.intercept_), 1e-12),
+        )
+    return diferencas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Treino incremental por estatísticas suficientes (OLS/Ridge).")
+    parser.add_argument('dados', nargs='*', default=[CAMINHO_DADOS], help="CSVs com linhas ainda não lidas")
+    parser.add_argument('--estatisticas', default=CAMINHO_ESTATISTICAS, help="estado acumulado (.joblib)")
+    parser.add_argument('--alpha', type=float, default=0.0, help="0 para OLS; > 0 para Ridge")
+    parser.add_argument('--tamanho-lote', type=int, default=TAMANHO_LOTE)
+    parser.add_argument('--verificar', action='store_true',
+                        help="compara com o ajuste em memória sobre todos os arquivos acumulados "
+                             "(requer que eles caibam na memória)")
+    args = parser.parse_args(argv)
+
+    treino = TreinoIncremental.carregar(args.estatisticas)
+    for caminho in args.dados:
+        linhas = treino.adicionar_arquivo(caminho, args.tamanho_lote)
+        print(f"{caminho}: {linhas} linhas novas")
+    treino.salvar(args.estatisticas)
+
+    total = treino.total()
+    print(f"{len(treino.particoes)} meses, {total.n} linhas acumuladas em {args.estatisticas}")
+    modelo = treino.modelo(args.alpha)
+    print(f"  intercepto={modelo.intercept_:.4f}, " + ", ".join(
+        f"{feature}={coeficiente:.6f}" for feature, coeficiente in zip(treino.features, modelo.coef_)))
+    if args.verificar:
+        try:
+            diferencas = verificar(treino)
+        except ValueError as erro:
+            parser.error(f"não é possível verificar: {erro}")
+        for alpha, diferenca in diferencas.items():
+            print(f"  alpha={alpha:g}: maior diferença relativa para o ajuste em memória {diferenca:.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+import math
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+
+from modelo import carregar_modelo
+
+# Limites padrão de cada micro-lote: o que vier primeiro fecha o lote
+TAMANHO_MAXIMO_LOTE = 256
+ESPERA_MAXIMA_S = 0.001
+# Previsões guardadas no cache compartilhado do processo (cada uma ocupa ~100 bytes)
+CAPACIDADE_CACHE_PREVISOES = 100_000
+
+
+# Textos aceitos para atributos booleanos vindos de JSON/CSV
+TEXTOS_BOOLEANOS = {'true': True, 'false': False, '1': True, '0': False}
+
+
+def booleano(valor, campo='valor'):
+    """
+    Interpreta um atributo booleano: bool (inclusive do NumPy), 0/1 ou os textos
+    'true'/'false'/'1'/'0' (sem diferenciar maiúsculas). Qualquer outra coisa levanta
+    ValueError, em vez de virar True por ser um texto não vazio.
+    """
+    if isinstance(valor, (bool, np.bool_)):
+        return bool(valor)
+    if isinstance(valor, str) and valor.strip().lower() in TEXTOS_BOOLEANOS:
+        return TEXTOS_BOOLEANOS[valor.strip().lower()]
+    if isinstance(valor, (int, float, np.integer, np.floating)) and valor in (0, 1):
+        return bool(valor)
+    raise ValueError(f"{campo!r} deve ser booleano (true/false ou 0/1), recebido {valor!r}")
+
+
+class ModeloLinearCompacto:
+    """
+    Representação mínima de um modelo linear treinado: vetor de coeficientes,
+    intercepto e o preparo das variáveis feito direto sobre floats, sem montar
+    DataFrame nem passar pelo `predict` do sklearn.
+    """
+
+    def __init__(self, coeficientes, intercepto, features, mediana_tempo_emprego, versao=None):
+        self.coeficientes = np.ascontiguousarray(coeficientes, dtype=np.float64)
+        self.intercepto = float(intercepto)
+        self.features = list(features)
+        self.mediana_tempo_emprego = float(mediana_tempo_emprego)
+        self.versao = versao
+
+    @classmethod
+    def do_artefato(cls, artefato):
+        modelo = artefato['modelo']
+        if not hasattr(modelo, 'coef_'):
+            raise TypeError(f"{type(modelo).__name__} não é um modelo linear; use o predict do sklearn")
+        return cls(modelo.coef_, modelo.intercept_, artefato['features'],
+                   artefato['transformador'].mediana_tempo_emprego_, artefato['versao'])
+
+    def vetor(self, registro):
+        """
+        Monta a linha de variáveis de um cliente (dict) com as mesmas regras do
+        TransformadorRenda: mediana para 'tempo_emprego' ausente e variáveis
+        derivadas calculadas a partir dos atributos brutos quando não vierem prontas.
+        """
+        # Convertido uma vez: o mesmo float entra na variável e na divisão da renda
+        tempo_emprego = registro.get('tempo_emprego')
+        tempo_emprego = math.nan if tempo_emprego is None else float(tempo_emprego)
+        if math.isnan(tempo_emprego):
+            tempo_emprego = self.mediana_tempo_emprego
+        qt_pessoas = float(registro['qt_pessoas_residencia'])
+        valores = {'tempo_emprego': tempo_emprego, 'qt_pessoas_residencia': qt_pessoas}
+        if 'renda_por_ano_emprego' in registro:
+            valores['renda_por_ano_emprego'] = float(registro['renda_por_ano_emprego'])
+        else:
+            valores['renda_por_ano_emprego'] = float(registro['renda']) / (tempo_emprego if tempo_emprego != 0 else 1.0)
+        if 'pessoas_por_imovel' in registro:
+            valores['pessoas_por_imovel'] = float(registro['pessoas_por_imovel'])
+        else:
+            posse = booleano(registro['posse_de_imovel'], 'posse_de_imovel')
+            valores['pessoas_por_imovel'] = qt_pessoas / (int(posse) + 1)
+        return [valores[feature] for feature in self.features]
+
+    def matriz(self, registros):
+        return np.array([self.vetor(registro) for registro in registros], dtype=np.float64)
+
+    def prever_matriz(self, X):
+        """Uma multiplicação matriz-vetor para todas as linhas de X (colunas na ordem de `features`)."""
+        return X @ self.coeficientes + self.intercepto
+
+    def prever_registros(self, registros):
+        return self.prever_matriz(self.matriz(registros))
+
+
+_compactos = {}
+_trava_compactos = threading.Lock()
+
+
+def modelo_compacto(artefato=None):
+    """ModeloLinearCompacto do artefato (o carregado por `carregar_modelo`, por padrão), criado uma vez por versão."""
+    if artefato is None:
+        artefato = carregar_modelo()
+    with _trava_compactos:
+        compacto = _compactos.get(artefato['versao'])
+        if compacto is None:
+            compacto = _compactos[artefato['versao']] = ModeloLinearCompacto.do_artefato(artefato)
+        return compacto
+
+
+def vetores_canonicos(X):
+    """
+    Linhas de X como float64 contíguo, com -0.0 e os NaN normalizados: entradas que
+    representam o mesmo cliente (5 ou 5.0, -0.0 ou 0.0) viram os mesmos bytes.
+    """
+    X = np.array(np.atleast_2d(X), dtype=np.float64, order='C')
+    X[X == 0] = 0.0
+    X[np.isnan(X)] = np.nan
+    return X
+
+
+class CachePrevisoes:
+    """
+    Cache LRU de previsões, chaveado pelos bytes canônicos do vetor de variáveis.
+    Guarda previsões de uma única versão de modelo: a primeira chamada com outra
+    versão (um novo artefato carregado) esvazia o cache. Linhas repetidas dentro
+    do mesmo lote são calculadas uma só vez.
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_CACHE_PREVISOES):
+        self.capacidade = capacidade
+        self.versao = None
+        self._itens = OrderedDict()
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+        self.invalidacoes = 0
+
+    def _trocar_versao(self, versao):
+        if versao != self.versao:
+            if self.versao is not None:
+                self.invalidacoes += 1
+            self._itens.clear()
+            self.versao = versao
+
+    def prever(self, versao, X, calcular):
+        """
+        Previsões de `versao` para as linhas de X: as que já estão no cache saem
+        dele; as demais (sem repetição) são calculadas por `calcular(matriz)` em
+        uma única chamada e guardadas.
+        """
+        X = vetores_canonicos(X)
+        linhas = np.ascontiguousarray(X).view(np.dtype((np.void, X.dtype.itemsize * X.shape[1]))).ravel()
+        if len(linhas) > 1:
+            unicas, inversa = np.unique(linhas, return_inverse=True)
+        else:
+            unicas, inversa = linhas, np.zeros(len(linhas), dtype=np.intp)
+        chaves = [linha.tobytes() for linha in unicas]
+
+        valores = np.empty(len(chaves))
+        faltando = []
+        with self._trava:
+            self._trocar_versao(versao)
+            for i, chave in enumerate(chaves):
+                valor = self._itens.get(chave)
+                if valor is None:
+                    faltando.append(i)
+                else:
+                    self._itens.move_to_end(chave)
+                    valores[i] = valor
+            self.acertos += len(linhas) - len(faltando)
+            self.falhas += len(faltando)
+
+        if faltando:
+            matriz = unicas[faltando].view(np.float64).reshape(len(faltando), X.shape[1])
+            valores[faltando] = calcular(matriz)
+            with self._trava:
+                # Um novo artefato pode ter sido carregado enquanto calculávamos
+                if self.versao == versao:
+                    for i in faltando:
+                        self._itens[chaves[i]] = float(valores[i])
+                    excesso = len(self._itens) - self.capacidade
+                    for _ in range(max(excesso, 0)):
+                        self._itens.popitem(last=False)
+                    self.descartes += max(excesso, 0)
+        return valores[inversa]
+
+    def estatisticas(self):
+        with self._trava:
+            consultas = self.acertos + self.falhas
+            return {
+                'versao_modelo': self.versao,
+                'itens': len(self._itens),
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+                'descartes': self.descartes,
+                'invalidacoes': self.invalidacoes,
+            }
+
+    def limpar(self):
+        with self._trava:
+            self._itens.clear()
+
+
+_cache_previsoes = CachePrevisoes()
+
+
+def cache_previsoes():
+    """Cache de previsões compartilhado pelo processo (sessões do Streamlit, lote e serviço)."""
+    return _cache_previsoes
+
+
+class MotorMicroLote:
+    """
+    Agrupa requisições individuais vindas de várias threads em micro-lotes,
+    limitados por tamanho (`tamanho_maximo`) ou por tempo de espera
+    (`espera_maxima_s`), e pontua cada lote com uma única multiplicação.
+    """
+
+    def __init__(self, compacto, tamanho_maximo=TAMANHO_MAXIMO_LOTE, espera_maxima_s=ESPERA_MAXIMA_S):
+        self.compacto = compacto
+        self.tamanho_maximo = tamanho_maximo
+        self.espera_maxima_s = espera_maxima_s
+        self._fila = queue.Queue()
+        self._parar = threading.Event()
+        self.lotes = 0
+        self.previsoes = 0
+        self._thread = threading.Thread(target=self._executar, name='motor-micro-lote', daemon=True)
+        self._thread.start()
+
+    def submeter(self, registro):
+        """Enfileira um cliente e devolve um Future com a renda prevista."""
+        try:
+            # O vetor é montado na thread de quem chama: erros de entrada voltam direto para ela
+            vetor = self.compacto.vetor(registro)
+        except (KeyError, TypeError, ValueError) as erro:
+            futuro = Future()
+            futuro.set_exception(erro)
+            return futuro
+        return self.submeter_vetor(vetor)
+
+    def submeter_vetor(self, vetor):
+        """Enfileira um vetor já montado (colunas na ordem de `features`)."""
+        futuro = Future()
+        self._fila.put((vetor, futuro))
+        if self._parar.is_set():
+            # Chegou depois do encerramento: ninguém mais vai pontuar a fila
+            self._drenar()
+        return futuro
+
+    def prever(self, registro, timeout=None):
+        return self.submeter(registro).result(timeout)
+
+    def prever_vetor(self, vetor, timeout=None):
+        return self.submeter_vetor(vetor).result(timeout)
+
+    def _executar(self):
+        while not self._parar.is_set():
+            try:
+                primeiro = self._fila.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            lote = [primeiro]
+            limite = time.perf_counter() + self.espera_maxima_s
+            while len(lote) < self.tamanho_maximo:
+                restante = limite - time.perf_counter()
+                if restante <= 0:
+                    break
+                try:
+                    lote.append(self._fila.get(timeout=restante))
+                except queue.Empty:
+                    break
+            self._pontuar(lote)
+            self.lotes += 1
+            self.previsoes += len(lote)
+
+    def _pontuar(self, lote):
+        # Uma falha no lote não pode derrubar a thread: cada Future recebe o resultado ou a exceção
+        try:
+            previsoes = self.compacto.prever_matriz(np.array([vetor for vetor, _ in lote], dtype=np.float64))
+        except Exception as erro:
+            if len(lote) == 1:
+                lote[0][1].set_exception(erro)
+            else:
+                # Repontua um a um para que só os vetores inválidos recebam o erro
+                for item in lote:
+                    self._pontuar([item])
+            return
+        for (_, futuro), previsao in zip(lote, previsoes):
+            futuro.set_result(float(previsao))
+
+    def _drenar(self):
+        while True:
+            try:
+                _, futuro = self._fila.get_nowait()
+            except queue.Empty:
+                return
+            futuro.set_exception(RuntimeError("motor de micro-lotes encerrado"))
+
+    def encerrar(self):
+        """Para a thread; pedidos que ficaram na fila recebem RuntimeError em vez de esperar para sempre."""
+        self._parar.set()
+        self._thread.join()
+        self._drenar()
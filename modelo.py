@@ -0,0 +1,244 @@
+import argparse
+import os
+import threading
+from datetime import datetime, timezone
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import Lasso, LinearRegression, Ridge
+from sklearn.model_selection import GridSearchCV, train_test_split
+
+from busca import GRADE_ALPHA_DENSA, buscar_alpha
+from dados import CAMINHO_DADOS, carregar_periodo, mes, versao_dados
+from features import TransformadorRenda
+from orquestrador import comparar_modelos
+from validacao import metricas as calcular_metricas
+
+# Caminho padrão do artefato treinado
+CAMINHO_MODELO = os.path.join('modelos', 'modelo_renda.joblib')
+
+# Versão do formato do artefato: incrementar quando a estrutura do dicionário mudar
+VERSAO_FORMATO = 4
+
+# Variáveis usadas pelo modelo, na mesma ordem do formulário de predição
+FEATURES = ['tempo_emprego', 'qt_pessoas_residencia', 'renda_por_ano_emprego', 'pessoas_por_imovel']
+ALVO = 'renda'
+# Colunas lidas do arquivo de dados para o treino (projeção no Parquet)
+COLUNAS_TREINO = ['tempo_emprego', 'qt_pessoas_residencia', 'posse_de_imovel', ALVO]
+GRADE_ALPHA = [0.001, 0.01, 0.1, 1, 10, 100]
+MODOS_BUSCA = ('caminho', 'grade', 'densa')
+# Etapas do treino, na ordem em que `treinar` as reporta ao callback de progresso
+ETAPAS_TREINO = {
+    'dados': "Carga e preparo dos dados",
+    'ajuste': "Regressão Linear e Lasso",
+    'busca_ridge': "Busca de alpha do Ridge",
+    'busca_lasso': "Busca de alpha do Lasso",
+    'comparacao': "Validação cruzada dos modelos",
+    'gravacao': "Gravação do artefato",
+}
+
+_cache_modelo = {}
+_trava = threading.Lock()
+
+
+def novo_transformador():
+    """Transformador usado pelo modelo: só as variáveis numéricas derivadas, sem dummies."""
+    return TransformadorRenda(colunas_dummies=())
+
+
+def preparar_features(df, transformador):
+    """Aplica o transformador ajustado no treino e devolve as colunas de `FEATURES`."""
+    return transformador.transform(df)[FEATURES]
+
+
+def _avaliar(modelos, X_test, y_test):
+    """MSE, R² e MAE de cada modelo (nome -> ajustado) no teste, calculados juntos sobre as previsões empilhadas."""
+    previsoes = np.column_stack([modelo.predict(X_test) for modelo in modelos.values()])
+    resultado = calcular_metricas(y_test, previsoes)
+    return {nome: {metrica: float(resultado[metrica][j]) for metrica in ('mse', 'r2', 'mae')}
+            for j, nome in enumerate(modelos)}
+
+
+def buscar_hiperparametros(X_train, y_train, tipo, modo_busca='caminho', progresso=None):
+    """
+    Busca o alpha de Ridge/Lasso com cv=5. O modo 'caminho' usa `busca.buscar_alpha`
+    (folds em paralelo, caminho de regularização e cache em disco); o modo 'grade'
+    mantém o GridSearchCV sequencial original. O modo 'densa' avalia o Ridge na
+    grade de 300 alphas de `GRADE_ALPHA_DENSA` (uma SVD por fold; o Lasso segue
+    como no modo 'caminho'). `progresso(concluidos, total)` acompanha os folds
+    (no modo 'grade', só o fim da busca).
+    """
+    if modo_busca == 'densa' and tipo == 'ridge':
+        return buscar_alpha(X_train, y_train, tipo, GRADE_ALPHA_DENSA, cv=5, progresso=progresso)
+    if modo_busca in ('caminho', 'densa'):
+        return buscar_alpha(X_train, y_train, tipo, GRADE_ALPHA, cv=5, progresso=progresso)
+    if modo_busca == 'grade':
+        estimador = Ridge() if tipo == 'ridge' else Lasso()
+        grid = GridSearchCV(estimador, {'alpha': GRADE_ALPHA}, cv=5, scoring='neg_mean_squared_error')
+        grid.fit(X_train, y_train)
+        if progresso is not None:
+            progresso(1, 1)
+        return grid
+    raise ValueError(f"modo_busca deve ser um de {MODOS_BUSCA}, recebido {modo_busca!r}")
+
+
+def treinar(caminho_dados=CAMINHO_DADOS, caminho_modelo=CAMINHO_MODELO, test_size=0.3, random_state=42,
+            modo_busca='caminho', n_processos=-1, inicio=None, fim=None, progresso=None):
+    """
+    Ajusta o pipeline uma única vez (Regressão Linear, Lasso e as buscas de alpha
+    de Ridge e Lasso) e grava o artefato versionado em `caminho_modelo`, junto com
+    a tabela de comparação dos modelos por validação cruzada no treino.
+    Com `inicio`/`fim`, treina só nos meses de `data_ref` do intervalo.
+
+    `progresso(etapa, concluidos, total)`, se informado, é chamado no início de cada
+    etapa de `ETAPAS_TREINO` e a cada fold concluído; uma exceção levantada por ele
+    interrompe o treino sem gravar nada (o artefato anterior continua valendo).
+    """
+    if progresso is None:
+        def progresso(etapa, concluidos, total):
+            pass
+
+    progresso('dados', 0, 1)
+    df = carregar_periodo(caminho_dados, inicio, fim, colunas=COLUNAS_TREINO)
+    treino, teste = train_test_split(df, test_size=test_size, random_state=random_state)
+
+    # O transformador (mediana de 'tempo_emprego' inclusa) é ajustado só no treino e
+    # gravado no artefato, garantindo o mesmo preparo na predição
+    transformador = novo_transformador().fit(treino)
+    X_train = preparar_features(treino, transformador)
+    X_test = preparar_features(teste, transformador)
+    y_train, y_test = treino[ALVO], teste[ALVO]
+
+    progresso('ajuste', 0, 2)
+    modelo = LinearRegression().fit(X_train, y_train)
+    progresso('ajuste', 1, 2)
+    lasso_model = Lasso(alpha=1.0).fit(X_train, y_train)
+    progresso('ajuste', 2, 2)
+    progresso('busca_ridge', 0, 5)
+    grid_ridge = buscar_hiperparametros(X_train, y_train, 'ridge', modo_busca,
+                                        lambda feitos, total: progresso('busca_ridge', feitos, total))
+    progresso('busca_lasso', 0, 5)
+    grid_lasso = buscar_hiperparametros(X_train, y_train, 'lasso', modo_busca,
+                                        lambda feitos, total: progresso('busca_lasso', feitos, total))
+
+    teste_modelos = _avaliar({
+        'linear': modelo,
+        'lasso': lasso_model,
+        'ridge_grid': grid_ridge.best_estimator_,
+        'lasso_grid': grid_lasso.best_estimator_,
+    }, X_test, y_test)
+    metricas = {
+        'linear': teste_modelos['linear'],
+        'lasso': teste_modelos['lasso'],
+        'ridge_grid': {
+            'melhor_alpha': grid_ridge.best_params_['alpha'],
+            'melhor_mse': float(-grid_ridge.best_score_),
+            **teste_modelos['ridge_grid'],
+        },
+        'lasso_grid': {
+            'melhor_alpha': grid_lasso.best_params_['alpha'],
+            'melhor_mse': float(-grid_lasso.best_score_),
+            **teste_modelos['lasso_grid'],
+        },
+    }
+
+    # Os mesmos quatro modelos (com os alphas escolhidos) validados em paralelo no treino
+    progresso('comparacao', 0, 20)
+    comparacao = comparar_modelos(X_train, y_train, [
+        ('linear', LinearRegression(), FEATURES),
+        ('lasso', Lasso(alpha=1.0), FEATURES),
+        ('ridge_grid', Ridge(alpha=grid_ridge.best_params_['alpha']), FEATURES),
+        ('lasso_grid', Lasso(alpha=grid_lasso.best_params_['alpha']), FEATURES),
+    ], n_processos=n_processos, progresso=lambda feitos, total: progresso('comparacao', feitos, total))
+
+    hash_dados = versao_dados(caminho_dados)
+    treinado_em = datetime.now(timezone.utc)
+    artefato = {
+        'versao_formato': VERSAO_FORMATO,
+        'versao': f"{treinado_em:%Y%m%dT%H%M%S}-{hash_dados[:8]}",
+        'versao_dados': hash_dados,
+        'treinado_em': treinado_em.isoformat(),
+        'modelo': modelo,
+        'features': list(FEATURES),
+        'transformador': transformador,
+        'preprocessamento': {'mediana_tempo_emprego': transformador.mediana_tempo_emprego_},
+        'coeficientes': dict(zip(FEATURES, map(float, modelo.coef_))),
+        'metricas': metricas,
+        'comparacao': comparacao,
+        'periodo': {'inicio': None if inicio is None else str(mes(inicio)),
+                    'fim': None if fim is None else str(mes(fim))},
+        'tamanho_treino': len(X_train),
+        'tamanho_teste': len(X_test),
+    }
+    progresso('gravacao', 0, 1)
+    salvar_artefato(artefato, caminho_modelo)
+    return artefato
+
+
+def salvar_artefato(artefato, caminho_modelo=CAMINHO_MODELO):
+    # Grava em arquivo temporário e renomeia: leitores nunca veem um artefato pela metade
+    os.makedirs(os.path.dirname(caminho_modelo) or '.', exist_ok=True)
+    temporario = f"{caminho_modelo}.tmp"
+    joblib.dump(artefato, temporario)
+    os.replace(temporario, caminho_modelo)
+
+
+def carregar_modelo(caminho_modelo=CAMINHO_MODELO):
+    """
+    Carrega o artefato uma vez por processo. Se o arquivo for substituído por um
+    novo treino, a próxima chamada carrega a nova versão.
+    """
+    caminho_modelo = os.path.abspath(caminho_modelo)
+    with _trava:
+        mtime = os.stat(caminho_modelo).st_mtime_ns
+        entrada = _cache_modelo.get(caminho_modelo)
+        if entrada is None or entrada[0] != mtime:
+            artefato = joblib.load(caminho_modelo)
+            if artefato.get('versao_formato') != VERSAO_FORMATO:
+                raise ValueError(
+                    f"Artefato {caminho_modelo} tem formato {artefato.get('versao_formato')}, "
+                    f"esperado {VERSAO_FORMATO}. Treine novamente com `python modelo.py`."
+                )
+            entrada = (mtime, artefato)
+            _cache_modelo[caminho_modelo] = entrada
+        return entrada[1]
+
+
+def carregar_ou_treinar(caminho_dados=CAMINHO_DADOS, caminho_modelo=CAMINHO_MODELO):
+    """Carrega o artefato; treina antes se ele não existir ou estiver em um formato antigo."""
+    try:
+        return carregar_modelo(caminho_modelo)
+    except (FileNotFoundError, ValueError):
+        treinar(caminho_dados, caminho_modelo)
+        return carregar_modelo(caminho_modelo)
+
+
+def prever(X, artefato=None):
+    """Prevê a renda para uma matriz (ou DataFrame) com as colunas de `FEATURES`."""
+    if artefato is None:
+        artefato = carregar_modelo()
+    if not isinstance(X, pd.DataFrame):
+        X = pd.DataFrame(np.atleast_2d(X), columns=artefato['features'])
+    return artefato['modelo'].predict(X[artefato['features']])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Treina o modelo de previsão de renda e grava o artefato.")
+    parser.add_argument('--dados', default=CAMINHO_DADOS, help="CSV de entrada")
+    parser.add_argument('--saida', default=CAMINHO_MODELO, help="caminho do artefato .joblib")
+    parser.add_argument('--busca', choices=MODOS_BUSCA, default='caminho',
+                        help="busca de alpha: 'caminho' (paralela, com cache), 'grade' (GridSearchCV) "
+                             "ou 'densa' (Ridge em 300 alphas)")
+    parser.add_argument('--inicio', help="primeiro mês de data_ref do treino (AAAA-MM)")
+    parser.add_argument('--fim', help="último mês de data_ref do treino (AAAA-MM)")
+    args = parser.parse_args(argv)
+
+    artefato = treinar(args.dados, args.saida, modo_busca=args.busca, inicio=args.inicio, fim=args.fim)
+    print(f"Modelo {artefato['versao']} gravado em {args.saida}")
+    for nome, valores in artefato['metricas'].items():
+        print(f"  {nome}: " + ", ".join(f"{k}={v:.4f}" for k, v in valores.items()))
+
+
+if __name__ == '__main__':
+    main()
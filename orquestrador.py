@@ -0,0 +1,151 @@
+import argparse
+import contextlib
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import Lasso, LinearRegression, Ridge
+
+from validacao import folds_kfold, metricas_por_fold
+
+# Candidatos padrão: (nome, estimador, features). features=None usa todas as colunas de X
+CANDIDATOS = [
+    ('linear', LinearRegression(), None),
+    ('ridge', Ridge(alpha=1.0), None),
+    ('lasso', Lasso(alpha=1.0), None),
+]
+# Modelos de árvore: mesmo formato, basta somá-los à lista de candidatos
+CANDIDATOS_ARVORES = [
+    ('hist_gradient_boosting', HistGradientBoostingRegressor(random_state=42), None),
+    ('random_forest', RandomForestRegressor(n_estimators=100, min_samples_leaf=20, n_jobs=1, random_state=42), None),
+]
+
+# Memória compartilhada do sistema (tmpfs) quando existir; senão, o diretório temporário padrão
+DIRETORIO_COMPARTILHADO = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+@contextlib.contextmanager
+def matrizes_compartilhadas(**matrizes):
+    """
+    Grava cada matriz uma única vez em um arquivo .npy na memória compartilhada e
+    devolve memmaps somente leitura. Passados ao joblib, os memmaps seguem para os
+    processos como caminho + offset (sem cópia nem pickle dos dados), e todos os
+    workers leem as mesmas páginas. Os arquivos são apagados na saída do bloco.
+    """
+    diretorio = tempfile.mkdtemp(prefix='renda_orquestrador_', dir=DIRETORIO_COMPARTILHADO)
+    try:
+        mapas = {}
+        for nome, matriz in matrizes.items():
+            caminho = os.path.join(diretorio, f"{nome}.npy")
+            np.save(caminho, np.ascontiguousarray(matriz))
+            mapas[nome] = np.load(caminho, mmap_mode='r')
+        yield mapas
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+
+def _avaliar_fold(estimador, colunas, X, y, folds, fold):
+    # Devolve só as previsões do fold de teste; as métricas saem de uma vez, no processo principal
+    treino = folds != fold
+    X_treino, X_teste = X[np.ix_(treino, colunas)], X[np.ix_(~treino, colunas)]
+
+    modelo = clone(estimador)
+    inicio = time.perf_counter()
+    modelo.fit(X_treino, y[treino])
+    tempo_ajuste = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    previsto = modelo.predict(X_teste)
+    tempo_previsao = time.perf_counter() - inicio
+    return previsto, {
+        'tempo_ajuste_s': tempo_ajuste,
+        'tempo_previsao_s': tempo_previsao,
+        'linhas_treino': int(treino.sum()),
+    }
+
+
+def avaliar_candidatos(X, y, candidatos=None, cv=5, n_processos=-1, progresso=None):
+    """
+    Valida por KFold (sem embaralhar, como o GridSearchCV) cada candidato
+    `(nome, estimador, features)` e devolve uma linha por (modelo, fold).
+    Cada par (candidato, fold) é uma tarefa em um pool de processos; X, y e a
+    atribuição de folds ficam em memória compartilhada, lidos por todos os workers.
+    Os workers devolvem as previsões fora do fold, e MSE, MAE e R² de todos os
+    modelos e folds são calculados juntos por `validacao.metricas_por_fold`.
+    `progresso(concluidas, total)`, se informado, é chamado a cada tarefa concluída.
+    """
+    candidatos = CANDIDATOS if candidatos is None else candidatos
+    colunas = list(X.columns) if isinstance(X, pd.DataFrame) else list(range(np.shape(X)[1]))
+    indices = {}
+    for nome, _, features in candidatos:
+        faltando = [] if features is None else [f for f in features if f not in colunas]
+        if faltando:
+            raise ValueError(f"candidato {nome!r}: colunas ausentes em X: {faltando}")
+        indices[nome] = np.arange(len(colunas)) if features is None else np.array([colunas.index(f) for f in features])
+
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    folds = folds_kfold(len(y), cv)
+
+    with matrizes_compartilhadas(X=X, y=y, folds=folds) as compartilhadas:
+        tarefas = Parallel(n_jobs=n_processos, backend='loky', batch_size=1, return_as='generator')(
+            delayed(_avaliar_fold)(estimador, indices[nome], compartilhadas['X'], compartilhadas['y'],
+                                   compartilhadas['folds'], fold)
+            for nome, estimador, _ in candidatos for fold in range(cv)
+        )
+        resultados = []
+        for resultado in tarefas:
+            resultados.append(resultado)
+            if progresso is not None:
+                progresso(len(resultados), len(candidatos) * cv)
+
+    # Tarefas na ordem (candidato, fold): monta a matriz [n, candidatos] de previsões fora do fold
+    previsoes = np.empty((len(y), len(candidatos)))
+    for tarefa, (previsto, _) in enumerate(resultados):
+        previsoes[folds == tarefa % cv, tarefa // cv] = previsto
+    por_fold = metricas_por_fold(y, previsoes, folds, nomes=[nome for nome, _, _ in candidatos])
+    tempos = pd.DataFrame([tempos for _, tempos in resultados])
+    return pd.concat([por_fold, tempos], axis=1)
+
+
+def resumir(por_fold):
+    """Tabela de comparação: média (e desvio do MSE) entre os folds de cada modelo, na ordem dos candidatos."""
+    agrupado = por_fold.groupby('modelo', sort=False)
+    tabela = agrupado[['mse', 'mae', 'r2', 'tempo_ajuste_s', 'tempo_previsao_s']].mean()
+    tabela.insert(1, 'mse_desvio', agrupado['mse'].std(ddof=0))
+    return tabela.reset_index()
+
+
+def comparar_modelos(X, y, candidatos=None, cv=5, n_processos=-1, progresso=None):
+    """Treina e valida todos os candidatos em paralelo e devolve a tabela de `resumir`."""
+    return resumir(avaliar_candidatos(X, y, candidatos, cv, n_processos, progresso))
+
+
+def main(argv=None):
+    # Import local: modelo.py usa este módulo no treino
+    from dados import CAMINHO_DADOS, carregar_dados
+    from modelo import ALVO, COLUNAS_TREINO, novo_transformador, preparar_features
+
+    parser = argparse.ArgumentParser(description="Compara os modelos candidatos por validação cruzada em paralelo.")
+    parser.add_argument('--dados', default=CAMINHO_DADOS, help="CSV de entrada")
+    parser.add_argument('--cv', type=int, default=5)
+    parser.add_argument('--processos', type=int, default=-1, help="processos do pool (-1: todos os núcleos)")
+    parser.add_argument('--arvores', action='store_true', help="inclui os modelos de árvore na comparação")
+    args = parser.parse_args(argv)
+
+    df = carregar_dados(args.dados, colunas=COLUNAS_TREINO)
+    X = preparar_features(df, novo_transformador().fit(df))
+    candidatos = CANDIDATOS + (CANDIDATOS_ARVORES if args.arvores else [])
+    inicio = time.perf_counter()
+    tabela = comparar_modelos(X, df[ALVO], candidatos, args.cv, args.processos)
+    print(tabela.to_string(index=False))
+    print(f"{len(candidatos)} modelos x {args.cv} folds em {time.perf_counter() - inicio:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+import streamlit as st
+from diagnostico import Diagnostico
+from agregados import (LIMITE_PONTOS_DISPERSAO, carregar_agregados, chave_periodo, desenhar_boxplot,
+                       desenhar_dispersao, modo_dispersao)
+from dados import indice_temporal, versao_dados
+from graficos import exibir_grafico, versao_dataframe
+
+# Instrumentação da execução corrente, criada no EBAC16A.py
+diagnostico = Diagnostico.atual()
+
+# Período analisado: os meses de data_ref saem do índice temporal do arquivo, e só as
+# linhas do intervalo escolhido entram nos agregados
+meses = [str(m) for m in indice_temporal().meses]
+inicio, fim = None, None
+if len(meses) > 1:
+    inicio, fim = st.select_slider("Período analisado (data_ref)", options=meses, value=(meses[0], meses[-1]))
+    if (inicio, fim) == (meses[0], meses[-1]):
+        inicio, fim = None, None
+
+# Agregados (contagens, médias, quartis e correlação) calculados uma vez por versão dos dados e período
+agregados = carregar_agregados(inicio=inicio, fim=fim)
+# As figuras são renderizadas uma vez por versão dos dados e período e servidas do cache de imagens
+versao = f"{versao_dados()}:{chave_periodo(inicio, fim)}"
+
+import streamlit as st
+
+diagnostico.marco("Gráfico: idade x renda")
+
+st.header("Entendimento dos dados - Bivariadas")
+
+# Dispersões sobre os dados reais: acima do limite de linhas, cada ponto deixa de ser desenhado
+# e o gráfico mostra a densidade (histograma 2D) ou uma amostra estratificada de tamanho fixo
+dispersao = agregados['dispersao_renda']
+modo_grande = 'densidade'
+if any(resumo['linhas'] > LIMITE_PONTOS_DISPERSAO for resumo in dispersao.values()):
+    rotulos_modo = {'densidade': "Densidade (histograma 2D)", 'amostra': "Amostra estratificada"}
+    modo_grande = st.radio(
+        f"Visualização das dispersões (mais de {LIMITE_PONTOS_DISPERSAO} linhas)",
+        list(rotulos_modo), format_func=rotulos_modo.get, horizontal=True)
+
+
+# Plotting the relationship between age and income
+st.write("## Relação entre Idade e Renda")
+
+def desenhar_idade_renda(fig, modo):
+    ax = fig.subplots()
+    desenhar_dispersao(ax, dispersao['idade'], modo)
+    ax.set_title('Relação entre Idade e Renda')
+    ax.set_xlabel('Idade')
+    ax.set_ylabel('Renda')
+
+
+# Display the plot in Streamlit
+exibir_grafico('idade_renda', versao, desenhar_idade_renda, figsize=(6, 4),
+               modo=modo_dispersao(dispersao['idade'], modo_grande))
+import streamlit as st
+
+st.write("""
+A imagem acima apresenta um gráfico de dispersão que explora a relação entre **idade** e **renda**. 
+Observa-se que, apesar de a maioria das rendas mais altas estarem concentradas em indivíduos entre 30 e 50 anos, a dispersão de pontos não revela uma correlação muito clara entre essas variáveis. 
+
+À medida que a idade aumenta, há uma leve tendência de aumento de renda até cerca de 50 anos, após o qual as rendas tendem a se estabilizar ou diminuir. Isso sugere que, embora a idade possa influenciar a renda, outros fatores podem ter um impacto mais significativo no comportamento da renda dentro do conjunto de dados analisado.
+""")
+import streamlit as st
+
+diagnostico.marco("Gráfico: tempo de emprego x renda")
+
+# Plotting the relationship between employment duration and income
+st.header("Relação entre Tempo de Emprego e Renda")
+
+# Creating the plot
+def desenhar_tempo_emprego_renda(fig, modo):
+    ax = fig.subplots()
+    desenhar_dispersao(ax, dispersao['tempo_emprego'], modo)
+    ax.set_title('Relação entre Tempo de Emprego e Renda')
+    ax.set_xlabel('Tempo de Emprego (Anos)')
+    ax.set_ylabel('Renda')
+
+
+# Displaying the plot in Streamlit
+exibir_grafico('tempo_emprego_renda', versao, desenhar_tempo_emprego_renda, figsize=(8, 4),
+               modo=modo_dispersao(dispersao['tempo_emprego'], modo_grande))
+import streamlit as st
+
+# Displaying the descriptive text about the plot
+st.markdown("""
+O gráfico de dispersão acima mostra a relação entre o **tempo de emprego** (em anos) e a **renda dos indivíduos**. Podemos observar que, embora haja uma leve tendência de aumento da renda conforme o tempo de emprego aumenta, não há uma correlação muito forte entre as variáveis. As rendas mais altas estão concentradas entre os indivíduos com até 20 anos de tempo de emprego. Após esse ponto, a renda tende a estabilizar, indicando que o tempo de emprego por si só pode não ser um fator determinante na obtenção de rendas mais altas, sugerindo a influência de outros fatores.
+""")
+import streamlit as st
+import seaborn as sns
+import pandas as pd
+
+# Assuming you have your DataFrame df already loaded
+# Example data for demonstration purposes
+data = {
+    'Gênero': ['Masculino', 'Feminino', 'Masculino', 'Feminino', 'Masculino'],
+    'renda': [2000, 3000, 1500, 4000, 2500]
+}
+df = pd.DataFrame(data)
+
+# Plotting boxplot to see the distribution of income by Gênero
+st.markdown("### Distribuição de Renda por Gênero")
+def desenhar_renda_genero(fig):
+    ax = fig.subplots()
+    sns.boxplot(x='Gênero', y='renda', data=df, ax=ax)
+    ax.set_title('Distribuição de Renda por Gênero')
+    ax.set_xlabel('Gênero')
+    ax.set_ylabel('Renda')
+
+
+# Display the plot in Streamlit
+exibir_grafico('renda_genero', versao_dataframe(df), desenhar_renda_genero, figsize=(6, 4))
+st.write("#### Análise da Distribuição de Renda por Gênero")
+st.write("""
+O gráfico de boxplot acima representa a distribuição da renda entre gêneros. Observa-se que a mediana da renda 
+varia entre Masculino e Feminino, com o grupo Feminino apresentando uma mediana de renda ligeiramente superior. 
+A dispersão dos dados também sugere uma variação nas rendas dentro de cada grupo, destacando uma amplitude maior 
+de rendas para o gênero Feminino. Essa análise é útil para entender diferenças de renda entre gêneros e identificar 
+possíveis desigualdades econômicas.
+""")
+
+import streamlit as st
+import pandas as pd
+
+diagnostico.marco("Gráficos: boxplots de renda")
+
+# Check if the 'posse_de_veiculo' column exists and display unique values
+if 'posse_de_veiculo' in agregados['valores_unicos']:
+    st.write("Column 'posse_de_veiculo' exists.")
+    st.write("Unique values in 'posse_de_veiculo':", agregados['valores_unicos']['posse_de_veiculo'])
+else:
+    st.write("Column 'posse_de_veiculo' does not exist in the DataFrame.")
+
+# Now, you can retry the boxplot if the column is verified
+if 'posse_de_veiculo' in agregados['boxplot_renda']:
+    def desenhar_renda_veiculo(fig):
+        ax = fig.subplots()
+        desenhar_boxplot(ax, agregados['boxplot_renda']['posse_de_veiculo'])
+        ax.set_title('Distribuição de Renda por Posse de Veículo')
+        ax.set_xlabel('Posse de Veículo')
+        ax.set_ylabel('Renda')
+
+    # Plotting the boxplot (a partir dos quartis pré-calculados)
+    st.write("### Distribuição de Renda por Posse de Veículo")
+    exibir_grafico('renda_posse_de_veiculo', versao, desenhar_renda_veiculo, figsize=(8, 4))
+import streamlit as st
+
+# Explanation of the boxplot in storytelling format
+st.markdown("""
+
+
+O gráfico acima explora a relação entre a posse de veículo e a distribuição de renda dos indivíduos. 
+Observei que a posse de um veículo pode estar associada a uma faixa de renda mais alta em comparação 
+àqueles que não possuem veículo. Essa análise pode nos ajudar a entender possíveis padrões de consumo, 
+uma vez que pessoas com maior renda tendem a ter maior acesso a bens de alto valor, como veículos. 
+
+Esse insight pode ser útil para estratégias de segmentação e para compreender o impacto econômico da 
+posse de bens na vida dos participantes do estudo.
+""")
+import streamlit as st
+import pandas as pd
+import seaborn as sns
+
+# Calculate the mean income by marital status (pré-calculada junto com os demais agregados)
+media_renda_por_estado_civil = agregados['media_renda_estado_civil']
+
+# Display the mean income by marital status in Streamlit
+st.write("### Média de Renda por Estado Civil")
+st.write(media_renda_por_estado_civil)
+
+# Plot a boxplot to visualize the distribution of income by marital status
+st.write("### Distribuição de Renda por Estado Civil")
+def desenhar_renda_estado_civil(fig):
+    ax = fig.subplots()
+    desenhar_boxplot(ax, agregados['boxplot_renda']['estado_civil'])
+    ax.set_title('Distribuição de Renda por Estado Civil')
+    ax.set_xlabel('Estado Civil')
+    ax.set_ylabel('Renda')
+    ax.tick_params(axis='x', labelrotation=45)
+
+
+exibir_grafico('renda_estado_civil', versao, desenhar_renda_estado_civil, figsize=(8, 4))
+st.write("### Distribuição de Renda por Estado Civil")
+st.write(
+    """
+    Observa-se que pessoas no estado civil "Casado" apresentam uma maior variabilidade de renda,
+    com valores máximos bem acima dos outros grupos. Essa dispersão sugere que dentro do grupo
+    de casados, há uma distribuição de renda mais heterogênea. Em contraste, grupos como "Solteiro"
+    e "Viúvo" possuem rendas mais concentradas e com menor dispersão.
+
+    A análise desses dados pode indicar que o estado civil "Casado" abrange uma maior diversidade 
+    econômica, possivelmente devido a fatores como renda familiar compartilhada ou diferentes 
+    fases de vida econômica.
+    """
+)
+import streamlit as st
+import seaborn as sns
+
+diagnostico.marco("Gráfico: mapa de correlação")
+
+# Correlação entre as colunas numéricas, pré-calculada junto com os demais agregados
+correlacao = agregados['correlacao']
+
+# Displaying the heatmap for correlations between numerical variables
+st.write("### Mapa de Correlação entre Variáveis Numéricas")
+def desenhar_correlacao(fig):
+    sns.heatmap(correlacao, annot=True, cmap='coolwarm', linewidths=0.5, ax=fig.subplots())
+
+
+exibir_grafico('correlacao', versao, desenhar_correlacao, figsize=(8, 4))
+
+# Calcular e exibir a média de renda por estado civil
+st.write("### Média de Renda por Estado Civil")
+media_renda_estado_civil = media_renda_por_estado_civil.reset_index()
+st.dataframe(media_renda_estado_civil)
+import streamlit as st
+
+st.subheader("Mapa de Correlação entre Variáveis Numéricas")
+st.write("O mapa de correlação entre as variáveis numéricas apresenta a relação entre diferentes características. Observamos que algumas variáveis possuem correlações mais fortes, como a quantidade de filhos com a quantidade de pessoas na residência. Esse tipo de análise ajuda a identificar quais variáveis possuem relação e pode indicar quais delas são mais relevantes para análises preditivas.")
+
+st.subheader("Média de Renda por Estado Civil")
+st.write("A tabela de média de renda por estado civil revela uma diferença interessante nos níveis de renda conforme o estado civil dos indivíduos. Pessoas casadas apresentam uma média de renda superior, enquanto pessoas viúvas têm a menor média de renda. Essas informações podem ser úteis para entender o impacto do estado civil na renda e possíveis fatores econômicos relacionados.")
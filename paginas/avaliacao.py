@@ -0,0 +1,119 @@
+import streamlit as st
+from diagnostico import Diagnostico
+from formatacao import numero_br
+from treino import artefato_em_uso, painel_treino
+
+# Instrumentação da execução corrente, criada no EBAC16A.py
+diagnostico = Diagnostico.atual()
+
+diagnostico.marco("Etapa 5: avaliação dos resultados")
+st.subheader("Etapa 5 Crisp-DM: Avaliação dos Resultados")
+st.write("### Comparação de Modelos: Regressão Linear Simples, Ridge e Lasso")
+st.write("""
+Os três modelos de regressão — Linear, Ridge e Lasso — foram utilizados para prever a variável **renda** com base em variáveis como **tempo de emprego**, **quantidade de pessoas na residência**, **renda por ano de emprego** e **pessoas por imóvel**. Abaixo estão os principais resultados de cada modelo:
+""")
+
+# Tabela gerada no treino (orquestrador.comparar_modelos): validação cruzada de todos os
+# candidatos em paralelo, com MSE, MAE e R² calculados juntos por validacao.metricas_por_fold
+artefato = artefato_em_uso()
+painel_treino(controles=False)
+if artefato is None:
+    st.info("Ainda não há um modelo treinado: a comparação aparece quando o treino terminar.")
+    st.stop()
+metricas = artefato['metricas']
+nomes_modelos = {
+    'linear': "Regressão Linear Simples",
+    'lasso': "Lasso (alpha = 1)",
+    'ridge_grid': "Ridge (com melhor alpha ajustado)",
+    'lasso_grid': "Lasso (com melhor alpha ajustado)",
+}
+comparacao = artefato['comparacao'].assign(modelo=lambda t: t['modelo'].map(nomes_modelos).fillna(t['modelo']))
+st.dataframe(
+    comparacao.rename(columns={
+        'modelo': "Modelo", 'mse': "MSE", 'mse_desvio': "Desvio do MSE", 'mae': "MAE", 'r2': "R²",
+        'tempo_ajuste_s': "Ajuste (s)", 'tempo_previsao_s': "Previsão (s)",
+    }).style.format({"MSE": "{:,.0f}", "Desvio do MSE": "{:,.0f}", "MAE": "{:,.0f}", "R²": "{:.4f}",
+                     "Ajuste (s)": "{:.4f}", "Previsão (s)": "{:.4f}"}),
+    hide_index=True,
+)
+st.caption(f"Médias da validação cruzada (5 folds) no conjunto de treino do modelo {artefato['versao']}")
+
+r2_linear = metricas['linear']['r2']
+ridge, lasso = metricas['ridge_grid'], metricas['lasso_grid']
+
+st.subheader("Interpretação dos Resultados")
+st.write(f"""
+- **Erro Médio Quadrático (MSE)**: Uma métrica de erro que mede o desvio quadrático médio entre os valores reais e os valores preditos. Quanto menor o valor, melhor o modelo.
+- **Erro Absoluto Médio (MAE)**: A diferença média, em reais, entre a renda real e a prevista, sem elevar ao quadrado; é menos sensível às rendas muito altas que o MSE.
+- **Coeficiente de Determinação (R²)**: Mede a proporção de variação da renda que pode ser explicada pelo modelo. Um valor de {r2_linear:.4f} (Regressão Linear, no conjunto de teste) significa que cerca de {numero_br(r2_linear * 100)}% da variação da renda pode ser explicada pelas variáveis do modelo.
+""")
+
+# Os textos abaixo saem da tabela: diferenças de MSE menores que o desvio entre os folds
+# são tratadas como empate técnico
+tabela = artefato['comparacao'].set_index('modelo')
+melhor = tabela['mse'].idxmin()
+amplitude = tabela['mse'].max() - tabela['mse'].min()
+semelhantes = amplitude < tabela.loc[melhor, 'mse_desvio']
+ganho_sobre_linear = 1 - tabela.loc[melhor, 'mse'] / tabela.loc['linear', 'mse']
+
+st.subheader("Análise")
+if semelhantes:
+    analise = f"""
+- Todos os modelos obtiveram resultados muito semelhantes: a diferença entre o maior e o menor MSE ({numero_br(amplitude, 0)}) é menor que o desvio do MSE entre os folds ({numero_br(tabela.loc[melhor, 'mse_desvio'], 0)}). Isso indica que as técnicas de regularização (Ridge e Lasso) não adicionaram grandes melhorias no ajuste dos dados.
+"""
+else:
+    analise = f"""
+- A diferença entre o maior e o menor MSE ({numero_br(amplitude, 0)}) supera o desvio do MSE entre os folds ({numero_br(tabela.loc[melhor, 'mse_desvio'], 0)}): a escolha do modelo faz diferença no erro.
+"""
+if melhor == 'linear':
+    analise += """
+- A **Regressão Linear Simples** teve o menor MSE médio: a regularização não trouxe benefício neste conjunto de dados.
+"""
+else:
+    analise += f"""
+- O modelo **{nomes_modelos.get(melhor, melhor)}** teve o menor MSE médio ({numero_br(tabela.loc[melhor, 'mse'], 0)}), {numero_br(ganho_sobre_linear * 100, 3)}% abaixo da Regressão Linear Simples.
+"""
+st.write(analise)
+
+st.subheader("Conclusão")
+if melhor == 'linear':
+    st.write("""
+A **Regressão Linear Simples** teve o menor erro e é o modelo mais simples, sendo a escolha natural: os modelos regularizados não melhoraram o MSE.
+""")
+elif semelhantes:
+    st.write(f"""
+Dado que os modelos performaram de maneira bastante similar, qualquer um deles poderia ser considerado uma boa escolha. O **{nomes_modelos.get(melhor, melhor)}** mostrou um resultado marginalmente melhor em termos de MSE, mas a **Regressão Linear Simples** continua sendo uma opção viável, uma vez que não há uma melhoria significativa nos modelos regularizados.
+""")
+else:
+    st.write(f"""
+O **{nomes_modelos.get(melhor, melhor)}** é a escolha recomendada: seu MSE ficou {numero_br(ganho_sobre_linear * 100)}% abaixo do da Regressão Linear Simples, uma diferença maior que a variação entre os folds.
+""")
+
+vencedor, outro = ('Lasso', 'Ridge') if lasso['melhor_mse'] < ridge['melhor_mse'] else ('Ridge', 'Lasso')
+mse_vencedor, mse_outro = sorted([lasso['melhor_mse'], ridge['melhor_mse']])
+empate = mse_outro - mse_vencedor < tabela.loc[f"{vencedor.lower()}_grid", 'mse_desvio']
+
+st.subheader("Avaliação dos Resultados de Regularização com Ridge e Lasso")
+st.write(f"""
+Após a aplicação do **GridSearchCV** para ajustar o hiperparâmetro **alpha** dos modelos **Ridge** e **Lasso**, obtivemos os seguintes resultados:
+
+- **Melhor alpha para Ridge**: {ridge['melhor_alpha']:g}
+- **Melhor MSE para Ridge**: {numero_br(ridge['melhor_mse'])}
+- **Melhor alpha para Lasso**: {lasso['melhor_alpha']:g}
+- **Melhor MSE para Lasso**: {numero_br(lasso['melhor_mse'])}
+
+Os valores de **MSE** (Erro Médio Quadrático) indicam que o **{vencedor}** teve um erro {numero_br((1 - mse_vencedor / mse_outro) * 100, 3)}% menor que o **{outro}**{", uma diferença menor que o desvio entre os folds" if empate else ""}. O alpha ideal para o modelo Ridge foi {ridge['melhor_alpha']:g}, enquanto o Lasso encontrou o melhor desempenho com alpha = {lasso['melhor_alpha']:g}.
+""")
+
+st.write(f"""
+{"Embora ambos os modelos tenham alcançado resultados quase idênticos em termos de erro, o" if empate else "O"} **{vencedor}** apresentou {"uma leve vantagem" if empate else "vantagem"} com um MSE menor. No entanto, a escolha entre Ridge e Lasso pode depender da necessidade de regularização mais forte ou da simplificação do modelo, já que o Lasso tende a zerar coeficientes de variáveis menos relevantes, tornando o modelo mais interpretável.
+""")
+
+conclusao = f"O {vencedor} teve uma performance {'marginalmente ' if empate else ''}melhor neste caso"
+if vencedor == 'Lasso':
+    conclusao += ", o que pode ser útil se o objetivo for um modelo mais simples e interpretável."
+else:
+    conclusao += "; o Lasso continua sendo uma alternativa se o objetivo for um modelo mais simples e interpretável."
+st.write(f"""
+**Conclusão**: {conclusao}
+""")
@@ -0,0 +1,63 @@
+import streamlit as st
+from diagnostico import Diagnostico
+
+# Instrumentação da execução corrente, criada no EBAC16A.py
+diagnostico = Diagnostico.atual()
+
+import streamlit as st
+import pandas as pd
+from dados import carregar_dados, estatisticas_cache
+
+diagnostico.marco("Carga dos dados")
+
+# Load the data (lido do disco uma única vez por conteúdo do arquivo)
+renda = carregar_dados()
+
+# Display a sample of the data
+st.write("### Exemplo de Dados Carregados")
+st.dataframe(renda.head())
+
+# Tempo de leitura e acertos/falhas do cache: reruns devem contar como acerto, sem ler o disco
+estatisticas = estatisticas_cache()
+memoria = f"{estatisticas['memoria_mb']:.1f} MB" if estatisticas['memoria_mb'] is not None else "-"
+if estatisticas['memoria_original_mb'] is not None:
+    memoria += f" (sem compactação: {estatisticas['memoria_original_mb']:.1f} MB)"
+st.caption(
+    f"Leitura dos dados: {estatisticas['tempo_carga_s']:.3f}s | "
+    f"cache: {estatisticas['acertos']} acertos, {estatisticas['falhas']} falhas | memória: {memoria}"
+)
+if estatisticas['memoria_por_coluna'] is not None:
+    with st.expander("Memória por coluna antes e depois da compactação"):
+        st.dataframe(estatisticas['memoria_por_coluna'].style.format({'kb_antes': "{:,.1f}", 'kb_depois': "{:,.1f}"}))
+
+
+import streamlit as st
+
+# Title
+st.title("Análise de Renda")
+
+diagnostico.marco("Relatório de perfil (ydata-profiling)")
+from perfil import relatorio_html
+
+# O relatório do ydata-profiling só é gerado (ou lido do cache) quando a seção é aberta;
+# ele é refeito apenas quando o conteúdo do CSV muda
+if st.toggle("Exibir relatório de perfil dos dados (ydata-profiling)"):
+    with st.spinner("Gerando o relatório de perfil..."):
+        html_content = relatorio_html()
+
+    # Display the HTML content in Streamlit
+    st.components.v1.html(html_content, height=800, scrolling=True)
+
+import streamlit as st
+
+# Title
+st.title("Análise de Renda")
+
+# Markdown content
+st.markdown("""
+A análise de renda foi realizada a partir de um dataset contendo informações de **15.000 observações** e **15 variáveis**. 
+O relatório gerado utiliza técnicas exploratórias e estatísticas, permitindo a visualização detalhada das características dos dados, 
+como a distribuição de variáveis **numéricas**, **categóricas** e **booleanas**.
+
+A seguir, apresento as principais descobertas e insights obtidos com base nessa análise.
+""")
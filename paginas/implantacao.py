@@ -0,0 +1,53 @@
+import streamlit as st
+from diagnostico import Diagnostico
+
+# Instrumentação da execução corrente, criada no EBAC16A.py
+diagnostico = Diagnostico.atual()
+
+import numpy as np
+from inferencia import cache_previsoes, modelo_compacto
+from treino import artefato_em_uso, painel_treino
+
+diagnostico.marco("Etapa 6: simulação de predição")
+
+# A página depende só do artefato treinado (carregado uma vez por processo). Um novo
+# treino em segundo plano não interrompe a simulação: ela segue com o último artefato
+# gravado até o novo substituí-lo
+artefato = artefato_em_uso()
+
+# Título da Etapa 6: Implantação
+st.subheader("Etapa 6 Crisp-DM: Implantação")
+st.write("""
+Nessa etapa, colocamos em uso o modelo desenvolvido, normalmente implementando o modelo em um motor de decisão que toma ações automaticamente com base nos resultados das previsões. Esse processo pode envolver a integração do modelo em sistemas que processam dados em tempo real ou em lotes, fornecendo previsões para apoiar decisões empresariais automatizadas.
+""")
+
+# Simulação de uma interface de predição
+st.markdown("### Simulação de Predição de Renda")
+painel_treino(controles=False)
+if artefato is None:
+    st.info("Ainda não há um modelo treinado: a simulação fica disponível quando o treino terminar.")
+    st.stop()
+
+# Entrada de dados do usuário para simulação
+tempo_emprego = st.number_input("Tempo de Emprego (anos)", min_value=0, value=5)
+qt_pessoas_residencia = st.number_input("Quantidade de Pessoas na Residência", min_value=1, value=3)
+renda_por_ano_emprego = st.number_input("Renda por Ano de Emprego", min_value=0.0, value=10000.0)
+pessoas_por_imovel = st.number_input("Pessoas por Imóvel", min_value=0.0, value=1.5)
+
+# Fazer a predição com o modelo já carregado (sem novo treino a cada interação),
+# direto pelos coeficientes, sem montar DataFrame. Combinações já pedidas (nesta ou em
+# outra sessão) saem do cache de previsões, que se esvazia quando um novo artefato é carregado
+X_novo = [[tempo_emprego, qt_pessoas_residencia, renda_por_ano_emprego, pessoas_por_imovel]]
+cache = cache_previsoes()
+renda_prevista = float(cache.prever(artefato['versao'], np.array(X_novo, dtype=float),
+                                    modelo_compacto(artefato).prever_matriz)[0])
+
+# Exibir o resultado da previsão
+st.write(f"### Renda Prevista: R$ {renda_prevista:,.2f}")
+estatisticas_cache = cache.estatisticas()
+st.caption(f"Cache de previsões: {estatisticas_cache['itens']} combinações guardadas, "
+           f"{estatisticas_cache['taxa_acerto']:.0%} de acertos")
+
+st.write("""
+Essa interface simula como o modelo poderia ser usado em produção, permitindo que o usuário insira dados e obtenha uma previsão de renda com base no modelo treinado. Em um ambiente real, o modelo seria atualizado periodicamente com novos dados e integrado a um sistema de automação para tomar decisões em tempo real.
+""")
@@ -0,0 +1,166 @@
+import streamlit as st
+from diagnostico import Diagnostico
+from dados import carregar_dados
+
+# Instrumentação da execução corrente, criada no EBAC16A.py
+diagnostico = Diagnostico.atual()
+
+st.write("""
+### Conclusão
+#### Rodando o Modelo
+
+**Seleção das Variáveis:**
+As variáveis selecionadas para prever a renda são o **tempo de emprego**, a **quantidade de pessoas na residência**, a **renda por ano de emprego** e o **número de pessoas por imóvel**. Essas variáveis foram escolhidas por apresentarem correlação com a renda, sugerindo que influenciam diretamente na variação do rendimento.
+
+**Treinamento e Teste:**
+Os dados foram divididos em dois conjuntos: **70% dos dados foram usados para treinar o modelo** e os **30% restantes foram reservados para testar e avaliar o desempenho do modelo**. Isso garante que o modelo seja avaliado com base em dados que ele ainda não viu, permitindo uma avaliação mais confiável.
+
+**Modelo de Regressão Linear:**
+Utilizamos a técnica de **regressão linear**, implementada pela função `LinearRegression()` da biblioteca **Scikit-learn**, para modelar a relação entre as variáveis preditoras e a variável alvo (renda). A regressão linear é adequada para esse problema, pois estamos lidando com uma variável contínua.
+
+**Avaliação do Modelo:**
+Duas métricas principais foram usadas para avaliar o desempenho do modelo:
+
+- **MSE (Erro Médio Quadrático):** Essa métrica mede o erro médio ao quadrado entre os valores reais e os valores preditos, indicando o quão precisas foram as previsões do modelo.
+- **R² (Coeficiente de Determinação):** Essa métrica avalia a proporção da variação da renda que é explicada pelo modelo, fornecendo uma ideia da qualidade geral do ajuste do modelo aos dados.
+
+Essas métricas nos ajudam a entender o quão bem o modelo está performando e se as variáveis selecionadas estão explicando adequadamente as variações na renda.
+""")
+
+import streamlit as st
+from sklearn.model_selection import train_test_split
+
+diagnostico.marco("Divisão treino/teste")
+
+# Display header
+st.write("### Divisão do Dataset em Treino e Teste")
+
+# Carregar os dados
+df = carregar_dados()
+
+# Selecionar as variáveis independentes (features) e a dependente (target)
+X = df[['idade', 'tempo_emprego', 'qtd_filhos']]  # Ajuste conforme as variáveis que deseja usar
+y = df['renda']
+
+# Dividir o dataset em treino e teste (80% treino e 20% teste)
+X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+# Display information about the split
+st.write("**Variáveis Selecionadas:**")
+st.write(X.columns.tolist())
+
+st.write("**Tamanho do Conjunto de Treinamento:**", len(X_train))
+st.write("**Tamanho do Conjunto de Teste:**", len(X_test))
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+from formatacao import numero_br
+from treino import artefato_em_uso, painel_treino
+
+diagnostico.marco("Etapa 4: modelo e métricas")
+
+# Carregar o artefato treinado. Os ajustes (Linear, Lasso e buscas de alpha) rodam em
+# `python modelo.py` ou em segundo plano (treino.py), sem travar a página: enquanto um
+# novo modelo treina, as seções abaixo seguem com o último artefato gravado.
+with diagnostico.secao("Carga do artefato"):
+    artefato = artefato_em_uso()
+painel_treino()
+if artefato is None:
+    st.info("Ainda não há um modelo treinado: as métricas aparecem quando o treino terminar.")
+    st.stop()
+metricas = artefato['metricas']
+st.caption(f"Modelo {artefato['versao']} treinado em {artefato['treinado_em']}")
+
+# Métricas da Regressão Linear calculadas no treino
+mse = metricas['linear']['mse']
+r2 = metricas['linear']['r2']
+
+# Exibir os resultados da avaliação
+st.subheader("Avaliação do Modelo")
+st.write(f"MSE (Erro Médio Quadrático): {mse:.2f}")
+st.write(f"R² (Coeficiente de Determinação): {r2:.2f}")
+
+# Exibir os coeficientes do modelo
+coeficientes = pd.DataFrame.from_dict(artefato['coeficientes'], orient='index', columns=['Coeficientes'])
+st.subheader("Coeficientes do Modelo")
+st.write(coeficientes)
+st.write(f"""
+### Análise do Desempenho do Modelo de Regressão Linear
+
+O modelo de regressão linear foi treinado com **70% dos dados** e testado com os **30% restantes**, resultando em uma análise de {numero_br(artefato['tamanho_treino'], 0)} registros para treino e {numero_br(artefato['tamanho_teste'], 0)} para teste. A seguir estão as métricas principais de desempenho:
+
+- **Erro Médio Quadrático (MSE)**: O MSE de aproximadamente {numero_br(mse, 0)} indica o erro médio quadrático entre os valores reais e preditos. Valores menores de MSE sugerem melhor precisão, mas neste caso, um valor elevado sugere que o modelo pode ter limitações em capturar todas as variações de renda.
+
+""")
+import streamlit as st
+
+# Métricas do modelo Lasso (alpha=1.0) gravadas no artefato
+mse_lasso = metricas['lasso']['mse']
+r2_lasso = metricas['lasso']['r2']
+
+# Exibir os resultados em Streamlit
+st.write("### Avaliação do Modelo Lasso")
+st.write(f"Lasso - MSE (Erro Médio Quadrático): {mse_lasso:.2f}")
+st.write(f"Lasso - R² (Coeficiente de Determinação): {r2_lasso:.2f}")
+st.write("### Interpretação dos Resultados do Modelo Lasso")
+st.write(f"""
+O modelo Lasso foi avaliado com duas métricas principais:
+
+- **MSE (Erro Médio Quadrático)**: Essa métrica indica a média dos erros ao quadrado entre os valores preditos e os valores reais de renda. Quanto menor o MSE, melhor o modelo. No entanto, ainda temos um erro relativamente alto, o que sugere que há variáveis importantes que talvez não foram consideradas ou que o modelo poderia ser melhorado.
+  
+- **R² (Coeficiente de Determinação)**: Este valor indica a proporção da variabilidade da renda que é explicada pelo modelo. Um valor de R² de {r2_lasso:.2f} indica que o modelo explica aproximadamente {r2_lasso:.0%} da variação na renda, o que é uma performance modesta. Isso sugere que, embora o modelo capture alguns padrões, ele não explica totalmente a renda dos indivíduos.
+
+Esses resultados mostram que o modelo Lasso, com o parâmetro de regularização utilizado, tem um desempenho similar ao modelo de regressão linear, mas ainda possui espaço para aprimoramentos.
+""")
+st.write("## Explicação do GridSearchCV no Processo de Ajuste de Hiperparâmetros")
+
+st.write("""
+Vou utilizar o **GridSearchCV** que é uma técnica utilizada para otimizar os hiperparâmetros de um modelo de machine learning. No caso da regularização **Ridge** e **Lasso**, o hiperparâmetro a ser ajustado é o **alpha**, que controla a intensidade da regularização.
+
+O processo funciona da seguinte forma:
+
+- **GridSearchCV** testa vários valores de *alpha* definidos no parâmetro *param_grid*.
+- Ele divide os dados em várias partes utilizando *cross-validation* (neste caso, 5 partes, ou seja, *cv=5*). O modelo é treinado em diferentes combinações de dados e avaliado nas partes restantes.
+- A métrica de avaliação usada é o **MSE (Erro Médio Quadrático)**, que mede a diferença média entre os valores preditos e reais. Você também pode utilizar outras métricas, como o **R²**, dependendo do objetivo da análise.
+
+Essa abordagem garante que o modelo seja ajustado de maneira robusta, testando diferentes valores de *alpha* e selecionando o que resulta na melhor performance, minimizando o risco de overfitting ou underfitting.
+""")
+import streamlit as st
+
+# Resultado do GridSearchCV (cv=5) para o Ridge, gravado no artefato
+grid_ridge = metricas['ridge_grid']
+
+# Exibir o melhor valor de alpha e o melhor MSE
+st.write("## Resultados do GridSearchCV para o Modelo Ridge")
+st.write(f"Melhor valor de alpha para Ridge: **{grid_ridge['melhor_alpha']}**")
+st.write(f"Melhor MSE (Erro Médio Quadrático) para Ridge: **{grid_ridge['melhor_mse']:.2f}**")
+import streamlit as st
+
+st.subheader("Explicação dos Resultados do GridSearchCV para o Modelo Ridge")
+
+st.write(f"""
+O processo de ajuste de hiperparâmetros com o GridSearchCV encontrou o melhor valor para o parâmetro de regularização `alpha`, que controla a intensidade da regularização no modelo Ridge. 
+
+Neste caso, o melhor valor de `alpha` encontrado foi **{grid_ridge['melhor_alpha']:g}**, o que indica um ajuste que ajuda a evitar overfitting, equilibrando a complexidade do modelo. Além disso, o menor erro médio quadrático (MSE) obtido foi **{grid_ridge['melhor_mse']:.2f}**, refletindo a precisão do modelo na previsão dos dados.
+
+Esses resultados são fundamentais para entender a performance do modelo Ridge após o ajuste de hiperparâmetros, proporcionando um balanço adequado entre viés e variância.
+""")
+import streamlit as st
+
+# Melhor valor de alpha e MSE para o modelo Lasso (GridSearchCV gravado no artefato)
+best_alpha = metricas['lasso_grid']['melhor_alpha']
+best_mse = metricas['lasso_grid']['melhor_mse']
+
+# Exibir os resultados no Streamlit
+st.subheader("Resultados do GridSearchCV para o Modelo Lasso")
+st.write(f"Melhor valor de alpha para Lasso: {best_alpha}")
+st.write(f"Melhor MSE (Erro Médio Quadrático) para Lasso: {best_mse:.2f}")
+st.subheader("Interpretação dos Resultados do GridSearchCV para o Modelo Lasso")
+st.write(f"""
+O GridSearchCV foi utilizado para ajustar o parâmetro de regularização `alpha` do modelo Lasso. 
+Após testar diferentes valores de `alpha`, o melhor valor encontrado foi {best_alpha:g}, indicando o nível ideal de penalização para reduzir o overfitting. 
+O menor erro quadrático médio (MSE) obtido foi de aproximadamente {numero_br(best_mse)}, o que reflete a precisão do modelo nas previsões de renda.
+
+Esse ajuste é fundamental para melhorar o desempenho do modelo, balanceando a complexidade do modelo e a precisão nas previsões.
+""")
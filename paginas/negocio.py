@@ -0,0 +1,91 @@
+import streamlit as st
+from diagnostico import Diagnostico
+
+# Instrumentação da execução corrente, criada no EBAC16A.py
+diagnostico = Diagnostico.atual()
+
+diagnostico.marco("Etapa 1: entendimento do negócio")
+
+# Title and Project Introduction
+st.title("Income Prediction Project")
+
+st.markdown("""
+### 4 Key Elements of This Project
+- This notebook (project code)
+- Streamlit for interactive analysis
+- GitHub repository with the project
+- Video in GitHub readme showing Streamlit application
+""")
+
+# Business Understanding
+st.markdown("""
+## Step 1 - CRISP-DM: Business Understanding
+
+In the context of income prediction, understanding the business scenario is essential, particularly how data can add value.
+Income prediction is critical for financial institutions, insurance companies, and marketing firms, as it aids in customizing offerings and making credit-related decisions.
+
+**Objective:** This project aims to predict clients' income based on demographic and economic characteristics (age, education, asset ownership, marital status, etc.). Enhancing the accuracy of income predictions supports strategic decision-making, like credit offerings and personalized marketing actions.
+""")
+
+# Data Dictionary
+st.markdown("""
+## Data Dictionary
+
+The table below describes the key features of the dataset used for income prediction.
+
+| Variable                | Description                             | Type        |
+|-------------------------|-----------------------------------------|-------------|
+| **data_ref**            | Reference date of data collection       | Date        |
+| **id_cliente**          | Unique client identifier                | Numeric     |
+| **sexo**                | Client gender (Male/Female)             | Categorical |
+| **posse_de_veiculo**    | Vehicle ownership (Yes/No)              | Binary      |
+| **posse_de_imovel**     | Property ownership (Yes/No)             | Binary      |
+| **qtd_filhos**          | Number of children                      | Numeric     |
+| **tipo_renda**          | Primary income source (e.g., Employed, Self-employed) | Categorical |
+| **educacao**            | Education level (e.g., High School, College) | Categorical |
+| **estado_civil**        | Marital status (e.g., Single, Married)  | Categorical |
+| **tipo_residencia**     | Type of residence (e.g., Owned, Rented) | Categorical |
+| **idade**               | Client age                              | Numeric     |
+| **tempo_emprego**       | Years of employment                     | Numeric     |
+| **qt_pessoas_residencia** | Number of people in residence        | Numeric     |
+| **renda**               | Monthly income                          | Numeric     |
+""")
+
+import streamlit as st
+
+# Title of the section
+st.title("Bibliotecas Utilizadas")
+
+# Description of libraries used
+st.markdown("""
+- **Pandas**: Utilizado para manipulação de dados tabulares (DataFrames), como filtragem, agregação e transformação de dados.
+- **Seaborn**: Biblioteca para criação de gráficos estatísticos, que facilita a visualização de padrões e tendências.
+- **Matplotlib**: Ferramenta de visualização de dados, muito útil para criar gráficos simples ou complexos.
+- **Pandas Profiling**: Gera relatórios automáticos de análise exploratória de dados, ajudando a entender rapidamente as principais características do dataset.
+""")
+
+
+
+
+# Optional: Display a profiling report if needed
+st.write("### Relatório de Análise Exploratória")
+
+import streamlit as st
+import pandas as pd
+
+# Title and explanation
+st.title("Carregando os dados")
+
+# Explanation of pd.read_csv
+st.markdown("""
+O comando `pd.read_csv` é um comando da biblioteca **Pandas** (`pd.`) e carrega os dados do arquivo CSV indicado para um objeto *DataFrame* do Pandas.
+""")
+
+# Code example in Markdown (properly closed)
+st.markdown("""
+```python
+from ydata_profiling import ProfileReport
+
+renda = pd.read_csv('previsao_de_renda.csv')
+renda.head(5)
+""")
@@ -0,0 +1,344 @@
+import streamlit as st
+from diagnostico import Diagnostico
+from dados import carregar_dados
+
+# Instrumentação da execução corrente, criada no EBAC16A.py
+diagnostico = Diagnostico.atual()
+
+import streamlit as st
+
+diagnostico.marco("Etapa 2: preparação dos dados")
+
+# Title for the section
+st.header("Etapa 2 Crisp-DM: Preparação dos dados")
+
+# Description with bullet points
+st.markdown("""
+Nessa etapa realizamos tipicamente as seguintes operações com os dados:
+
+- **seleção**: Já temos os dados selecionados adequadamente?
+- **limpeza**: Precisaremos identificar e tratar dados faltantes
+- **construção**: construção de novas variáveis
+- **integração**: Temos apenas uma fonte de dados, não é necessário integração
+- **formatação**: Os dados já se encontram em formatos úteis?
+""")
+
+import streamlit as st
+import pandas as pd
+import io
+
+# Carregar os dados
+df = carregar_dados()
+
+# Verificar a estrutura dos dados
+st.write("### Estrutura dos Dados")
+buffer = io.StringIO()
+df.info(buf=buffer)
+s = buffer.getvalue()
+st.text(s)
+
+# Verificar as primeiras linhas
+st.write("### Primeiras Linhas dos Dados")
+st.dataframe(df.head())
+
+import streamlit as st
+
+# Add descriptive text
+st.markdown("""
+Nesta análise, estamos trabalhando com um dataset que contém informações de **15.000 clientes**, incluindo variáveis como **sexo, posse de veículo e imóvel, número de filhos, tipo de renda, educação, estado civil, idade, tempo de emprego, número de pessoas na residência e renda**. 
+
+Uma característica importante desta base de dados é a presença de algumas variáveis fortemente correlacionadas com a renda, como o **tempo de emprego** e a **quantidade de pessoas na residência**, que serão exploradas para entender o impacto no rendimento anual dos clientes. Vale destacar que a variável **tempo de emprego** possui alguns valores nulos, o que pode ser um fator a considerar na modelagem final.
+""")
+
+import streamlit as st
+import pandas as pd
+
+# Carregar os dados
+df = carregar_dados()
+
+# Verificar os valores nulos em todas as colunas
+st.write("### Valores Nulos em Cada Coluna")
+st.write(df.isnull().sum())
+
+# Selecionar apenas as colunas numéricas para tratar os valores nulos com a mediana
+colunas_numericas = df.select_dtypes(include='number').columns
+
+# Preencher os valores nulos com a mediana apenas nas colunas numéricas
+df[colunas_numericas] = df[colunas_numericas].fillna(df[colunas_numericas].median())
+
+# Verificar dados duplicados
+st.write("### Número de Linhas Duplicadas")
+st.write(f"Número de linhas duplicadas: {df.duplicated().sum()}")
+
+# Remover linhas duplicadas, se houver
+df.drop_duplicates(inplace=True)
+
+# Verificar a limpeza dos dados
+st.write("### Estrutura dos Dados Após a Limpeza")
+buffer = io.StringIO()
+df.info(buf=buffer)
+s = buffer.getvalue()
+st.text(s)
+import streamlit as st
+
+# Add descriptive text about the data analysis and cleaning process
+st.markdown("""
+Durante o processo de análise e limpeza dos dados, foi verificado que a base contém **15.000 entradas** e **15 variáveis**. 
+
+Importante destacar que **não foram encontradas linhas duplicadas**, garantindo a integridade dos dados. No entanto, a variável **tempo de emprego** possui **2.573 valores ausentes**, o que poderá impactar a modelagem se não for tratada adequadamente. Todas as outras variáveis estão completas, sem valores nulos, o que proporciona uma base sólida para a análise e modelagem preditiva. 
+
+Esta etapa de análise de qualidade de dados é fundamental para garantir que os resultados sejam confiáveis e robustos.
+""")
+import streamlit as st
+import pandas as pd
+
+# Carregar os dados
+df = carregar_dados()
+
+# Preencher valores nulos de 'tempo_emprego' com a mediana (nova coluna, sem alterar o frame compartilhado)
+df['tempo_emprego'] = df['tempo_emprego'].fillna(df['tempo_emprego'].median())
+
+# Verificar novamente se há valores nulos
+st.write("### Valores Nulos Após o Preenchimento")
+st.write(df.isnull().sum())
+
+# Explicação da etapa de preparação dos dados
+st.markdown("""
+Para essa etapa do processo de preparação de dados, foquei em lidar com valores ausentes, especificamente na variável **tempo de emprego**, 
+que apresentava um número significativo de valores nulos. Esses valores ausentes poderiam prejudicar a qualidade das análises e da modelagem preditiva, 
+então optei por preenchê-los com a **mediana** dessa variável. A escolha da mediana é estratégica, pois ela reduz o impacto de valores extremos que poderiam distorcer a análise.
+
+Após o preenchimento, verifiquei novamente se ainda há valores nulos em todas as variáveis. Como mostra a saída, todas as colunas estão agora completas, 
+sem valores ausentes, o que nos garante uma base de dados sólida e pronta para as próximas etapas da análise e modelagem.
+""")
+
+
+import streamlit as st
+import pandas as pd
+
+# Carregar os dados
+df = carregar_dados()
+
+# Verificar tipos de dados
+st.write("### Tipos de Dados Antes da Conversão")
+st.write(df.dtypes)
+
+# Se necessário, ajustar tipos de dados
+# Exemplo: Converter coluna 'data_ref' para formato de data (já lida como datetime pelo carregador)
+df['data_ref'] = pd.to_datetime(df['data_ref'])
+
+# Verificar se todas as colunas estão no formato correto
+st.write("### Tipos de Dados Após a Conversão")
+st.write(df.dtypes)
+import streamlit as st
+import pandas as pd
+
+# Carregar os dados
+df = carregar_dados()
+
+# Verificar tipos de dados antes da conversão
+st.write("### Tipos de Dados Antes da Conversão")
+st.write(df.dtypes)
+
+# Ajustar tipos de dados, convertendo 'data_ref' para formato de data
+df['data_ref'] = pd.to_datetime(df['data_ref'])
+
+# Verificar tipos de dados após a conversão
+st.write("### Tipos de Dados Após a Conversão")
+st.write(df.dtypes)
+
+# Explicação da conversão e importância dos tipos de dados
+st.markdown("""
+Durante a análise dos dados, foi necessário ajustar alguns tipos de variáveis para melhorar o tratamento da informação. 
+Inicialmente, a variável **data_ref** estava no formato `object`, o que não permitia uma manipulação eficiente das datas. 
+Após a conversão para o formato `datetime`, conseguimos explorar melhor o comportamento temporal dos dados.
+
+As outras variáveis mantiveram seus tipos apropriados, como variáveis numéricas (`int64` e `float64`) e categóricas (`object`), 
+além das variáveis booleanas (`bool`) para **posse_de_veiculo** e **posse_de_imovel**. 
+
+Essas alterações foram essenciais para garantir uma análise mais robusta e precisa.
+""")
+import streamlit as st
+
+# Display the Markdown text in Streamlit
+st.markdown("# Construção de Novas Variáveis")
+st.write(
+    """
+    Fiz a construção de novas variáveis, pois pode melhorar a performance de modelos preditivos 
+    e fornecer insights mais profundos.
+    """
+)
+import streamlit as st
+import pandas as pd
+from features import CodificadorDummies, TransformadorRenda
+from agregados import carregar_agregados
+from dados import versao_dados
+from graficos import exibir_grafico
+
+diagnostico.marco("Agregados e faixa etária")
+
+# Agregados (contagens, médias, quartis e correlação) calculados uma vez por versão dos dados
+agregados = carregar_agregados()
+
+# Contar a quantidade de pessoas em cada faixa etária (0-18, 19-30, 31-45, 46-60, 61+)
+faixa_etaria_counts = agregados['contagem_faixa_etaria']
+
+# Exibir um gráfico de barras da distribuição de faixa etária
+st.subheader("Distribuição de Faixa Etária")
+
+
+def desenhar_faixa_etaria(fig):
+    ax = fig.subplots()
+    faixa_etaria_counts.plot(kind='bar', ax=ax)
+    ax.set_xlabel("Faixa Etária")
+    ax.set_ylabel("Quantidade")
+    ax.set_title("Distribuição de Faixa Etária entre os Participantes")
+
+
+# Renderizado uma vez por versão dos dados; as próximas execuções servem a imagem do cache
+exibir_grafico('faixa_etaria', versao_dados(), desenhar_faixa_etaria)
+st.write("""
+### Análise da Distribuição de Faixa Etária
+
+O gráfico acima mostra a distribuição dos participantes em diferentes faixas etárias. Observamos que a maioria dos indivíduos se concentra nas faixas de **31-45 anos** e **46-60 anos**, sugerindo que uma grande parte da população analisada está em idade produtiva. As faixas **0-18 anos** e **61+ anos** representam uma menor proporção dos dados, indicando que as extremidades etárias são menos representadas neste conjunto. Essa distribuição pode ter implicações para a análise de renda e de perfil demográfico da população.
+""")
+
+import streamlit as st
+import pandas as pd
+
+# Exemplo de dados
+data = {
+    'renda': [50000, 70000, 55000, 48000, 60000],
+    'tempo_emprego': [5, 10, 0, 8, 12]
+}
+df = pd.DataFrame(data)
+
+# Criar uma nova variável que capture a relação entre renda e tempo de emprego
+df['renda_por_ano_emprego'] = TransformadorRenda(colunas_dummies=()).fit_transform(df)['renda_por_ano_emprego']
+
+# Título do aplicativo
+st.title("Análise de Renda por Tempo de Emprego")
+
+# Mostrar tabela de dados com a nova variável
+st.write("Tabela de Dados com Renda, Tempo de Emprego e Renda por Ano de Emprego:")
+st.dataframe(df[['renda', 'tempo_emprego', 'renda_por_ano_emprego']])
+import streamlit as st
+
+
+st.write(
+    """
+    A variável **renda por ano emprego** foi criada para avaliar a eficiência salarial de cada indivíduo, ou seja, 
+    quanto de renda a pessoa gera para cada ano de trabalho. Essa métrica permite uma comparação mais justa entre 
+    pessoas com diferentes tempos de emprego, facilitando a análise de como o tempo de trabalho impacta a renda.
+
+    O resultado desta variável nos mostra, por exemplo, que pessoas com menor tempo de emprego podem ter uma renda maior por ano trabalhado, 
+    enquanto aqueles com mais tempo de emprego tendem a ter uma distribuição de renda mais estável ou até menos expressiva. 
+    Isso pode indicar que o tempo de emprego não é o único fator determinante da renda, e outros aspectos, como o tipo de emprego ou setor, 
+    também devem ser considerados.
+    """
+)
+
+import streamlit as st
+import pandas as pd
+
+# Exemplo de dados para simulação
+data = {
+    'qt_pessoas_residencia': [4, 3, 5, 2, 6],
+    'posse_de_imovel': [1, 0, 1, 1, 0]  # 1 = possui imóvel, 0 = não possui imóvel
+}
+df = pd.DataFrame(data)
+
+# Criar uma nova variável 'pessoas_por_imovel'
+df['pessoas_por_imovel'] = TransformadorRenda(colunas_dummies=()).fit_transform(df)['pessoas_por_imovel']
+
+# Título e descrição
+st.markdown("## Cálculo da variável 'pessoas_por_imovel'")
+st.write(
+    """
+    A variável **pessoas_por_imovel** foi criada para calcular a média de pessoas por imóvel,
+    considerando se o indivíduo possui ou não um imóvel. O cálculo divide o número de pessoas 
+    na residência pelo indicador de posse de imóvel (com +1 para evitar divisão por zero).
+    """
+)
+
+# Exibir o DataFrame no Streamlit
+st.write(df[['qt_pessoas_residencia', 'posse_de_imovel', 'pessoas_por_imovel']].head())
+import streamlit as st
+
+# Display the text in Streamlit
+st.markdown(
+    """
+    A variável **pessoas por imovel** foi criada para calcular a quantidade média de pessoas por imóvel, 
+    dividindo o número de pessoas na residência pela posse do imóvel (quando o valor é "True"). 
+    Se a pessoa não possui um imóvel, o valor permanece igual ao número de pessoas na residência.
+
+    Essa variável ajuda a entender melhor a densidade de ocupação dos imóveis entre as pessoas que 
+    possuem e não possuem um imóvel. No exemplo exibido, quando a posse do imóvel é "True", 
+    a variável mostra a média exata de pessoas no imóvel, e quando é "False", o valor é ajustado. 
+    Isso pode ser útil para avaliar se existe uma relação entre posse de imóvel e o número de pessoas por 
+    residência, o que pode fornecer insights sobre hábitos de moradia ou condições socioeconômicas.
+    """
+)
+import streamlit as st
+
+diagnostico.marco("Variáveis dummies")
+
+# Display the title for the section
+st.subheader("Criar variáveis dummies para as colunas categóricas")
+
+import streamlit as st
+import pandas as pd
+
+# Sample data (replace with your actual data)
+data = {
+    'sexo': ['M', 'F', 'M', 'F', 'M'],
+    'tipo_renda': ['Empregado', 'Desempregado', 'Autônomo', 'Empregado', 'Estudante'],
+    'educacao': ['Ensino Médio', 'Ensino Superior', 'Ensino Médio', 'Ensino Fundamental', 'Ensino Superior'],
+    'estado_civil': ['Solteiro', 'Casado', 'Divorciado', 'Solteiro', 'Viúvo']
+}
+
+# Create a DataFrame
+df = pd.DataFrame(data)
+
+# Create dummy variables (vocabulário aprendido no fit, colunas estáveis entre lotes, matriz esparsa)
+codificador_dummies = CodificadorDummies(colunas=['sexo', 'tipo_renda', 'educacao', 'estado_civil'])
+matriz_dummies = codificador_dummies.fit_transform(df)
+df_dummies = pd.DataFrame(matriz_dummies[:5].toarray(), columns=codificador_dummies.get_feature_names_out())
+
+# Display the first few rows of the dummy DataFrame in Streamlit
+st.write("DataFrame with Dummy Variables:")
+st.dataframe(df_dummies.head())
+import streamlit as st
+
+# Display the explanatory text
+st.write("""
+A criação de variáveis dummies é essencial para transformar variáveis categóricas em binárias, tornando-as utilizáveis por modelos de machine learning que requerem dados numéricos. 
+
+Por exemplo, variáveis como "tipo de renda" e "educação" foram convertidas em novas colunas binárias (0 ou 1), capturando categorias específicas de forma compatível com os algoritmos. Isso preserva as informações categóricas, permitindo que os modelos compreendam as relações entre essas categorias e variáveis como "renda", sem erros de interpretação ordinal.
+""")
+
+import streamlit as st
+import pandas as pd
+
+# Example data (replace this with your actual data)
+data = {
+    'renda': [1500, 3000, 7000, 12000, 50000]
+}
+df = pd.DataFrame(data)
+
+# Categorize income into groups (Muito Baixa até 2.000, ..., Muito Alta até 100.000)
+df['grupo_renda'] = TransformadorRenda(colunas_dummies=()).fit_transform(df)['grupo_renda']
+
+# Display the first rows in Streamlit
+st.write("### Categorias de Renda")
+st.write(df[['renda', 'grupo_renda']].head())
+import streamlit as st
+
+# Display the explanation text
+st.write("""
+
+
+A categorização da variável **renda** em grupos foi realizada para facilitar a análise e interpretação dos dados. Ao dividir a renda em faixas (Muito Baixa, Baixa, Média, Alta), conseguimos identificar padrões e comportamentos relacionados aos diferentes níveis de renda. Essa abordagem é útil, por exemplo, para analisar a distribuição de características sociodemográficas ou outros fatores com base nos diferentes grupos de renda.
+
+No exemplo acima, vemos que indivíduos com renda em torno de 8.060 estão classificados no grupo "Média", enquanto aqueles com renda abaixo de 2.000 estão no grupo "Muito Baixa". Essa categorização simplifica a análise e permite uma visão mais clara da distribuição de renda entre os participantes.
+""")
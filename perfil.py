@@ -0,0 +1,56 @@
+import os
+import threading
+
+from dados import CAMINHO_DADOS, carregar_dados, versao_dados
+
+# Diretório onde os relatórios HTML ficam gravados, um por versão dos dados e modo
+DIRETORIO_PERFIL = os.path.join('cache', 'perfil')
+
+# Acima deste número de linhas o relatório é gerado no modo mínimo do ydata-profiling
+LIMITE_COMPLETO = 50_000
+# Acima deste número de linhas o relatório é gerado sobre uma amostra aleatória
+TAMANHO_AMOSTRA = 100_000
+
+_trava = threading.Lock()
+
+
+def modo_relatorio(linhas, limite_completo=LIMITE_COMPLETO, tamanho_amostra=TAMANHO_AMOSTRA):
+    """Escolhe (minimal, linhas da amostra ou None) conforme o tamanho do dataset."""
+    minimal = linhas > limite_completo
+    amostra = tamanho_amostra if linhas > tamanho_amostra else None
+    return minimal, amostra
+
+
+def gerar_relatorio_html(df, minimal=False, amostra=None, titulo="Análise de Renda"):
+    """Gera o HTML do ProfileReport, opcionalmente no modo mínimo e sobre uma amostra."""
+    # Import tardio: o ydata-profiling demora alguns segundos para importar
+    from ydata_profiling import ProfileReport
+
+    if amostra is not None and len(df) > amostra:
+        df = df.sample(n=amostra, random_state=42)
+    return ProfileReport(df, title=titulo, minimal=minimal, progress_bar=False).to_html()
+
+
+def relatorio_html(caminho_dados=CAMINHO_DADOS, diretorio=DIRETORIO_PERFIL,
+                   limite_completo=LIMITE_COMPLETO, tamanho_amostra=TAMANHO_AMOSTRA):
+    """
+    Retorna o HTML do relatório de perfil da versão atual dos dados. O relatório só
+    é gerado de novo quando o conteúdo do arquivo de dados muda.
+    """
+    versao = versao_dados(caminho_dados)
+    df = carregar_dados(caminho_dados)
+    minimal, amostra = modo_relatorio(len(df), limite_completo, tamanho_amostra)
+    sufixo = ('minimal' if minimal else 'completo') + (f'-amostra{amostra}' if amostra else '')
+    arquivo = os.path.join(diretorio, f"{versao}-{sufixo}.html")
+
+    with _trava:
+        if not os.path.exists(arquivo):
+            html = gerar_relatorio_html(df, minimal=minimal, amostra=amostra)
+            os.makedirs(diretorio, exist_ok=True)
+            temporario = f"{arquivo}.tmp"
+            with open(temporario, 'w', encoding='utf-8') as saida:
+                saida.write(html)
+            os.replace(temporario, arquivo)
+            return html
+    with open(arquivo, encoding='utf-8') as entrada:
+        return entrada.read()
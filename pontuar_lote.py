@@ -0,0 +1,174 @@
+import argparse
+import os
+import resource
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from dados import COLUNAS_DATA, ler_csv
+from inferencia import CachePrevisoes
+from modelo import CAMINHO_MODELO, carregar_modelo, preparar_features
+
+# Colunas copiadas da entrada para a saída, quando existirem, para identificar cada linha
+COLUNAS_ID = ['id_cliente', 'data_ref']
+TAMANHO_LOTE = 100_000
+
+
+# Colunas de entrada necessárias ao preparo: cada grupo é atendido por qualquer uma das alternativas
+# (a variável derivada pronta ou as colunas de onde ela é calculada)
+COLUNAS_NECESSARIAS = [
+    ('tempo_emprego',),
+    ('qt_pessoas_residencia',),
+    ('renda_por_ano_emprego', 'renda'),
+    ('pessoas_por_imovel', 'posse_de_imovel'),
+]
+
+
+def colunas_entrada(caminho):
+    """Nomes das colunas do arquivo de entrada, lidos só do cabeçalho (CSV) ou do esquema (Parquet)."""
+    if caminho.endswith('.parquet'):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(caminho).schema_arrow.names
+    return list(pd.read_csv(caminho, nrows=0).columns)
+
+
+def validar_colunas(colunas):
+    """Levanta ValueError listando os grupos de colunas necessárias que faltam na entrada."""
+    faltando = [' ou '.join(repr(c) for c in grupo) for grupo in COLUNAS_NECESSARIAS
+                if not any(coluna in colunas for coluna in grupo)]
+    if faltando:
+        raise ValueError(f"colunas obrigatórias ausentes na entrada: {', '.join(faltando)}")
+
+
+def ler_em_lotes(caminho, tamanho_lote=TAMANHO_LOTE):
+    """
+    Itera sobre o arquivo de entrada (CSV ou Parquet) em DataFrames de até `tamanho_lote` linhas.
+    O CSV é lido com os tipos explícitos do dataset (`dados.ler_csv`).
+    """
+    if caminho.endswith('.parquet'):
+        import pyarrow.parquet as pq
+
+        for lote in pq.ParquetFile(caminho).iter_batches(batch_size=tamanho_lote):
+            yield lote.to_pandas()
+    else:
+        datas = [coluna for coluna in COLUNAS_DATA if coluna in colunas_entrada(caminho)]
+        yield from ler_csv(caminho, parse_dates=datas, chunksize=tamanho_lote)
+
+
+class EscritorSaida:
+    """Grava os resultados de cada lote assim que são calculados (CSV ou Parquet)."""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._parquet = caminho.endswith('.parquet')
+        self._escritor = None
+        self._primeiro = True
+
+    def escrever(self, df):
+        if self._parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            tabela = pa.Table.from_pandas(df, preserve_index=False)
+            if self._escritor is None:
+                self._escritor = pq.ParquetWriter(self.caminho, tabela.schema)
+            self._escritor.write_table(tabela)
+        else:
+            df.to_csv(self.caminho, mode='w' if self._primeiro else 'a', header=self._primeiro, index=False)
+        self._primeiro = False
+
+    def fechar(self):
+        if self._escritor is not None:
+            self._escritor.close()
+
+
+def _prever(modelo, X):
+    if hasattr(modelo, 'coef_'):
+        return X @ modelo.coef_ + modelo.intercept_
+    return modelo.predict(X)
+
+
+def pontuar_lote(df, artefato, cache=None):
+    """
+    Aplica o mesmo preparo do treino e prevê a renda de um lote com uma única
+    multiplicação matricial. Com `cache` (CachePrevisoes), clientes cujo vetor de
+    variáveis já foi pontuado pela mesma versão do modelo (ex.: o mesmo cliente em
+    meses seguintes) não são recalculados.
+    """
+    X = preparar_features(df, artefato['transformador']).to_numpy(dtype=np.float64)
+    modelo = artefato['modelo']
+    if cache is None:
+        previsao = _prever(modelo, X)
+    else:
+        previsao = cache.prever(artefato['versao'], X, lambda matriz: _prever(modelo, matriz))
+    saida = df[[coluna for coluna in COLUNAS_ID if coluna in df.columns]].copy()
+    saida['renda_prevista'] = previsao
+    return saida
+
+
+def pico_memoria_mb():
+    # ru_maxrss é em KB no Linux e em bytes no macOS
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+
+def pontuar_arquivo(entrada, saida, caminho_modelo=CAMINHO_MODELO, tamanho_lote=TAMANHO_LOTE, capacidade_cache=0):
+    """
+    Pontua `entrada` lote a lote e grava em `saida`. Com `capacidade_cache` > 0,
+    usa um cache LRU de previsões com essa capacidade. Retorna o resumo da execução.
+    Levanta ValueError antes de ler os dados se faltar alguma coluna necessária.
+    """
+    validar_colunas(colunas_entrada(entrada))
+    artefato = carregar_modelo(caminho_modelo)
+    cache = CachePrevisoes(capacidade_cache) if capacidade_cache > 0 else None
+    escritor = EscritorSaida(saida)
+    linhas = 0
+    inicio = time.perf_counter()
+    try:
+        for lote in ler_em_lotes(entrada, tamanho_lote):
+            escritor.escrever(pontuar_lote(lote, artefato, cache))
+            linhas += len(lote)
+    finally:
+        escritor.fechar()
+    duracao = time.perf_counter() - inicio
+    return {
+        'linhas': linhas,
+        'segundos': duracao,
+        'linhas_por_segundo': linhas / duracao if duracao else float('inf'),
+        'pico_memoria_mb': pico_memoria_mb(),
+        'versao_modelo': artefato['versao'],
+        'cache': None if cache is None else cache.estatisticas(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pontua um arquivo de clientes com o modelo de renda treinado.")
+    parser.add_argument('entrada', help="arquivo .csv ou .parquet com os clientes")
+    parser.add_argument('saida', help="arquivo .csv ou .parquet de saída")
+    parser.add_argument('--modelo', default=CAMINHO_MODELO, help="artefato gerado por `python modelo.py`")
+    parser.add_argument('--tamanho-lote', type=int, default=TAMANHO_LOTE, help="linhas por lote")
+    parser.add_argument('--cache-previsoes', type=int, default=0,
+                        help="capacidade do cache LRU de previsões (0 desliga)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.modelo):
+        parser.error(f"artefato {args.modelo} não encontrado; rode `python modelo.py` antes")
+    try:
+        resumo = pontuar_arquivo(args.entrada, args.saida, args.modelo, args.tamanho_lote, args.cache_previsoes)
+    except ValueError as erro:
+        parser.error(str(erro))
+    print(
+        f"{resumo['linhas']} linhas pontuadas em {resumo['segundos']:.2f}s "
+        f"({resumo['linhas_por_segundo']:,.0f} linhas/s), pico de memória {resumo['pico_memoria_mb']:.1f} MB, "
+        f"modelo {resumo['versao_modelo']}"
+    )
+    if resumo['cache'] is not None:
+        print(f"cache de previsões: {resumo['cache']['taxa_acerto']:.1%} de acertos, "
+              f"{resumo['cache']['itens']} itens, {resumo['cache']['descartes']} descartes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+import argparse
+import io
+
+import numpy as np
+import pandas as pd
+
+from dados import CAMINHO_DADOS, ler_csv
+from pontuar_lote import EscritorSaida
+
+TAMANHO_LOTE = 100_000
+# Centroides mantidos por coluna no esboço de quantis (memória constante por coluna)
+MAX_CENTROIDES = 4096
+
+
+class EsbocoQuantis:
+    """
+    Esboço de quantis em memória limitada: guarda pares (valor, peso). Enquanto
+    houver até `max_centroides` valores distintos os quantis são exatos; acima
+    disso, centroides vizinhos são fundidos em grupos de peso parecido (como um
+    t-digest simplificado), com erro de posição da ordem de 1/max_centroides.
+    """
+
+    def __init__(self, max_centroides=MAX_CENTROIDES):
+        self.max_centroides = max_centroides
+        self.valores = np.empty(0, dtype=np.float64)
+        self.pesos = np.empty(0, dtype=np.float64)
+        self.exato = True
+
+    def atualizar(self, valores):
+        valores = np.asarray(valores, dtype=np.float64)
+        valores = valores[~np.isnan(valores)]
+        if not len(valores):
+            return
+        unicos, contagens = np.unique(valores, return_counts=True)
+        valores = np.concatenate([self.valores, unicos])
+        pesos = np.concatenate([self.pesos, contagens.astype(np.float64)])
+        # Soma os pesos de valores repetidos entre lotes
+        self.valores, inverso = np.unique(valores, return_inverse=True)
+        self.pesos = np.bincount(inverso, weights=pesos)
+        if len(self.valores) > self.max_centroides:
+            self._comprimir()
+
+    def _comprimir(self):
+        acumulado = np.cumsum(self.pesos)
+        grupos = self.max_centroides // 2
+        grupo = np.minimum(((acumulado - self.pesos / 2) / acumulado[-1] * grupos).astype(np.int64), grupos - 1)
+        pesos = np.bincount(grupo, weights=self.pesos)
+        somas = np.bincount(grupo, weights=self.valores * self.pesos)
+        usados = pesos > 0
+        self.pesos = pesos[usados]
+        self.valores = somas[usados] / self.pesos
+        self.exato = False
+
+    @property
+    def total(self):
+        return float(self.pesos.sum())
+
+    def quantil(self, q):
+        """
+        Quantil com interpolação linear entre posições: igual ao pandas enquanto
+        o esboço é exato; depois da compressão, interpola entre os centros dos centroides.
+        """
+        if not len(self.valores):
+            return np.nan
+        acumulado = np.cumsum(self.pesos)
+        if not self.exato:
+            centros = acumulado - self.pesos / 2
+            return float(np.interp(q * acumulado[-1], centros, self.valores))
+        posicao = q * (acumulado[-1] - 1)
+        inferior = np.searchsorted(acumulado, np.floor(posicao) + 1)
+        superior = np.searchsorted(acumulado, np.ceil(posicao) + 1)
+        fracao = posicao - np.floor(posicao)
+        return float(self.valores[inferior] * (1 - fracao) + self.valores[superior] * fracao)
+
+    def mediana(self):
+        return self.quantil(0.5)
+
+
+class ConjuntoImpressoes:
+    """
+    Conjunto de impressões digitais (hash de 64 bits por linha) guardado em blocos
+    ordenados de tamanhos decrescentes. As impressões novas de cada lote viram um
+    bloco; um bloco é fundido ao anterior só quando os dois têm tamanho parecido, de
+    modo que cada impressão é copiada O(log n) vezes no total (em vez de o conjunto
+    inteiro ser reordenado a cada lote) e uma consulta percorre O(log n) blocos.
+
+    A memória não é limitada pelo tamanho do lote: cresce com o número de linhas
+    distintas do arquivo (8 bytes por linha única).
+    """
+
+    def __init__(self):
+        self._blocos = []
+
+    def __len__(self):
+        return sum(len(bloco) for bloco in self._blocos)
+
+    def marcar_duplicadas(self, impressoes):
+        """Retorna a máscara das linhas já vistas (no próprio lote ou antes) e registra as novas."""
+        impressoes = np.asarray(impressoes, dtype=np.uint64)
+        _, primeiras = np.unique(impressoes, return_index=True)
+        duplicadas = np.ones(len(impressoes), dtype=bool)
+        duplicadas[primeiras] = False
+        for bloco in self._blocos:
+            posicao = np.searchsorted(bloco, impressoes)
+            posicao[posicao == len(bloco)] = 0
+            duplicadas |= bloco[posicao] == impressoes
+        novas = impressoes[~duplicadas]
+        if len(novas):
+            self._blocos.append(np.sort(novas))
+            # Funde enquanto o bloco anterior não for mais que o dobro do último (como um contador binário)
+            while len(self._blocos) > 1 and len(self._blocos[-2]) <= 2 * len(self._blocos[-1]):
+                ultimo = self._blocos.pop()
+                self._blocos[-1] = np.sort(np.concatenate([self._blocos[-1], ultimo]), kind='stable')
+        return duplicadas
+
+
+def _lotes(caminho, tamanho_lote):
+    # Datas convertidas lote a lote pelo próprio leitor tipado
+    return ler_csv(caminho, chunksize=tamanho_lote)
+
+
+def preparar_em_lotes(entrada=CAMINHO_DADOS, saida=None, tamanho_lote=TAMANHO_LOTE, max_centroides=MAX_CENTROIDES):
+    """
+    Preparação dos dados sem carregar o arquivo inteiro: conta nulos, calcula a
+    mediana das colunas numéricas por esboço de quantis (1ª passada), preenche
+    os nulos, remove duplicadas por impressão digital das linhas e grava o
+    resultado lote a lote em `saida` (CSV ou Parquet; 2ª passada).
+    Retorna o relatório com os mesmos números da seção de limpeza do app.
+    """
+    nulos = None
+    esbocos = {}
+    linhas = 0
+    for lote in _lotes(entrada, tamanho_lote):
+        nulos = lote.isna().sum() if nulos is None else nulos + lote.isna().sum()
+        for coluna in lote.select_dtypes(include='number').columns:
+            esbocos.setdefault(coluna, EsbocoQuantis(max_centroides)).atualizar(lote[coluna].to_numpy())
+        linhas += len(lote)
+    medianas = {coluna: esboco.mediana() for coluna, esboco in esbocos.items()}
+
+    impressoes = ConjuntoImpressoes()
+    escritor = EscritorSaida(saida) if saida is not None else None
+    duplicadas = 0
+    nao_nulos = None
+    tipos = None
+    try:
+        for lote in _lotes(entrada, tamanho_lote):
+            lote = lote.fillna({coluna: medianas[coluna] for coluna in medianas if lote[coluna].isna().any()})
+            mascara = impressoes.marcar_duplicadas(pd.util.hash_pandas_object(lote, index=False).to_numpy())
+            duplicadas += int(mascara.sum())
+            lote = lote[~mascara]
+            contagem = lote.notna().sum()
+            nao_nulos = contagem if nao_nulos is None else nao_nulos + contagem
+            tipos = lote.dtypes
+            if escritor is not None:
+                escritor.escrever(lote)
+    finally:
+        if escritor is not None:
+            escritor.fechar()
+
+    return {
+        'linhas': linhas,
+        'nulos': nulos,
+        'medianas': medianas,
+        'duplicadas': duplicadas,
+        'linhas_apos_limpeza': linhas - duplicadas,
+        'nao_nulos_apos_limpeza': nao_nulos,
+        'tipos': tipos,
+    }
+
+
+def texto_estrutura(relatorio):
+    """Resumo no formato do `df.info()` exibido em "Estrutura dos Dados Após a Limpeza"."""
+    buffer = io.StringIO()
+    total = relatorio['linhas_apos_limpeza']
+    buffer.write(f"{total} entries\n")
+    buffer.write(f"Data columns (total {len(relatorio['tipos'])} columns):\n")
+    buffer.write(f" #   {'Column':<22} {'Non-Null Count':<16} Dtype\n")
+    for i, (coluna, tipo) in enumerate(relatorio['tipos'].items()):
+        buffer.write(f" {i:<3} {coluna:<22} {relatorio['nao_nulos_apos_limpeza'][coluna]} non-null  {tipo}\n")
+    contagem_tipos = relatorio['tipos'].astype(str).value_counts()
+    buffer.write("dtypes: " + ", ".join(f"{tipo}({n})" for tipo, n in sorted(contagem_tipos.items())) + "\n")
+    return buffer.getvalue()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Limpeza dos dados em lotes, com memória limitada.")
+    parser.add_argument('entrada', nargs='?', default=CAMINHO_DADOS, help="CSV de entrada")
+    parser.add_argument('saida', nargs='?', help="arquivo .csv ou .parquet limpo (opcional)")
+    parser.add_argument('--tamanho-lote', type=int, default=TAMANHO_LOTE)
+    args = parser.parse_args(argv)
+
+    relatorio = preparar_em_lotes(args.entrada, args.saida, args.tamanho_lote)
+    print("### Valores Nulos em Cada Coluna")
+    print(relatorio['nulos'].to_string())
+    print("\n### Número de Linhas Duplicadas")
+    print(f"Número de linhas duplicadas: {relatorio['duplicadas']}")
+    print("\n### Estrutura dos Dados Após a Limpeza")
+    print(texto_estrutura(relatorio))
+    print("Medianas usadas no preenchimento: " + ", ".join(
+        f"{coluna}={mediana:g}" for coluna, mediana in relatorio['medianas'].items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+import argparse
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from inferencia import (CAPACIDADE_CACHE_PREVISOES, ESPERA_MAXIMA_S, TAMANHO_MAXIMO_LOTE, CachePrevisoes,
+                        ModeloLinearCompacto, MotorMicroLote)
+from modelo import CAMINHO_MODELO, carregar_modelo
+
+# Quantidade de latências recentes usadas no cálculo de p50/p99
+JANELA_LATENCIAS = 10_000
+# Intervalo mínimo entre as verificações de um novo artefato gravado por um treino
+INTERVALO_RECARGA_S = 1.0
+
+
+class Metricas:
+    """Contadores e latências recentes do serviço, compartilhados entre as threads."""
+
+    def __init__(self, janela=JANELA_LATENCIAS):
+        self._trava = threading.Lock()
+        self._latencias = deque(maxlen=janela)
+        self.requisicoes = 0
+        self.previsoes = 0
+        self.erros = 0
+
+    def registrar(self, segundos, previsoes):
+        with self._trava:
+            self._latencias.append(segundos)
+            self.requisicoes += 1
+            self.previsoes += previsoes
+
+    def registrar_erro(self):
+        with self._trava:
+            self.erros += 1
+
+    def resumo(self):
+        with self._trava:
+            latencias = np.array(self._latencias)
+            resumo = {'requisicoes': self.requisicoes, 'previsoes': self.previsoes, 'erros': self.erros}
+        if len(latencias):
+            p50, p99 = np.percentile(latencias, [50, 99]) * 1000
+            resumo.update(latencia_p50_ms=float(p50), latencia_p99_ms=float(p99))
+        return resumo
+
+
+def registros_da_requisicao(corpo):
+    """
+    Aceita um cliente (objeto JSON), uma lista de clientes ou {"instancias": [...]}.
+    Cada cliente traz as quatro variáveis do formulário ou os atributos brutos
+    ('tempo_emprego', 'qt_pessoas_residencia', 'posse_de_imovel' e 'renda').
+    Retorna (registros, veio_em_lote); levanta ValueError se algum cliente não for um objeto.
+    """
+    if isinstance(corpo, dict) and 'instancias' in corpo:
+        registros, em_lote = corpo['instancias'], True
+    elif isinstance(corpo, list):
+        registros, em_lote = corpo, True
+    elif isinstance(corpo, dict):
+        registros, em_lote = [corpo], False
+    else:
+        raise ValueError("o corpo deve ser um objeto JSON ou uma lista de objetos")
+    if not isinstance(registros, list):
+        raise ValueError("'instancias' deve ser uma lista de objetos")
+    for posicao, registro in enumerate(registros):
+        if not isinstance(registro, dict):
+            raise ValueError(f"o cliente {posicao} deve ser um objeto JSON, recebido {type(registro).__name__}")
+    return registros, em_lote
+
+
+class ServicoPredicao(ThreadingHTTPServer):
+    """
+    Servidor HTTP com o artefato carregado na inicialização e recarregado quando
+    um novo treino substitui o arquivo (verificado no máximo a cada
+    `intervalo_recarga_s`). Requisições com um único cliente passam pelo motor de
+    micro-lotes (desligado com `espera_maxima_s=0`); requisições em lote são
+    pontuadas diretamente. Os dois caminhos consultam antes o cache de previsões
+    (desligado com `capacidade_cache=0`), chaveado pela versão do modelo.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, endereco, caminho_modelo=CAMINHO_MODELO, tamanho_maximo_lote=TAMANHO_MAXIMO_LOTE,
+                 espera_maxima_s=ESPERA_MAXIMA_S, capacidade_cache=CAPACIDADE_CACHE_PREVISOES,
+                 intervalo_recarga_s=INTERVALO_RECARGA_S):
+        self.caminho_modelo = caminho_modelo
+        self.intervalo_recarga_s = intervalo_recarga_s
+        artefato = carregar_modelo(caminho_modelo)
+        # Artefato e modelo compacto trocados juntos, numa única atribuição
+        self._modelo = (artefato, ModeloLinearCompacto.do_artefato(artefato))
+        self._trava_modelo = threading.Lock()
+        self._proxima_verificacao = time.monotonic() + intervalo_recarga_s
+        self.recargas = 0
+        self.cache = CachePrevisoes(capacidade_cache) if capacidade_cache > 0 else None
+        self.motor = None
+        if espera_maxima_s > 0:
+            self.motor = MotorMicroLote(self.compacto, tamanho_maximo_lote, espera_maxima_s)
+        self.metricas = Metricas()
+        super().__init__(endereco, ManipuladorPredicao)
+
+    @property
+    def artefato(self):
+        return self._modelo[0]
+
+    @property
+    def compacto(self):
+        return self._modelo[1]
+
+    def modelo_atual(self):
+        """
+        (artefato, compacto) em uso. `carregar_modelo` relê o arquivo se ele foi
+        substituído; uma nova versão troca o modelo compacto (também no motor de
+        micro-lotes), e o cache, chaveado pela versão, é esvaziado na próxima consulta.
+        Se o arquivo novo não puder ser usado, o modelo anterior continua em uso.
+        """
+        agora = time.monotonic()
+        if agora < self._proxima_verificacao:
+            return self._modelo
+        with self._trava_modelo:
+            if agora >= self._proxima_verificacao:
+                self._proxima_verificacao = agora + self.intervalo_recarga_s
+                try:
+                    artefato = carregar_modelo(self.caminho_modelo)
+                    if artefato['versao'] != self.artefato['versao']:
+                        self._modelo = (artefato, ModeloLinearCompacto.do_artefato(artefato))
+                        if self.motor is not None:
+                            self.motor.compacto = self.compacto
+                        self.recargas += 1
+                except (OSError, ValueError, TypeError):
+                    # Arquivo no meio da troca, em formato antigo ou sem modelo linear
+                    pass
+            return self._modelo
+
+    def _calcular(self, compacto, registros, em_lote):
+        if em_lote or self.motor is None:
+            return compacto.prever_registros(registros).tolist()
+        return [self.motor.prever(registros[0])]
+
+    def _calcular_vetores(self, compacto, X, em_lote):
+        if em_lote or self.motor is None:
+            return compacto.prever_matriz(X)
+        return np.array([self.motor.prever_vetor(X[0])])
+
+    def prever(self, registros, em_lote):
+        """Devolve (versão do modelo usado, previsões)."""
+        artefato, compacto = self.modelo_atual()
+        if self.cache is None:
+            return artefato['versao'], self._calcular(compacto, registros, em_lote)
+        # Só os vetores ausentes do cache seguem para o cálculo (lote direto ou micro-lote)
+        previsoes = self.cache.prever(artefato['versao'], compacto.matriz(registros),
+                                      lambda faltando: self._calcular_vetores(compacto, faltando, em_lote))
+        return artefato['versao'], previsoes.tolist()
+
+    def server_close(self):
+        super().server_close()
+        if self.motor is not None:
+            self.motor.encerrar()
+
+
+class ManipuladorPredicao(BaseHTTPRequestHandler):
+    def _responder(self, status, conteudo):
+        corpo = json.dumps(conteudo).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def do_GET(self):
+        if self.path == '/saude':
+            self._responder(200, {'status': 'ok', 'versao_modelo': self.server.modelo_atual()[0]['versao']})
+        elif self.path == '/metricas':
+            resumo = {'versao_modelo': self.server.modelo_atual()[0]['versao'], 'recargas_modelo': self.server.recargas,
+                      **self.server.metricas.resumo()}
+            if self.server.motor is not None:
+                resumo.update(micro_lotes=self.server.motor.lotes, previsoes_micro_lote=self.server.motor.previsoes)
+            if self.server.cache is not None:
+                resumo['cache_previsoes'] = self.server.cache.estatisticas()
+            self._responder(200, resumo)
+        else:
+            self._responder(404, {'erro': f"rota desconhecida: {self.path}"})
+
+    def do_POST(self):
+        if self.path != '/prever':
+            self._responder(404, {'erro': f"rota desconhecida: {self.path}"})
+            return
+        inicio = time.perf_counter()
+        try:
+            tamanho = int(self.headers.get('Content-Length', 0))
+            registros, em_lote = registros_da_requisicao(json.loads(self.rfile.read(tamanho)))
+            versao, previsoes = self.server.prever(registros, em_lote)
+        except KeyError as erro:
+            self.server.metricas.registrar_erro()
+            self._responder(400, {'erro': f"campo obrigatório ausente: {erro}"})
+            return
+        except (ValueError, TypeError) as erro:
+            self.server.metricas.registrar_erro()
+            self._responder(400, {'erro': str(erro)})
+            return
+        except Exception as erro:
+            # Falha inesperada: o cliente ainda recebe uma resposta e o erro entra nas métricas
+            self.server.metricas.registrar_erro()
+            self._responder(500, {'erro': f"{type(erro).__name__}: {erro}"})
+            return
+        resposta = {'versao_modelo': versao}
+        if em_lote:
+            resposta['renda_prevista'] = previsoes
+        else:
+            resposta['renda_prevista'] = previsoes[0]
+        self.server.metricas.registrar(time.perf_counter() - inicio, len(previsoes))
+        self._responder(200, resposta)
+
+    def log_message(self, formato, *args):
+        # Sem log por requisição: as métricas agregadas ficam em /metricas
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serviço HTTP de previsão de renda.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8000)
+    parser.add_argument('--modelo', default=CAMINHO_MODELO, help="artefato gerado por `python modelo.py`")
+    parser.add_argument('--tamanho-lote', type=int, default=TAMANHO_MAXIMO_LOTE, help="tamanho máximo do micro-lote")
+    parser.add_argument('--espera-ms', type=float, default=ESPERA_MAXIMA_S * 1000,
+                        help="espera máxima para fechar um micro-lote (0 desliga o micro-lote)")
+    parser.add_argument('--cache-previsoes', type=int, default=CAPACIDADE_CACHE_PREVISOES,
+                        help="capacidade do cache LRU de previsões (0 desliga)")
+    parser.add_argument('--recarga-s', type=float, default=INTERVALO_RECARGA_S,
+                        help="intervalo mínimo entre verificações de um novo artefato (0: a cada requisição)")
+    args = parser.parse_args(argv)
+
+    servidor = ServicoPredicao((args.host, args.porta), args.modelo, args.tamanho_lote, args.espera_ms / 1000,
+                               args.cache_previsoes, args.recarga_s)
+    print(f"Servindo o modelo {servidor.artefato['versao']} em http://{args.host}:{args.porta}/prever")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from dados import CAMINHO_DADOS, versao_dados
+from modelo import CAMINHO_MODELO, ETAPAS_TREINO, carregar_modelo, treinar
+
+# Intervalo entre as atualizações do painel de progresso enquanto um treino roda
+INTERVALO_ATUALIZACAO_S = 1.0
+
+# Um trabalho por (artefato, versão dos dados) e o último trabalho de cada artefato,
+# compartilhados por todas as sessões do processo
+_trabalhos = {}
+_ultimos = {}
+_trava = threading.Lock()
+
+
+class TreinoCancelado(Exception):
+    """Interrompe o treino no próximo aviso de progresso depois de `TrabalhoTreino.cancelar`."""
+
+
+class TrabalhoTreino:
+    """
+    Um `modelo.treinar` rodando em uma thread de fundo. O treino informa o início de
+    cada etapa e cada fold concluído em `avancar`, que também é o ponto de
+    cancelamento: depois de `cancelar`, o próximo aviso levanta TreinoCancelado e o
+    treino termina sem gravar o artefato, de modo que o modelo anterior segue em uso.
+    """
+
+    def __init__(self, caminho_dados, caminho_modelo, versao_dados, opcoes=None):
+        self.caminho_dados = caminho_dados
+        self.caminho_modelo = caminho_modelo
+        self.versao_dados = versao_dados
+        self.opcoes = opcoes or {}
+        self.estado = 'executando'
+        self.etapa = None
+        self.concluidos = 0
+        self.total = 0
+        self.erro = None
+        self.versao_modelo = None
+        self.iniciado_em = datetime.now(timezone.utc)
+        self.duracao_s = None
+        self._inicio = time.perf_counter()
+        self._cancelar = threading.Event()
+        self._trava = threading.Lock()
+        self._thread = threading.Thread(target=self._executar, name=f'treino-{versao_dados[:8]}', daemon=True)
+
+    @property
+    def ativo(self):
+        return self.estado == 'executando'
+
+    def iniciar(self):
+        self._thread.start()
+        return self
+
+    def avancar(self, etapa, concluidos, total):
+        if self._cancelar.is_set():
+            raise TreinoCancelado()
+        with self._trava:
+            self.etapa, self.concluidos, self.total = etapa, concluidos, total
+
+    def cancelar(self):
+        """Pede o cancelamento; o treino para no próximo fold ou etapa."""
+        self._cancelar.set()
+
+    def aguardar(self, timeout=None):
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _executar(self):
+        try:
+            artefato = treinar(self.caminho_dados, self.caminho_modelo, progresso=self.avancar, **self.opcoes)
+        except TreinoCancelado:
+            self._terminar('cancelado')
+        except Exception as erro:
+            # A thread não tem para onde propagar: o erro fica registrado para a página
+            self._terminar('erro', erro=f"{type(erro).__name__}: {erro}")
+        else:
+            self._terminar('concluido', versao_modelo=artefato['versao'])
+
+    def _terminar(self, estado, erro=None, versao_modelo=None):
+        with self._trava:
+            self.estado, self.erro, self.versao_modelo = estado, erro, versao_modelo
+            self.duracao_s = time.perf_counter() - self._inicio
+
+    def resumo(self):
+        with self._trava:
+            etapas = list(ETAPAS_TREINO)
+            if self.estado == 'concluido':
+                fracao = 1.0
+            elif self.etapa is None:
+                fracao = 0.0
+            else:
+                fracao = (etapas.index(self.etapa) + (self.concluidos / self.total if self.total else 0)) / len(etapas)
+            return {
+                'estado': self.estado,
+                'etapa': self.etapa,
+                'descricao': ETAPAS_TREINO.get(self.etapa, "Iniciando"),
+                'concluidos': self.concluidos,
+                'total': self.total,
+                'fracao': fracao,
+                'erro': self.erro,
+                'versao_modelo': self.versao_modelo,
+                'versao_dados': self.versao_dados,
+                'iniciado_em': self.iniciado_em.isoformat(),
+                'duracao_s': time.perf_counter() - self._inicio if self.duracao_s is None else self.duracao_s,
+                'cancelamento_pedido': self._cancelar.is_set(),
+            }
+
+
+def iniciar_treino(caminho_dados=CAMINHO_DADOS, caminho_modelo=CAMINHO_MODELO, **opcoes):
+    """
+    Inicia `modelo.treinar` em segundo plano e devolve o trabalho. Se já houver um
+    treino em andamento do mesmo artefato com a mesma versão dos dados, devolve esse:
+    várias sessões pedindo o treino ao mesmo tempo compartilham um único trabalho.
+    `opcoes` segue para `treinar` (ex.: modo_busca, inicio, fim).
+    """
+    caminho_modelo = os.path.abspath(caminho_modelo)
+    chave = (caminho_modelo, versao_dados(caminho_dados))
+    with _trava:
+        trabalho = _trabalhos.get(chave)
+        if trabalho is None or not trabalho.ativo:
+            trabalho = TrabalhoTreino(caminho_dados, caminho_modelo, chave[1], opcoes).iniciar()
+            _trabalhos[chave] = trabalho
+            _ultimos[caminho_modelo] = trabalho
+        return trabalho
+
+
+def trabalho_atual(caminho_modelo=CAMINHO_MODELO):
+    """Último treino iniciado para o artefato (em andamento ou não), ou None."""
+    with _trava:
+        return _ultimos.get(os.path.abspath(caminho_modelo))
+
+
+def modelo_disponivel(caminho_modelo=CAMINHO_MODELO):
+    """Artefato válido já gravado, ou None se ele não existir ou estiver em um formato antigo."""
+    try:
+        return carregar_modelo(caminho_modelo)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def artefato_em_uso(caminho_dados=CAMINHO_DADOS, caminho_modelo=CAMINHO_MODELO):
+    """
+    Artefato que as páginas usam: o último gravado, mesmo com um novo treino em
+    andamento. Sem artefato válido, inicia o treino em segundo plano (uma única vez
+    por processo; depois de um cancelamento ou erro, só pelo botão da página) e
+    devolve None.
+    """
+    artefato = modelo_disponivel(caminho_modelo)
+    if artefato is None and trabalho_atual(caminho_modelo) is None:
+        iniciar_treino(caminho_dados, caminho_modelo)
+    return artefato
+
+
+def _acompanhar(trabalho, controles):
+    import streamlit as st
+
+    resumo = trabalho.resumo()
+    if not trabalho.ativo:
+        # Terminou: a página inteira roda de novo para carregar o novo artefato
+        st.rerun()
+    texto = f"Treinando um novo modelo: {resumo['descricao']}"
+    if resumo['total'] > 1:
+        texto += f" ({resumo['concluidos']}/{resumo['total']})"
+    if resumo['cancelamento_pedido']:
+        texto += " · cancelando no próximo fold..."
+    st.progress(resumo['fracao'], text=texto)
+    if controles and st.button("Cancelar treino", disabled=resumo['cancelamento_pedido']):
+        trabalho.cancelar()
+        st.rerun(scope='fragment')
+
+
+def painel_treino(caminho_dados=CAMINHO_DADOS, caminho_modelo=CAMINHO_MODELO, controles=True):
+    """
+    Estado do treino em segundo plano na página. Enquanto ele roda, a barra de
+    progresso (por etapa e fold) é atualizada a cada `INTERVALO_ATUALIZACAO_S` sem
+    rodar a página inteira; ao terminar, a página roda de novo com o novo artefato.
+    Com `controles`, mostra os botões de cancelar e de treinar novamente.
+    """
+    import streamlit as st
+
+    trabalho = trabalho_atual(caminho_modelo)
+    if trabalho is not None and trabalho.ativo:
+        st.fragment(_acompanhar, run_every=INTERVALO_ATUALIZACAO_S)(trabalho, controles)
+        return
+    if not controles:
+        return
+    if trabalho is not None:
+        resumo = trabalho.resumo()
+        if resumo['estado'] == 'concluido':
+            st.caption(f"Último treino: modelo {resumo['versao_modelo']} em {resumo['duracao_s']:.1f}s")
+        elif resumo['estado'] == 'cancelado':
+            st.warning("O último treino foi cancelado; o modelo anterior continua em uso.")
+        else:
+            st.error(f"O último treino falhou: {resumo['erro']}")
+    if st.button("Treinar novamente em segundo plano"):
+        iniciar_treino(caminho_dados, caminho_modelo)
+        st.rerun()
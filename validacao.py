@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+
+
+def folds_kfold(n, cv=5, embaralhar=False, semente=None):
+    """
+    Fold de teste de cada linha, materializado uma vez (mesma partição do KFold:
+    blocos consecutivos, os primeiros `n % cv` com uma linha a mais).
+    """
+    tamanhos = np.full(cv, n // cv, dtype=np.int64)
+    tamanhos[:n % cv] += 1
+    folds = np.repeat(np.arange(cv, dtype=np.intp), tamanhos)
+    if embaralhar:
+        folds = folds[np.random.default_rng(semente).permutation(n)]
+    return folds
+
+
+def metricas(y, previsoes):
+    """
+    MSE, MAE e R² de cada coluna de `previsoes` [n, modelos] contra `y`, calculados
+    juntos sobre a matriz de resíduos. Devolve um dict métrica -> array [modelos].
+    """
+    y = np.asarray(y, dtype=np.float64)
+    previsoes = np.asarray(previsoes, dtype=np.float64).reshape(len(y), -1)
+    residuos = previsoes - y[:, None]
+    sse = np.einsum('ij,ij->j', residuos, residuos)
+    # Soma de quadrados centrada na média: Σy² - (Σy)²/n perde os dígitos com rendas altas
+    sst = np.sum((y - y.mean()) ** 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r2 = 1 - sse / sst
+    return {'mse': sse / len(y), 'mae': np.abs(residuos).mean(axis=0), 'r2': r2}
+
+
+def _blocos(folds):
+    # Ordem que deixa cada fold contíguo e o início de cada bloco, para somar com um único reduceat
+    ordem = np.argsort(folds, kind='stable')
+    ids, inicios = np.unique(folds[ordem], return_index=True)
+    return ordem, ids, inicios
+
+
+def metricas_por_fold(y, previsoes, folds, nomes=None):
+    """
+    MSE, MAE e R² de todos os modelos em todos os folds de uma vez, a partir das
+    previsões fora do fold `previsoes` [n, modelos] (cada linha prevista pelo
+    modelo que não a viu no treino). As linhas são ordenadas uma vez para que cada
+    fold seja um bloco contíguo, pontuado por `metricas` com todos os modelos juntos.
+    Devolve uma tabela com uma linha por (modelo, fold).
+    """
+    y = np.asarray(y, dtype=np.float64)
+    previsoes = np.asarray(previsoes, dtype=np.float64).reshape(len(y), -1)
+    nomes = list(range(previsoes.shape[1])) if nomes is None else list(nomes)
+    ordem, ids, inicios = _blocos(np.asarray(folds))
+    if not np.array_equal(ordem, np.arange(len(ordem))):
+        y, previsoes = y[ordem], previsoes[ordem]
+
+    fins = np.append(inicios[1:], len(y))
+    por_fold = [metricas(y[inicio:fim], previsoes[inicio:fim]) for inicio, fim in zip(inicios, fins)]
+    # Uma linha por (modelo, fold), com os folds de cada modelo em sequência
+    return pd.DataFrame({
+        'modelo': np.repeat(np.array(nomes, dtype=object), len(ids)),
+        'fold': np.tile(ids, len(nomes)),
+        'linhas_teste': np.tile(fins - inicios, len(nomes)),
+        **{nome: np.stack([fold[nome] for fold in por_fold], axis=1).ravel() for nome in ('mse', 'mae', 'r2')},
+    })
+
+
+def prever_fora_do_fold(modelos, X, y, folds):
+    """
+    Previsões fora do fold [n, modelos] de cada estimador de `modelos` (nome ->
+    estimador). X e y viram arrays float64 contíguos uma vez; em cada fold os
+    modelos são ajustados nas mesmas linhas de treino e os lineares são previstos
+    juntos, com uma multiplicação pela matriz de coeficientes empilhados.
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    folds = np.asarray(folds)
+    previsoes = np.empty((len(y), len(modelos)))
+    for fold in np.unique(folds):
+        teste = folds == fold
+        X_treino, y_treino, X_teste = X[~teste], y[~teste], X[teste]
+        ajustados = [clone(estimador).fit(X_treino, y_treino) for estimador in modelos.values()]
+        lineares = [j for j, modelo in enumerate(ajustados) if hasattr(modelo, 'coef_') and np.ndim(modelo.coef_) == 1]
+        if lineares:
+            coeficientes = np.stack([ajustados[j].coef_ for j in lineares])
+            interceptos = np.array([ajustados[j].intercept_ for j in lineares], dtype=np.float64)
+            previsoes[np.ix_(teste, lineares)] = X_teste @ coeficientes.T + interceptos
+        for j, modelo in enumerate(ajustados):
+            if j not in lineares:
+                previsoes[teste, j] = modelo.predict(X_teste)
+    return previsoes
+
+
+def validar(modelos, X, y, cv=5, embaralhar=False, semente=None):
+    """Validação cruzada de todos os `modelos` (nome -> estimador): tabela por (modelo, fold)."""
+    folds = folds_kfold(len(y), cv, embaralhar, semente)
+    return metricas_por_fold(y, prever_fora_do_fold(modelos, X, y, folds), folds, nomes=modelos)
+